@@ -0,0 +1,89 @@
+"""Benchmarks for building and rendering tables.
+
+Run all of the benchmarks with `make benchmark`, or some of them by name:
+
+    python benchmarks/benchmarks.py render_body_pandas fmt_currency
+
+Each benchmark reports the best time of a few runs. great_tables is imported from the checkout
+that this script is in, unless another one is put on `PYTHONPATH`. So to compare two versions of
+great_tables (e.g., before and after a change), check out the other version with
+`git worktree add <path> <commit>`, and run
+
+    PYTHONPATH=<path> python benchmarks/benchmarks.py
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from typing import Callable, Dict
+
+# Import great_tables from the checkout that this script is in (any checkout on `PYTHONPATH`
+# comes earlier on the path, so it's used instead)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+REPEATS = 3
+
+
+def _time_best(fn: Callable[[], object], repeats: int = REPEATS) -> float:
+    times = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def _render_body(df) -> Callable[[], object]:
+    from great_tables import GT
+    from great_tables._utils_render_html import create_body_component_h
+
+    built = GT(df)._build_data(context="html")
+
+    return lambda: create_body_component_h(built)
+
+
+def render_body_pandas() -> Callable[[], object]:
+    """Render the body of the pizzaplace dataset (49,574 rows) to HTML, from a pandas DataFrame."""
+    from great_tables.data import pizzaplace
+
+    return _render_body(pizzaplace)
+
+
+def render_body_polars() -> Callable[[], object]:
+    """Render the body of the pizzaplace dataset (49,574 rows) to HTML, from a polars DataFrame."""
+    import polars as pl
+    from great_tables.data import pizzaplace
+
+    return _render_body(pl.from_pandas(pizzaplace))
+
+
+def fmt_currency() -> Callable[[], object]:
+    """Build a table with a 20,000 row column formatted with `fmt_currency(currency="EUR")`."""
+    import pandas as pd
+    from great_tables import GT
+
+    df = pd.DataFrame({"price": [x * 1.25 for x in range(20_000)]})
+
+    # a new table object for each run, so that the result of an earlier build isn't reused
+    return lambda: GT(df).fmt_currency(columns="price", currency="EUR")._build_data("html")
+
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {
+    "render_body_pandas": render_body_pandas,
+    "render_body_polars": render_body_polars,
+    "fmt_currency": fmt_currency,
+}
+
+
+def main(names: list[str]) -> None:
+    for name in names or list(BENCHMARKS):
+        fn = BENCHMARKS[name]()
+        print(f"{name:<24}{_time_best(fn):>10.3f}s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
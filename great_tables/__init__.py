@@ -1,24 +1,24 @@
-# Set version ----
-from importlib_metadata import version as _v
-
-__version__ = _v("great_tables")
-
-del _v
-
 # Main gt imports ----
 
-from .gt import GT
+from typing import TYPE_CHECKING
+
+from .gt import GT, shared_stylesheet
 from . import data
 from . import vals
 from . import loc
 from . import style
 from ._styles import FromColumn as from_column
 from ._helpers import letters, LETTERS, px, pct, md, html, random_id
-from .data import exibble
+
+if TYPE_CHECKING:
+    from .data import exibble
+
+    __version__: str
 
 
 __all__ = (
     "GT",
+    "shared_stylesheet",
     "exibble",
     "letters",
     "LETTERS",
@@ -35,7 +35,20 @@ __all__ = (
 
 
 def __getattr__(k: str):
-    # datasets are no longer exposed in this module.
+    # the version is looked up when it's first accessed, since reading the package metadata
+    # takes a while
+    if k == "__version__":
+        from importlib_metadata import version
+
+        v = globals()["__version__"] = version("great_tables")
+        return v
+
+    # exibble is the only dataset exposed in this module; it's read in from the data submodule
+    # when it's first accessed
+    if k == "exibble":
+        return data.exibble
+
+    # other datasets are no longer exposed in this module.
     # this function ensures that we raise a friendly error when people try to import them.
 
     dataset_names = [entry for entry in dir(data) if not entry.startswith("_")]
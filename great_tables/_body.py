@@ -16,4 +16,9 @@ def body_reassemble(body: Body, row_groups: RowGroups, stub_df: Stub, boxhead: B
     rows = [final for _, final in start_final]
 
     # TODO: once body is just a DataFrame, we can call reorder directly on it
-    return body.__class__(reorder(body.body, rows, cols))
+    new_body = body.__class__(reorder(body.body, rows, cols))
+
+    # Carry over the statistics from rendering the formats
+    new_body.format_stats = body.format_stats
+
+    return new_body
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import pandas as pd
 from typing import TYPE_CHECKING, Optional, Any
 from typing_extensions import Self
 
 from ._utils import _assert_list_is_subset
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from ._types import GTSelf
 
 
@@ -166,6 +167,8 @@ def cols_align(self: GTSelf, align: str = "left", columns: Optional[str] = None)
 
 
 def _print_boxhead(self: GTSelf) -> pd.DataFrame:
+    import pandas as pd
+
     boxhead_list = list(
         zip(
             [x.var for x in self._boxhead],
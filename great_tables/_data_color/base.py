@@ -1,21 +1,32 @@
 from __future__ import annotations
+from itertools import compress
 from typing import (
     TYPE_CHECKING,
+    Dict,
     Union,
     List,
     Optional,
     Tuple,
 )
 from .constants import DEFAULT_PALETTE, COLOR_NAME_TO_HEX
-from great_tables._tbl_data import is_na, DataFrameLike
+from great_tables._gt_data import StyleInfo
+from great_tables._tbl_data import _get_column_na_mask
 from great_tables.style import fill, text
-from great_tables.loc import body
-import numpy as np
-from mizani.palettes import gradient_n_pal
 
 if TYPE_CHECKING:
+    import numpy as np
+
+    from great_tables._styles import CellStyle
     from great_tables._types import GTSelf
 
+# The number of colors in the lookup table that palettes are interpolated through; mizani
+# quantizes its color gradients to the same number of colors (and in the same way), so values
+# get the same colors from the lookup table as they would from mizani itself
+PALETTE_LUT_SIZE = 256
+
+# Added to values before they're rounded to a position in the lookup table (as mizani does)
+_LUT_ROUNDING_JITTER = 1e-12
+
 
 def data_color(
     self: GTSelf,
@@ -120,6 +131,8 @@ def data_color(
     ```
     """
 
+    import numpy as np
+
     # If no color is provided to `na_color`, use a light gray color as a default
     if na_color is None:
         na_color = "#808080"
@@ -159,68 +172,113 @@ def data_color(
     else:
         columns_resolved = columns
 
+    # Interpolate the palette through a lookup table of colors; the `na_color=` color goes at the
+    # end of the table so that NA values can be looked up in the same way as all other values
+    color_lut = _get_palette_lut(palette=palette) + [na_color]
+
+    # The styles for each color in the lookup table (these are created as the colors are used, so
+    # that the ideal foreground color is only worked out once for each color)
+    lut_styles: Dict[int, List[CellStyle]] = {}
+
+    all_info: List[StyleInfo] = []
+
     # For each column targeted, get the data values as a new list object
     for col in columns_resolved:
         column_vals = data_table[col].to_list()
 
         # Filter out NA values from `column_vals`
-        filtered_column_vals = [x for x in column_vals if not is_na(data_table, x)]
+        na_mask = _get_column_na_mask(data_table, col)
+        filtered_column_vals = list(compress(column_vals, ~na_mask))
 
         # The methodology for domain calculation and rescaling depends on column values being:
         # (1) numeric (integers or floats), then the method should be 'numeric'
         # (2) strings, then the method should be 'factor'
-        if all(isinstance(x, (int, float)) for x in filtered_column_vals):
+        # (only the distinct types of the values need to be checked for this)
+        val_types = set(map(type, filtered_column_vals))
+
+        if all(issubclass(x, (int, float)) for x in val_types):
             # If `domain` is not provided, then infer it from the data values
             if autocalc_domain:
-                domain = _get_domain_numeric(df=data_table, vals=column_vals)
+                domain = [min(filtered_column_vals), max(filtered_column_vals)]
 
             # Rescale only the non-NA values in `column_vals` to the range [0, 1]
-            scaled_vals = _rescale_numeric(df=data_table, vals=column_vals, domain=domain)
+            scaled_vals = _rescale_numeric_values(vals=filtered_column_vals, domain=domain)
 
-        elif all(isinstance(x, str) for x in filtered_column_vals):
-            # If `domain` is not provided, then infer it from the data values
+        elif all(issubclass(x, str) for x in val_types):
+            # If `domain` is not provided, then infer it from the data values (the unique values
+            # in the order provided)
             if autocalc_domain:
-                domain = _get_domain_factor(df=data_table, vals=column_vals)
+                domain = list(dict.fromkeys(filtered_column_vals))
 
             # Rescale only the non-NA values in `column_vals` to the range [0, 1]
-            scaled_vals = _rescale_factor(
-                df=data_table, vals=column_vals, domain=domain, palette=palette
-            )
+            scaled_vals = _rescale_factor_values(vals=filtered_column_vals, domain=domain)
 
         else:
             raise ValueError(
                 f"Invalid column type provided ({col}). Please ensure that all columns are either numeric or strings."
             )
 
-        # Replace NA values in `scaled_vals` with `None`
-        scaled_vals = [np.nan if is_na(data_table, x) else x for x in scaled_vals]
-
-        # Create a color scale function from the palette
-        color_scale_fn = gradient_n_pal(colors=palette)
+        # Get the position of each value's color in the lookup table; NA values (and values that
+        # couldn't be rescaled) get the `na_color=` color
+        na_index = len(color_lut) - 1
 
-        # Call the color scale function on the scaled values to get a list of colors
-        color_vals = color_scale_fn(scaled_vals)
+        color_idx = np.full(len(column_vals), na_index)
+        color_idx[~na_mask] = _get_palette_lut_index(scaled_vals=scaled_vals, na_index=na_index)
+        color_idx = color_idx.tolist()
 
-        # Replace 'None' values in `color_vals` with the `na_color=` color
-        color_vals = [na_color if x is None else x for x in color_vals]
-
-        # for every color value in color_vals, apply a fill to the corresponding cell
-        # by using `tab_style()`
-        for i, _ in enumerate(color_vals):
+        for i in set(color_idx) - lut_styles.keys():
             if autocolor_text:
-                fgnd_color = _ideal_fgnd_color(bgnd_color=color_vals[i])
+                fgnd_color = _ideal_fgnd_color(bgnd_color=color_lut[i])
 
-                self = self.tab_style(
-                    style=[text(color=fgnd_color), fill(color=color_vals[i])],
-                    locations=body(columns=col, rows=[i]),
-                )
+                lut_styles[i] = [text(color=fgnd_color), fill(color=color_lut[i])]
 
             else:
-                self = self.tab_style(
-                    style=fill(color=color_vals[i]), locations=body(columns=col, rows=[i])
-                )
+                lut_styles[i] = [fill(color=color_lut[i])]
+
+        # For every color value, apply a fill to the corresponding cell (this sets the same
+        # styles as using `tab_style()` with `loc.body(columns=col, rows=[i])` for each cell,
+        # but without copying all of the table's styles for every cell)
+        all_info.extend(
+            StyleInfo(locname="data", locnum=5, colname=col, rownum=row, styles=lut_styles[i])
+            for row, i in enumerate(color_idx)
+        )
+
+    return self._replace(_styles=self._styles + all_info)
+
+
+def _get_palette_lut(palette: List[str]) -> List[str]:
+    """
+    Get a lookup table of colors for a palette.
+
+    The palette is interpolated at `PALETTE_LUT_SIZE` evenly spaced points in the range [0, 1].
+    """
+
+    import numpy as np
+    from mizani.palettes import gradient_n_pal
+
+    # Create a color scale function from the palette
+    color_scale_fn = gradient_n_pal(colors=palette)
+
+    return list(color_scale_fn(np.linspace(0, 1, PALETTE_LUT_SIZE)))
+
+
+def _get_palette_lut_index(scaled_vals: np.ndarray, na_index: int) -> np.ndarray:
+    """
+    Get the positions of values (in the range [0, 1]) in a palette's lookup table.
+
+    NaN values get the position given by `na_index=`.
+    """
 
-    return self
+    import numpy as np
+
+    is_valid = ~np.isnan(scaled_vals)
+
+    lut_index = np.full(len(scaled_vals), na_index)
+    lut_index[is_valid] = np.round(
+        scaled_vals[is_valid] * (PALETTE_LUT_SIZE - 1) + _LUT_ROUNDING_JITTER
+    )
+
+    return lut_index
 
 
 def _ideal_fgnd_color(bgnd_color: str, light: str = "#FFFFFF", dark: str = "#000000") -> str:
@@ -528,15 +586,19 @@ def _expand_short_hex(hex_color: str) -> str:
     return expanded
 
 
-def _rescale_numeric(
-    df: DataFrameLike, vals: List[Union[int, float]], domain: List[float]
-) -> List[float]:
+def _rescale_numeric_values(
+    vals: List[Union[int, float]], domain: List[Union[int, float]]
+) -> np.ndarray:
     """
-    Rescale numeric values
+    Rescale numeric values (as an array)
 
-    Rescale the numeric values in `vals=` to the range [0, 1] using the domain provided.
+    Rescale the non-NA numeric values in `vals=` to the range [0, 1] using the domain provided.
+    Values that lie outside of the domain are NaN. If the domain has no range (e.g., it's the
+    domain of a column holding a single value), the values in it are rescaled to 0.5.
     """
 
+    import numpy as np
+
     # Get the minimum and maximum values from `domain`
     domain_min = domain[0]
     domain_max = domain[1]
@@ -544,80 +606,45 @@ def _rescale_numeric(
     # Get the range of values in `domain`
     domain_range = domain_max - domain_min
 
-    # Rescale the values in `vals` to the range [0, 1], pass through NA values
-    scaled_vals = [(x - domain_min) / domain_range if not is_na(df, x) else x for x in vals]
-
-    # Add NA values to any values in `scaled_vals` that are not in the [0, 1] range
-    scaled_vals = [x if not is_na(df, x) and (x >= 0 and x <= 1) else np.nan for x in scaled_vals]
-
-    return scaled_vals
-
-
-def _rescale_factor(
-    df: DataFrameLike, vals: List[Union[int, float]], domain: List[float], palette: List[str]
-) -> List[float]:
-    """
-    Rescale factor values
-
-    Rescale the factor values in `vals=` to the range [0, 1] using the domain provided.
-    """
+    vals_array = np.asarray(vals, dtype=float)
 
-    domain_length = len(domain)
-    palette_length = len(palette)
+    # A domain without a range can't be used for rescaling, so put the values in it at the middle
+    # of the palette (as `scales::rescale()` does in R)
+    if domain_range == 0:
+        return np.where(vals_array == domain_min, 0.5, np.nan)
 
-    if domain_length <= palette_length:
-        # If the length of `domain` is less than or equal to the length of `palette`, then clip the
-        # length of `palette` to the length of `domain`
-        palette = palette[:domain_length]
+    # Rescale the values in `vals` to the range [0, 1] (infinite values can produce NaN values
+    # here, which are then treated as being outside of the domain)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scaled_vals = (vals_array - domain_min) / domain_range
 
-    # For each value in `vals`, get the index of the value in `domain` but if not present then
-    # use NA; then scale these index values to the range [0, 1]
-    scaled_vals = _rescale_numeric(
-        df=df,
-        vals=[domain.index(x) if x in domain else np.nan for x in vals],
-        domain=[0, domain_length],
-    )
+    # Add NA values to any values in `scaled_vals` that are not in the [0, 1] range
+    scaled_vals[~((scaled_vals >= 0) & (scaled_vals <= 1))] = np.nan
 
     return scaled_vals
 
 
-def _get_domain_numeric(df: DataFrameLike, vals: List[Union[int, float]]) -> List[float]:
+def _rescale_factor_values(vals: List[str], domain: List[str]) -> np.ndarray:
     """
-    Get the domain of numeric values.
+    Rescale factor values (as an array)
 
-    Get the domain of numeric values in `vals=` as a list of two values: the min and max values.
+    Rescale the non-NA factor values in `vals=` to the range [0, 1] using the domain provided.
+    Values that aren't in the domain are NaN.
     """
 
-    # Exclude any NA values from `vals`
-    vals = [x for x in vals if not is_na(df, x)]
+    import numpy as np
 
-    # Get the minimum and maximum values from `vals`
-    domain_min = min(vals)
-    domain_max = max(vals)
+    # Map each value in `domain` to the index of its first occurrence
+    domain_index: Dict[str, int] = {}
 
-    # Create the domain
-    domain = [domain_min, domain_max]
+    for i, x in enumerate(domain):
+        domain_index.setdefault(x, i)
 
-    return domain
-
-
-def _get_domain_factor(df: DataFrameLike, vals: List[str]) -> List[str]:
-    """
-    Get the domain of factor values.
+    if not domain_index:
+        return np.full(len(vals), np.nan)
 
-    Get the domain of factor values in `vals=` as a list of the unique values in the order provided.
-    """
-
-    # Exclude any NA values from `vals`
-    vals = [x for x in vals if not is_na(df, x)]
-
-    # Create the domain by getting the unique values in `vals` in order provided
-    unique_list: List[str] = []
-    seen: List[str] = []
-
-    for item in vals:
-        if item not in seen:
-            unique_list.append(item)
-            seen.append(item)
+    # For each value in `vals`, get the index of the value in `domain` but if not present then
+    # use NA; then scale these index values to the range [0, 1]
+    scaled_vals = np.array([domain_index.get(x, np.nan) for x in vals], dtype=float)
 
-    return seen
+    return scaled_vals / len(domain)
@@ -11,21 +11,40 @@ from typing import (
     Optional,
     Dict,
     Literal,
+    Tuple,
 )
 from typing_extensions import TypeAlias
 from ._tbl_data import PlExpr, n_rows
 from ._gt_data import GTData, FormatFns, FormatFn, FormatInfo
-from ._locale import _get_locales_data, _get_default_locales_data, _get_currencies_data
+from ._formats_dates import _CompiledDateTimeFormat, _map_memoized, _parse_iso_strs
+from ._formats_polars import (
+    _affix_symbol_expr,
+    _apply_pattern_expr,
+    _date_to_str_expr,
+    _numeric_expr,
+    _replace_minus_expr,
+    _scale_expr,
+    _value_to_decimal_notation_expr,
+)
+from ._formats_vec import (
+    _apply_pattern,
+    _map_or_vectorize,
+    _replace_minus_vec,
+    _scale_values,
+    _value_to_decimal_notation_vec,
+)
+from ._locale import _locale_registry, _currency_registry
 from ._locations import resolve_rows_i
 from ._text import _md_html
 from ._utils import _str_detect, _str_replace
-import pandas as pd
 import math
 from datetime import datetime, date, time
-from babel.dates import format_date, format_time, format_datetime
+from functools import partial
 
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from ._types import GTSelf
 
 T = TypeVar("T")
@@ -307,7 +326,65 @@ def fmt_number(
 
         return x_formatted
 
-    return fmt(self, fns=fmt_number_fn, columns=columns, rows=rows)
+    # Generate a function that operates on an array of `x` values, giving the same results
+    # as `fmt_number_fn()` (compact and significant figures formatting isn't vectorized)
+    def fmt_number_vec(x: np.ndarray) -> np.ndarray:
+        x = _scale_values(x, scale_by=scale_by)
+
+        x_formatted = _value_to_decimal_notation_vec(
+            values=x,
+            decimals=decimals,
+            drop_trailing_zeros=drop_trailing_zeros,
+            drop_trailing_dec_mark=drop_trailing_dec_mark,
+            use_seps=use_seps,
+            sep_mark=sep_mark,
+            dec_mark=dec_mark,
+            force_sign=force_sign,
+        )
+
+        x_formatted = _replace_minus_vec(x_formatted, x < 0, minus_mark=_context_minus_mark())
+
+        return _apply_pattern(x_formatted, pattern=pattern)
+
+    # Generate a function that builds a polars expression giving the same results as
+    # `fmt_number_fn()`, for formatting whole polars columns within polars
+    def fmt_number_expr(x: PlExpr, dtype: Any) -> Optional[Tuple[PlExpr, PlExpr]]:
+        x = _numeric_expr(x, dtype)
+
+        if x is None:
+            return None
+
+        x = _scale_expr(x, scale_by=scale_by)
+
+        x_decimal = _value_to_decimal_notation_expr(
+            x,
+            decimals=decimals,
+            drop_trailing_zeros=drop_trailing_zeros,
+            drop_trailing_dec_mark=drop_trailing_dec_mark,
+            use_seps=use_seps,
+            sep_mark=sep_mark,
+            dec_mark=dec_mark,
+            force_sign=force_sign,
+        )
+
+        if x_decimal is None:
+            return None
+
+        x_formatted, is_exact = x_decimal
+        x_formatted = _replace_minus_expr(x_formatted, x < 0, minus_mark=_context_minus_mark())
+
+        # Missing values aren't passed through by `fmt_number_fn()`, so they're left to it
+        return _apply_pattern_expr(x_formatted, pattern=pattern), is_exact.fill_null(False)
+
+    if compact or n_sigfig:
+        fns = FormatFns(default=fmt_number_fn)
+    else:
+        fmt_number_batch = partial(
+            _map_or_vectorize, scalar_fn=fmt_number_fn, vector_fn=fmt_number_vec
+        )
+        fns = FormatFns(default=fmt_number_fn, batch=fmt_number_batch, expr=fmt_number_expr)
+
+    return fmt(self, fns=fns, columns=columns, rows=rows)
 
 
 def fmt_integer(
@@ -414,6 +491,8 @@ def fmt_integer(
     [`val_fmt_integer()`](`great_tables._formats_vals.val_fmt_integer`).
     """
 
+    import pandas as pd
+
     # Stop if `locale` does not have a valid value; normalize locale and resolve one
     # that might be set globally
     _validate_locale(locale=locale)
@@ -474,7 +553,64 @@ def fmt_integer(
 
         return x_formatted
 
-    return fmt(self, fns=fmt_integer_fn, columns=columns, rows=rows)
+    # Generate a function that operates on an array of `x` values, giving the same results
+    # as `fmt_integer_fn()` (compact formatting isn't vectorized)
+    def fmt_integer_vec(x: np.ndarray) -> np.ndarray:
+        x = _scale_values(x, scale_by=scale_by)
+
+        x_formatted = _value_to_decimal_notation_vec(
+            values=x,
+            decimals=0,
+            drop_trailing_zeros=False,
+            drop_trailing_dec_mark=True,
+            use_seps=use_seps,
+            sep_mark=sep_mark,
+            dec_mark="not used",
+            force_sign=force_sign,
+        )
+
+        x_formatted = _replace_minus_vec(x_formatted, x < 0, minus_mark=_context_minus_mark())
+
+        return _apply_pattern(x_formatted, pattern=pattern)
+
+    # Generate a function that builds a polars expression giving the same results as
+    # `fmt_integer_fn()`, for formatting whole polars columns within polars
+    def fmt_integer_expr(x: PlExpr, dtype: Any) -> Optional[Tuple[PlExpr, PlExpr]]:
+        x = _numeric_expr(x, dtype)
+
+        if x is None:
+            return None
+
+        x = _scale_expr(x, scale_by=scale_by)
+
+        x_formatted, is_exact = _value_to_decimal_notation_expr(
+            x,
+            decimals=0,
+            drop_trailing_zeros=False,
+            drop_trailing_dec_mark=True,
+            use_seps=use_seps,
+            sep_mark=sep_mark,
+            dec_mark="not used",
+            force_sign=force_sign,
+        )
+
+        x_formatted = _replace_minus_expr(x_formatted, x < 0, minus_mark=_context_minus_mark())
+
+        # Missing values aren't passed through by the formatting function, so they're left to it
+        return _apply_pattern_expr(x_formatted, pattern=pattern), is_exact.fill_null(False)
+
+    if compact:
+        fns = FormatFns(default=fmt_integer_fn)
+    else:
+        fmt_integer_batch = partial(
+            _map_or_vectorize,
+            scalar_fn=fmt_integer_fn,
+            vector_fn=fmt_integer_vec,
+            na_passthrough=True,
+        )
+        fns = FormatFns(default=fmt_integer_fn, batch=fmt_integer_batch, expr=fmt_integer_expr)
+
+    return fmt(self, fns=fns, columns=columns, rows=rows)
 
 
 def fmt_scientific(
@@ -614,6 +750,8 @@ def fmt_scientific(
     a single numerical value (or a list of them).
     """
 
+    import pandas as pd
+
     # Set a default value for `use_seps`; these separators are only used for very
     # large exponent values
     use_seps = True
@@ -856,6 +994,8 @@ def fmt_percent(
     single numerical value (or a list of them).
     """
 
+    import pandas as pd
+
     # Stop if `locale` does not have a valid value; normalize locale and resolve one
     # that might be set globally
     _validate_locale(locale=locale)
@@ -935,7 +1075,103 @@ def fmt_percent(
 
         return x_formatted
 
-    return fmt(self, fns=fmt_percent_fn, columns=columns, rows=rows)
+    # Generate a function that operates on an array of `x` values, giving the same results
+    # as `fmt_percent_fn()`
+    def fmt_percent_vec(x: np.ndarray) -> np.ndarray:
+        import numpy as np
+
+        x = _scale_values(x, scale_by=scale_by)
+
+        is_negative = x < 0
+        is_positive = x > 0
+
+        x_formatted = _value_to_decimal_notation_vec(
+            values=x,
+            decimals=decimals,
+            drop_trailing_zeros=drop_trailing_zeros,
+            drop_trailing_dec_mark=drop_trailing_dec_mark,
+            use_seps=use_seps,
+            sep_mark=sep_mark,
+            dec_mark=dec_mark,
+            force_sign=force_sign,
+        )
+
+        # Affix the percent sign; when it's placed on the left, any sign goes in front of it
+        space_character = " " if incl_space else ""
+
+        if placement == "right":
+            x_formatted = np.char.add(x_formatted, f"{space_character}%")
+        else:
+            left_negative = is_negative
+            left_positive = ~is_negative & is_positive & force_sign
+
+            x_unsigned = np.where(
+                left_negative,
+                np.char.replace(x_formatted, "-", ""),
+                np.where(left_positive, np.char.replace(x_formatted, "+", ""), x_formatted),
+            )
+            x_formatted = np.char.add(f"%{space_character}", x_unsigned)
+
+            x_formatted = np.where(left_negative, np.char.add("-", x_formatted), x_formatted)
+            x_formatted = np.where(left_positive, np.char.add("+", x_formatted), x_formatted)
+
+        x_formatted = _replace_minus_vec(x_formatted, is_negative, minus_mark=_context_minus_mark())
+
+        return _apply_pattern(x_formatted, pattern=pattern)
+
+    # Generate a function that builds a polars expression giving the same results as
+    # `fmt_percent_fn()`, for formatting whole polars columns within polars
+    def fmt_percent_expr(x: PlExpr, dtype: Any) -> Optional[Tuple[PlExpr, PlExpr]]:
+        x = _numeric_expr(x, dtype)
+
+        if x is None:
+            return None
+
+        x = _scale_expr(x, scale_by=scale_by)
+
+        x_decimal = _value_to_decimal_notation_expr(
+            x,
+            decimals=decimals,
+            drop_trailing_zeros=drop_trailing_zeros,
+            drop_trailing_dec_mark=drop_trailing_dec_mark,
+            use_seps=use_seps,
+            sep_mark=sep_mark,
+            dec_mark=dec_mark,
+            force_sign=force_sign,
+        )
+
+        if x_decimal is None:
+            return None
+
+        x_formatted, is_exact = x_decimal
+
+        x_formatted = _affix_symbol_expr(
+            x_formatted,
+            is_negative=x < 0,
+            is_positive=x > 0,
+            symbol="%",
+            placement=placement,
+            incl_space=incl_space,
+            force_sign=force_sign,
+        )
+        x_formatted = _replace_minus_expr(x_formatted, x < 0, minus_mark=_context_minus_mark())
+
+        # Missing values aren't passed through by the formatting function, so they're left to it
+        return _apply_pattern_expr(x_formatted, pattern=pattern), is_exact.fill_null(False)
+
+    fmt_percent_batch = partial(
+        _map_or_vectorize,
+        scalar_fn=fmt_percent_fn,
+        vector_fn=fmt_percent_vec,
+        na_passthrough=True,
+    )
+
+    return fmt(
+        self,
+        fns=FormatFns(default=fmt_percent_fn, batch=fmt_percent_batch, expr=fmt_percent_expr),
+        columns=columns,
+        rows=rows,
+    )
 
 
 def fmt_currency(
@@ -1074,6 +1310,8 @@ def fmt_currency(
     single numerical value (or a list of them).
     """
 
+    import pandas as pd
+
     # Stop if `locale` does not have a valid value; normalize locale and resolve one
     # that might be set globally
     _validate_locale(locale=locale)
@@ -1099,10 +1337,21 @@ def fmt_currency(
         currency=currency_resolved, decimals=decimals, use_subunits=use_subunits
     )
 
+    # Get the currency symbol on the basis of a valid currency code and create a currency
+    # pattern for affixing it (this is done once, rather than for every value)
+    currency_symbol = _get_currency_str(currency=currency_resolved)
+
+    space_character = " " if incl_space else ""
+    currency_pattern = (
+        f"{{x}}{space_character}{currency_symbol}"
+        if placement == "right"
+        else f"{currency_symbol}{space_character}{{x}}"
+    )
+
     # Generate a function that will operate on single `x` values in the table body
     def fmt_currency_fn(
         x: float,
-        currency: str = currency_resolved,
+        currency_pattern: str = currency_pattern,
         decimals: int = decimals,
         drop_trailing_dec_mark: bool = drop_trailing_dec_mark,
         use_seps: bool = use_seps,
@@ -1111,7 +1360,6 @@ def fmt_currency(
         dec_mark: str = dec_mark,
         force_sign: bool = force_sign,
         placement: str = placement,
-        incl_space: bool = incl_space,
     ):
         # If the `x` value is a Pandas 'NA', then return the same value
         if pd.isna(x):
@@ -1124,9 +1372,6 @@ def fmt_currency(
         is_negative = _has_negative_value(value=x)
         is_positive = _has_positive_value(value=x)
 
-        # Get the currency symbol on the basis of a valid currency code
-        currency_symbol = _get_currency_str(currency=currency)
-
         # Format the value to decimal notation; this is done before the currency symbol is
         # affixed to the value
         x_formatted = _value_to_decimal_notation(
@@ -1141,14 +1386,6 @@ def fmt_currency(
             force_sign=force_sign,
         )
 
-        # Create a currency pattern for affixing the currency symbol
-        space_character = " " if incl_space else ""
-        currency_pattern = (
-            f"{{x}}{space_character}{currency_symbol}"
-            if placement == "right"
-            else f"{currency_symbol}{space_character}{{x}}"
-        )
-
         if is_negative and placement == "left":
             x_formatted = x_formatted.replace("-", "")
             x_formatted = currency_pattern.replace("{x}", x_formatted)
@@ -1171,7 +1408,52 @@ def fmt_currency(
 
         return x_formatted
 
-    return fmt(self, fns=fmt_currency_fn, columns=columns, rows=rows)
+    # Generate a function that builds a polars expression giving the same results as
+    # `fmt_currency_fn()`, for formatting whole polars columns within polars
+    def fmt_currency_expr(x: PlExpr, dtype: Any) -> Optional[Tuple[PlExpr, PlExpr]]:
+        x = _numeric_expr(x, dtype)
+
+        if x is None:
+            return None
+
+        x = _scale_expr(x, scale_by=scale_by)
+
+        x_decimal = _value_to_decimal_notation_expr(
+            x,
+            decimals=decimals,
+            drop_trailing_zeros=False,
+            drop_trailing_dec_mark=drop_trailing_dec_mark,
+            use_seps=use_seps,
+            sep_mark=sep_mark,
+            dec_mark=dec_mark,
+            force_sign=force_sign,
+        )
+
+        if x_decimal is None:
+            return None
+
+        x_formatted, is_exact = x_decimal
+
+        x_formatted = _affix_symbol_expr(
+            x_formatted,
+            is_negative=x < 0,
+            is_positive=x > 0,
+            symbol=currency_symbol,
+            placement=placement,
+            incl_space=incl_space,
+            force_sign=force_sign,
+        )
+        x_formatted = _replace_minus_expr(x_formatted, x < 0, minus_mark=_context_minus_mark())
+
+        # Missing values aren't passed through by the formatting function, so they're left to it
+        return _apply_pattern_expr(x_formatted, pattern=pattern), is_exact.fill_null(False)
+
+    return fmt(
+        self,
+        fns=FormatFns(default=fmt_currency_fn, expr=fmt_currency_expr),
+        columns=columns,
+        rows=rows,
+    )
 
 
 def fmt_roman(
@@ -1232,6 +1514,8 @@ def fmt_roman(
     numerical value (or a list of them).
     """
 
+    import pandas as pd
+
     # Check that the `case` value is valid and only consists of the string 'upper' or 'lower'
     _validate_case(case=case)
 
@@ -1409,6 +1693,8 @@ def fmt_bytes(
     numerical value (or a list of them).
     """
 
+    import pandas as pd
+
     # Stop if `locale` does not have a valid value; normalize locale and resolve one
     # that might be set globally
     _validate_locale(locale=locale)
@@ -1615,6 +1901,9 @@ def fmt_date(
     numerical value (or a list of them).
     """
 
+    import pandas as pd
+    from babel.dates import format_date
+
     # Stop if `locale` does not have a valid value; normalize locale and resolve one
     # that might be set globally
     _validate_locale(locale=locale)
@@ -1623,10 +1912,11 @@ def fmt_date(
     # Get the date format string based on the `date_style` value
     date_format_str = _get_date_format(date_style=date_style)
 
+    # Prepare the date format for the locale once (rather than for every value)
+    date_format = _CompiledDateTimeFormat(format_date, format_str=date_format_str, locale=locale)
+
     # Generate a function that will operate on single `x` values in the table body
-    def fmt_date_fn(
-        x: Any, date_format_str: str = date_format_str, locale: Union[str, None] = locale
-    ) -> str:
+    def fmt_date_fn(x: Any, date_format: _CompiledDateTimeFormat = date_format) -> str:
         # If the `x` value is a Pandas 'NA', then return the same value
         if pd.isna(x):
             return x
@@ -1643,14 +1933,8 @@ def fmt_date(
             # Stop if `x` is not a valid date object
             _validate_date_obj(x=x)
 
-        # Fix up the locale for `format_date()` by replacing any hyphens with underscores
-        if locale is None:
-            locale = "en_US"
-        else:
-            locale = _str_replace(locale, "-", "_")
-
         # Format the date object to a string using Babel's `format_date()` function
-        x_formatted = format_date(x, format=date_format_str, locale=locale)
+        x_formatted = date_format(x)
 
         # Use a supplied pattern specification to decorate the formatted value
         if pattern != "{x}":
@@ -1658,7 +1942,29 @@ def fmt_date(
 
         return x_formatted
 
-    return fmt(self, fns=fmt_date_fn, columns=columns, rows=rows)
+    # Generate a function that operates on a list of `x` values, converting any ISO date strings
+    # all at once and formatting each distinct date only once
+    def fmt_date_batch(x: List[Any]) -> List[Any]:
+        return _map_memoized(_parse_iso_strs(x, kind="date"), fmt_date_fn)
+
+    # Generate a function that builds a polars expression giving the same results as
+    # `fmt_date_fn()` (only for date styles made up of numbers, like "iso")
+    def fmt_date_expr(x: PlExpr, dtype: Any) -> Optional[Tuple[PlExpr, PlExpr]]:
+        x_date = _date_to_str_expr(x, dtype, date_format_str=date_format_str)
+
+        if x_date is None:
+            return None
+
+        x_formatted, is_exact = x_date
+
+        return _apply_pattern_expr(x_formatted, pattern=pattern), is_exact
+
+    return fmt(
+        self,
+        fns=FormatFns(default=fmt_date_fn, batch=fmt_date_batch, expr=fmt_date_expr),
+        columns=columns,
+        rows=rows,
+    )
 
 
 def fmt_time(
@@ -1748,6 +2054,9 @@ def fmt_time(
     numerical value (or a list of them).
     """
 
+    import pandas as pd
+    from babel.dates import format_time
+
     # Stop if `locale` does not have a valid value; normalize locale and resolve one
     # that might be set globally
     _validate_locale(locale=locale)
@@ -1756,10 +2065,11 @@ def fmt_time(
     # Get the time format string based on the `time_style` value
     time_format_str = _get_time_format(time_style=time_style)
 
+    # Prepare the time format for the locale once (rather than for every value)
+    time_format = _CompiledDateTimeFormat(format_time, format_str=time_format_str, locale=locale)
+
     # Generate a function that will operate on single `x` values in the table body
-    def fmt_time_fn(
-        x: Any, time_format_str: str = time_format_str, locale: Union[str, None] = locale
-    ) -> str:
+    def fmt_time_fn(x: Any, time_format: _CompiledDateTimeFormat = time_format) -> str:
         # If the `x` value is a Pandas 'NA', then return the same value
         if pd.isna(x):
             return x
@@ -1779,14 +2089,8 @@ def fmt_time(
             # Stop if `x` is not a valid time object
             _validate_time_obj(x=x)
 
-        # Fix up the locale for `format_time()` by replacing any hyphens with underscores
-        if locale is None:
-            locale = "en_US"
-        else:
-            locale = _str_replace(locale, "-", "_")
-
         # Format the time object to a string using Babel's `format_time()` function
-        x_formatted = format_time(x, format=time_format_str, locale=locale)
+        x_formatted = time_format(x)
 
         # Use a supplied pattern specification to decorate the formatted value
         if pattern != "{x}":
@@ -1794,7 +2098,14 @@ def fmt_time(
 
         return x_formatted
 
-    return fmt(self, fns=fmt_time_fn, columns=columns, rows=rows)
+    # Generate a function that operates on a list of `x` values, converting any ISO time strings
+    # all at once and formatting each distinct time only once
+    def fmt_time_batch(x: List[Any]) -> List[Any]:
+        return _map_memoized(_parse_iso_strs(x, kind="time"), fmt_time_fn)
+
+    return fmt(
+        self, fns=FormatFns(default=fmt_time_fn, batch=fmt_time_batch), columns=columns, rows=rows
+    )
 
 
 def fmt_datetime(
@@ -1903,6 +2214,9 @@ def fmt_datetime(
     ```
     """
 
+    import pandas as pd
+    from babel.dates import format_datetime
+
     # Stop if `locale` does not have a valid value; normalize locale and resolve one
     # that might be set globally
     _validate_locale(locale=locale)
@@ -1914,22 +2228,21 @@ def fmt_datetime(
     # Get the time format string based on the `time_style` value
     time_format_str = _get_time_format(time_style=time_style)
 
+    # From the date and time format strings, create a datetime format string and prepare it
+    # for the locale once (rather than for every value)
+    datetime_format_str = f"{date_format_str}'{sep}'{time_format_str}"
+
+    datetime_format = _CompiledDateTimeFormat(
+        format_datetime, format_str=datetime_format_str, locale=locale
+    )
+
     # Generate a function that will operate on single `x` values in the table body using both
     # the date and time format strings
-    def fmt_datetime_fn(
-        x: Any,
-        date_format_str: str = date_format_str,
-        time_format_str: str = time_format_str,
-        sep: str = sep,
-        locale: Union[str, None] = locale,
-    ) -> str:
+    def fmt_datetime_fn(x: Any, datetime_format: _CompiledDateTimeFormat = datetime_format) -> str:
         # If the `x` value is a Pandas 'NA', then return the same value
         if pd.isna(x):
             return x
 
-        # From the date and time format strings, create a datetime format string
-        datetime_format_str = f"{date_format_str}'{sep}'{time_format_str}"
-
         # If `x` is a string, assume it is an ISO datetime string and convert it to a datetime object
         if isinstance(x, str):
             # Stop if `x` is not a valid ISO datetime string
@@ -1945,14 +2258,8 @@ def fmt_datetime(
             # Stop if `x` is not a valid datetime object
             _validate_datetime_obj(x=x)
 
-        # Fix up the locale for `format_datetime()` by replacing any hyphens with underscores
-        if locale is None:
-            locale = "en_US"
-        else:
-            locale = _str_replace(locale, "-", "_")
-
         # Format the datetime object to a string using Babel's `format_datetime()` function
-        x_formatted = format_datetime(x, format=datetime_format_str, locale=locale)
+        x_formatted = datetime_format(x)
 
         # Use a supplied pattern specification to decorate the formatted value
         if pattern != "{x}":
@@ -1960,7 +2267,17 @@ def fmt_datetime(
 
         return x_formatted
 
-    return fmt(self, fns=fmt_datetime_fn, columns=columns, rows=rows)
+    # Generate a function that operates on a list of `x` values, converting any ISO datetime
+    # strings all at once and formatting each distinct datetime only once
+    def fmt_datetime_batch(x: List[Any]) -> List[Any]:
+        return _map_memoized(_parse_iso_strs(x, kind="datetime"), fmt_datetime_fn)
+
+    return fmt(
+        self,
+        fns=FormatFns(default=fmt_datetime_fn, batch=fmt_datetime_batch),
+        columns=columns,
+        rows=rows,
+    )
 
 
 def _validate_iso_datetime_str(x: str) -> None:
@@ -2046,6 +2363,8 @@ def fmt_markdown(
     single string value (or a list of them).
     """
 
+    import pandas as pd
+
     # Generate a function that will operate on single `x` values in the table body
     def fmt_markdown_fn(x: Any) -> str:
         # If the `x` value is a Pandas 'NA', then return the same value
@@ -2523,15 +2842,6 @@ def _replace_minus(string: str, minus_mark: str) -> str:
     return _str_replace(string, "-", minus_mark)
 
 
-def _filter_pd_df_to_row(pd_df: pd.DataFrame, column: str, filter_expr: str) -> pd.DataFrame:
-    filtered_pd_df = pd_df[pd_df[column] == filter_expr]
-    if len(filtered_pd_df) != 1:
-        raise Exception(
-            "Internal Error, the filtered table doesn't result in a table of exactly one row."
-        )
-    return filtered_pd_df
-
-
 def _get_locale_sep_mark(default: str, use_seps: bool, locale: Union[str, None] = None) -> str:
     # If `use_seps` is False, then force `sep_mark` to be an empty string
     if not use_seps:
@@ -2541,16 +2851,8 @@ def _get_locale_sep_mark(default: str, use_seps: bool, locale: Union[str, None]
     if locale is None:
         return default
 
-    # Get the correct `group` value from the locales lookup table
-    pd_df_row = _filter_pd_df_to_row(pd_df=_get_locales_data(), column="locale", filter_expr=locale)
-
-    # Obtain a single cell value from the single row in `pd_df_row` that is below
-    # the column named 'group'; this could potentially be of any type but we expect
-    # it to be a string (and we'll check for that here)
-    sep_mark: Any
-    sep_mark = pd_df_row.iloc[0]["group"]
-    if not isinstance(sep_mark, str):
-        raise TypeError(f"Variable type mismatch. Expected str, got {type(sep_mark)}.")
+    # Get the correct `group` value from the locales registry
+    sep_mark = _locale_registry.get(locale).group
 
     # Replace any `""` or "\u00a0" with `" "` since an empty string actually
     # signifies a space character, and, we want to normalize to a simple space
@@ -2564,60 +2866,27 @@ def _get_locale_dec_mark(default: str, locale: Union[str, None] = None) -> str:
     if locale is None:
         return default
 
-    # Get the correct `decimal` value row from the locales lookup table
-    pd_df_row = _filter_pd_df_to_row(pd_df=_get_locales_data(), column="locale", filter_expr=locale)
-
-    # Obtain a single cell value from the single row in `pd_df_row` that is below
-    # the column named 'decimal'; this could potentially be of any type but we expect
-    # it to be a string (and we'll check for that here)
-    dec_mark: Any
-    dec_mark = pd_df_row.iloc[0]["decimal"]
-    if not isinstance(dec_mark, str):
-        raise TypeError(f"Variable type mismatch. Expected str, got {type(dec_mark)}.")
-
-    return dec_mark
+    # Get the correct `decimal` value from the locales registry
+    return _locale_registry.get(locale).decimal
 
 
 def _get_locales_list() -> List[str]:
     """
     Returns a list of locales as strings.
-
-    Raises:
-        TypeError: If the first element of the locale list is not a string.
     """
 
-    # Get the 'locales' dataset and obtain from that a list of locales
-    locales = _get_locales_data()
-    locale_list = locales["locale"].tolist()
-
-    # Ensure that `locale_list` is of the type 'str'
-    locale_list: Any
-    if not isinstance(locale_list[0], str):
-        raise TypeError("Variable type mismatch. Expected str, got something entirely different.")
-    return locale_list
+    return _locale_registry.list_locales()
 
 
 def _get_default_locales_list() -> List[str]:
     """
     Returns a list of default locales.
 
-    The function retrieves the default locales data and extracts the default locale list.
-    It ensures that the list is of type 'str' and raises a TypeError if not.
-
     Returns:
         A list of default locales as strings.
     """
 
-    # Get the 'default locales' dataset and obtain from that a list of default locales
-    default_locales = _get_default_locales_data()
-    default_locale_list = default_locales["default_locale"].tolist()
-
-    # Ensure that `default_locale_list` is of the type 'str'
-    default_locale_list: Any
-    if not isinstance(default_locale_list[0], str):
-        raise TypeError("Variable type mismatch. Expected str, got something entirely different.")
-
-    return default_locale_list
+    return _locale_registry.list_default_locales()
 
 
 def _validate_locale(locale: Union[str, None] = None) -> None:
@@ -2636,14 +2905,9 @@ def _validate_locale(locale: Union[str, None] = None) -> None:
     if locale is None:
         return
 
-    locales_list = _get_locales_list()
-    default_locales_list = _get_default_locales_list()
-
-    # Replace any underscores with hyphens
-    supplied_locale = _str_replace(locale, "_", "-")
-
-    # Stop if the `locale` provided isn't a valid one
-    if supplied_locale not in locales_list and supplied_locale not in default_locales_list:
+    # Stop if the `locale` provided isn't a valid one (after replacing any underscores with
+    # hyphens)
+    if not _locale_registry.is_valid(locale):
         raise ValueError("The supplied `locale` is not available in the list of supported locales.")
 
     return
@@ -2659,34 +2923,15 @@ def _normalize_locale(locale: Union[str, None] = None) -> Union[str, None]:
     Returns:
         str or None: The normalized locale string, or None if the input was None.
 
-    Raises:
-        TypeError: If the resolved locale is not of type 'str'.
     """
 
     # If `locale` is None then return None (we don't need to normalize anything here)
     if locale is None:
         return None
 
-    # Replace any underscores with hyphens
-    supplied_locale = _str_replace(locale, "_", "-")
-
-    # Resolve any default locales into their base names (e.g., 'en-US' -> 'en')
-    if supplied_locale in _get_default_locales_list():
-        default_locales = _get_default_locales_data()
-        resolved_locale = default_locales[
-            default_locales["default_locale"] == supplied_locale
-        ].iloc[0]["base_locale"]
-
-        # Ensure that `resolved_locale` is of the type 'str'
-        resolved_locale: Any
-        if not isinstance(resolved_locale, str):
-            raise TypeError(
-                "Variable type mismatch. Expected str, got something entirely different."
-            )
-    else:
-        resolved_locale = supplied_locale
-
-    return resolved_locale
+    # Replace any underscores with hyphens and resolve any default locales into their base
+    # names (e.g., 'en-US' -> 'en')
+    return _locale_registry.normalize(locale)
 
 
 def _resolve_locale(x: GTData, locale: Union[str, None] = None) -> Union[str, None]:
@@ -2717,25 +2962,14 @@ def _get_locale_currency_code(locale: Union[str, None] = None) -> str:
     Returns:
         str: A string representing the currency code for the specified locale.
 
-    Raises:
-        TypeError: If the currency code is not a string.
-
     """
 
     # If `locale` is None then return `"USD"`
     if locale is None:
         return "USD"
 
-    # Get the correct 'locale' value row from the `__x_locales` lookup table
-    pd_df_row = _filter_pd_df_to_row(pd_df=_get_locales_data(), column="locale", filter_expr=locale)
-
-    # Extract the 'currency_code' cell value from this 1-row DataFrame
-    currency_code = pd_df_row.iloc[0]["currency_code"]
-
-    # Ensure that `currency_code` is of the type 'str'
-    currency_code: Any
-    if not isinstance(currency_code, str):
-        raise TypeError("Variable type mismatch. Expected str, got something entirely different.")
+    # Get the 'currency_code' value for the locale from the locales registry
+    currency_code = _locale_registry.get(locale).currency_code
 
     # If the field isn't populated, we'll obtain an empty string; in such a case we fall
     # back to using the 'USD' currency code
@@ -2754,25 +2988,10 @@ def _get_currency_str(currency: str) -> str:
 
     Returns:
         str: The currency symbol corresponding to the given currency code.
-
-    Raises:
-        TypeError: If the currency symbol is not of type 'str'.
     """
 
-    # Get the correct 'curr_code' value row from the `__x_currencies` lookup table
-    pd_df_row = _filter_pd_df_to_row(
-        pd_df=_get_currencies_data(), column="curr_code", filter_expr=currency
-    )
-
-    # Extract the 'symbol' cell value from this 1-row DataFrame
-    currency_str = pd_df_row.iloc[0]["symbol"]
-
-    # Ensure that `currency_str` is of the type 'str'
-    currency_str: Any
-    if not isinstance(currency_str, str):
-        raise TypeError("Variable type mismatch. Expected str, got something entirely different.")
-
-    return currency_str
+    # Get the 'symbol' value for the currency from the currencies registry
+    return _currency_registry.get(currency).symbol
 
 
 def _validate_currency(currency: str) -> None:
@@ -2789,14 +3008,8 @@ def _validate_currency(currency: str) -> None:
     - None
     """
 
-    # Get the currencies data
-    currencies = _get_currencies_data()
-
-    # Get the `curr_code` column from currencies DataFrame as a list
-    curr_code_list: List[str] = currencies["curr_code"].tolist()
-
     # Stop if the `currency` provided isn't a valid one
-    if currency not in curr_code_list:
+    if not _currency_registry.is_valid(currency):
         raise ValueError(
             "The supplied `currency` is not available in the list of supported currencies."
         )
@@ -2849,27 +3062,14 @@ def _get_currency_exponent(currency: str) -> int:
     Returns:
         int: The exponent associated with the currency code.
     """
-    currencies = _get_currencies_data()
-
-    # get the curr_code column from currencies df as a list
-    curr_code_list: List[str] = currencies["curr_code"].tolist()
 
-    if currency in curr_code_list:
-        exponent = currencies[currencies["curr_code"] == currency].iloc[0]["exponent"]
+    # A currency without an exponent (e.g., a precious metal) also gets the default value
+    if not _currency_registry.is_valid(currency):
+        return 2
 
-        # Cast exponent variable as an integer value (it is a str currently)
-        exponent = int(exponent)
-
-        # Ensure that `exponent` is of the type 'int'
-        exponent: Any
-        if not isinstance(exponent, int):
-            raise TypeError(
-                "Variable type mismatch. Expected int, got something entirely different."
-            )
-    else:
-        exponent = 2
+    exponent = _currency_registry.get(currency).exponent
 
-    return exponent
+    return 2 if exponent is None else exponent
 
 
 def _validate_n_sigfig(n_sigfig: int) -> None:
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Union
+from typing_extensions import Literal
+
+
+class _CompiledDateTimeFormat:
+    """
+    A Babel date, time, or datetime format that is prepared once for a locale.
+
+    Babel's `format_date()`, `format_time()` and `format_datetime()` functions resolve the locale
+    and parse the format pattern on every call. Here, the resolved `Locale` and the parsed pattern
+    are given to those functions instead (which then use them as they are), so the output is
+    identical to calling them with strings.
+    """
+
+    def __init__(self, babel_fn: Callable[..., str], format_str: str, locale: Union[str, None]):
+        from babel import Locale as BabelLocale
+        from babel.dates import parse_pattern
+
+        # Fix up the locale for Babel by replacing any hyphens with underscores
+        locale = "en_US" if locale is None else locale.replace("-", "_")
+
+        self.babel_fn = babel_fn
+        self.locale = BabelLocale.parse(locale)
+        self.pattern = parse_pattern(format_str)
+
+    def __call__(self, x: Any) -> str:
+        return self.babel_fn(x, format=self.pattern, locale=self.locale)
+
+
+def _parse_iso_strs(values: List[Any], kind: Literal["date", "time", "datetime"]) -> List[Any]:
+    """
+    Convert the ISO date, time, or datetime strings in a list of values all at once.
+
+    This gives the same objects as the per-value conversions (e.g., `_iso_to_date()`), but only
+    strings in the strict forms that those accept are converted. Other strings (including those
+    that aren't valid dates or times) are left as they are, so that they get the usual per-value
+    validation and error messages. Values that aren't strings are left unchanged.
+    """
+
+    regex, format, short_len = _ISO_FORMATS[kind]
+
+    str_idx = [ii for ii, x in enumerate(values) if isinstance(x, str)]
+
+    if not str_idx:
+        return values
+
+    import pandas as pd
+
+    strs = pd.Series([values[ii] for ii in str_idx], dtype=object)
+    is_match = strs.str.fullmatch(regex).fillna(False).astype(bool).to_numpy()
+
+    if not is_match.any():
+        return values
+
+    strs = strs[is_match]
+
+    # Add a seconds value to any times without one
+    if short_len is not None:
+        strs = strs.where(strs.str.len() != short_len, strs + ":00")
+
+    # Dates outside of the range of pandas' timestamps are also left as strings
+    parsed = pd.to_datetime(strs, format=format, errors="coerce")
+
+    result = list(values)
+
+    for ii, ts in zip([str_idx[jj] for jj in is_match.nonzero()[0]], parsed):
+        if ts is pd.NaT:
+            continue
+
+        x: datetime = ts.to_pydatetime()
+
+        if kind == "date":
+            result[ii] = x.date()
+        elif kind == "time":
+            result[ii] = x.time()
+        else:
+            result[ii] = x
+
+    return result
+
+
+def _map_memoized(values: List[Any], fn: Callable[[Any], Any]) -> List[Any]:
+    """
+    Apply `fn` to each of the values, calling it only once for each distinct value.
+
+    Values are distinguished by type, value, and time zone (datetimes that are equal but in
+    different time zones are formatted differently).
+    """
+
+    cache: Dict[Any, Any] = {}
+    result: List[Any] = []
+
+    for x in values:
+        key = (type(x), x, getattr(x, "tzinfo", None))
+
+        try:
+            x_formatted = cache[key]
+        except KeyError:
+            x_formatted = cache[key] = fn(x)
+        except TypeError:
+            # Unhashable values can't be cached
+            x_formatted = fn(x)
+
+        result.append(x_formatted)
+
+    return result
+
+
+# Strict forms of the ISO strings that the per-value conversions accept, with the formats used to
+# parse them and the length of the strings that lack a seconds value
+_ISO_FORMATS = {
+    "date": (r"\d{4}-\d{2}-\d{2}", "%Y-%m-%d", None),
+    "time": (r"\d{2}:\d{2}(?::\d{2})?", "%H:%M:%S", 5),
+    "datetime": (r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}(?::\d{2})?", "%Y-%m-%d %H:%M:%S", 16),
+}
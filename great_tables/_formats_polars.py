@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+from ._formats_vec import _MAX_INTEGER_ROUNDING_DECIMALS
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+# Polars expression versions of the vectorized formatting functions in `_formats_vec.py`. Each
+# gives the same results as its NumPy counterpart, but runs inside polars (rather than moving
+# every value into Python). Where polars can't reproduce the formatting exactly (e.g., for values
+# near a rounding tie), a boolean expression is returned that is false for those values; the
+# column is then formatted through the Python path instead.
+
+
+def _scale_expr(x: pl.Expr, scale_by: float) -> pl.Expr:
+    # Multiplying by an integer 1 leaves values (and their type) unchanged, just like `x * 1`
+    if isinstance(scale_by, int) and scale_by == 1:
+        return x
+
+    return x * scale_by
+
+
+def _apply_pattern_expr(x_formatted: pl.Expr, pattern: str) -> pl.Expr:
+    """
+    Polars expression version of `pattern.replace("{x}", x_formatted)`.
+    """
+
+    import polars as pl
+
+    if pattern == "{x}":
+        return x_formatted
+
+    pattern_parts = pattern.split("{x}")
+
+    # A pattern without `{x}` replaces the values entirely
+    if len(pattern_parts) == 1:
+        return pl.lit(pattern)
+
+    exprs = [pl.lit(pattern_parts[0])]
+
+    for part in pattern_parts[1:]:
+        exprs.extend([x_formatted, pl.lit(part)])
+
+    return pl.concat_str(exprs)
+
+
+def _replace_minus_expr(x_formatted: pl.Expr, is_negative: pl.Expr, minus_mark: str) -> pl.Expr:
+    """
+    Polars expression version of `_replace_minus()`, applied only to negative values.
+    """
+
+    import polars as pl
+
+    return (
+        pl.when(is_negative)
+        .then(x_formatted.str.replace_all("-", minus_mark, literal=True))
+        .otherwise(x_formatted)
+    )
+
+
+def _affix_symbol_expr(
+    x_formatted: pl.Expr,
+    is_negative: pl.Expr,
+    is_positive: pl.Expr,
+    symbol: str,
+    placement: str,
+    incl_space: bool,
+    force_sign: bool,
+) -> pl.Expr:
+    """
+    Affix a symbol (e.g., a percent sign or a currency symbol) to formatted values.
+
+    When the symbol is placed on the left, any sign goes in front of it.
+    """
+
+    import polars as pl
+
+    space_character = " " if incl_space else ""
+
+    if placement == "right":
+        return pl.concat_str([x_formatted, pl.lit(f"{space_character}{symbol}")])
+
+    left_negative = is_negative
+    left_positive = ~is_negative & is_positive & force_sign
+
+    sign = pl.when(left_negative).then(pl.lit("-")).when(left_positive).then(pl.lit("+"))
+
+    x_unsigned = (
+        pl.when(left_negative)
+        .then(x_formatted.str.replace_all("-", "", literal=True))
+        .when(left_positive)
+        .then(x_formatted.str.replace_all("+", "", literal=True))
+        .otherwise(x_formatted)
+    )
+
+    return pl.concat_str(
+        [sign.otherwise(pl.lit("")), pl.lit(f"{symbol}{space_character}"), x_unsigned]
+    )
+
+
+def _value_to_decimal_notation_expr(
+    x: pl.Expr,
+    decimals: int = 2,
+    drop_trailing_zeros: bool = False,
+    drop_trailing_dec_mark: bool = True,
+    use_seps: bool = True,
+    sep_mark: str = ",",
+    dec_mark: str = ".",
+    force_sign: bool = False,
+) -> Optional[Tuple[pl.Expr, pl.Expr]]:
+    """
+    Polars expression version of `_value_to_decimal_notation_vec()`.
+
+    Returns an expression for the formatted values, along with a boolean expression that is true
+    where values are formatted exactly (it's false for values that are near a rounding tie, very
+    large, or not finite; it's null for missing values). Returns `None` if there are too many
+    decimal places for values to be rounded with integer arithmetic.
+    """
+
+    import polars as pl
+
+    if decimals > _MAX_INTEGER_ROUNDING_DECIMALS:
+        return None
+
+    # Rounding `scaled` to an integer gives the correct result unless the exact product was on
+    # the other side of a tie; a value within `scaled * 2**-52` (which is at least one unit in the
+    # last place) of a value ending in .5 might be
+    scaled = x.abs().cast(pl.Float64) * 10.0**decimals
+    is_exact = (scaled < 2.0**53) & ((scaled - scaled.floor() - 0.5).abs() > scaled * 2.0**-52)
+
+    rounded = pl.when(is_exact).then(scaled).otherwise(0.0).round(0).cast(pl.Int64)
+
+    integer_values = rounded // 10**decimals
+
+    if use_seps and sep_mark:
+        integer_part = _digit_groups_expr(
+            integer_values, sep_mark=sep_mark, max_digits=len(str(2**53 // 10**decimals))
+        )
+    else:
+        integer_part = integer_values.cast(pl.Utf8)
+
+    parts = [pl.when(x < 0).then(pl.lit("-")).otherwise(pl.lit("")), integer_part]
+
+    if decimals > 0:
+        decimal_part = (rounded % 10**decimals).cast(pl.Utf8).str.zfill(decimals)
+        parts.extend([pl.lit(dec_mark), decimal_part])
+
+    result = pl.concat_str(parts)
+
+    # Drop any trailing zeros if option is taken
+    if drop_trailing_zeros is True:
+        result = result.str.strip_chars_end("0")
+
+    # Drop the trailing decimal mark if it is present
+    if drop_trailing_dec_mark is True:
+        result = result.str.strip_chars_end(dec_mark)
+
+    # Add in a trailing decimal mark under specific circumstances
+    if drop_trailing_dec_mark is False:
+        result = (
+            pl.when(result.str.contains(dec_mark, literal=True))
+            .then(result)
+            .otherwise(pl.concat_str([result, pl.lit(dec_mark)]))
+        )
+
+    # Force the positive sign to be present if the `force_sign` option is taken
+    if force_sign:
+        result = pl.when(x > 0).then(pl.concat_str([pl.lit("+"), result])).otherwise(result)
+
+    return result, is_exact
+
+
+def _digit_groups_expr(x: pl.Expr, sep_mark: str, max_digits: int) -> pl.Expr:
+    """
+    Write out non-negative integers with `sep_mark` between groups of three digits.
+
+    Each group of three digits is written out separately (zero-padded unless it's the leading
+    group, and left out if the value has fewer digits), which is much faster than inserting the
+    separators with a regular expression.
+    """
+
+    import polars as pl
+
+    n_groups = (max_digits + 2) // 3
+    groups = []
+
+    for k in reversed(range(n_groups)):
+        group = ((x // 1000**k) % 1000).cast(pl.Utf8)
+        group_formatted = pl.when(x >= 1000 ** (k + 1)).then(group.str.zfill(3)).otherwise(group)
+
+        # The last group is always present, and isn't followed by a separator
+        if k == 0:
+            groups.append(group_formatted)
+        else:
+            groups.append(
+                pl.when(x >= 1000**k)
+                .then(pl.concat_str([group_formatted, pl.lit(sep_mark)]))
+                .otherwise(pl.lit(""))
+            )
+
+    return pl.concat_str(groups)
+
+
+def _numeric_expr(x: pl.Expr, dtype: Any) -> Optional[pl.Expr]:
+    """
+    Cast a numeric column to 64-bit integers or floats (the types its values have when they're
+    formatted in Python or with NumPy). Returns `None` for columns that aren't numeric.
+    """
+
+    import polars as pl
+
+    # Decimals aren't floats, and the largest unsigned integers don't fit in an `Int64`
+    if not dtype.is_numeric() or dtype == pl.Decimal or dtype == pl.UInt64:
+        return None
+
+    return x.cast(pl.Int64 if dtype.is_integer() else pl.Float64)
+
+
+# Babel date patterns made up of numeric fields, with `strftime()` formats giving the same result
+# for dates with four-digit years
+_DATE_PATTERN_STRFTIME = {
+    "y-MM-dd": "%Y-%m-%d",
+    "y/MM/dd": "%Y/%m/%d",
+    "yy/MM/dd": "%y/%m/%d",
+    "y": "%Y",
+    "dd": "%d",
+}
+
+
+def _date_to_str_expr(
+    x: pl.Expr, dtype: Any, date_format_str: str
+) -> Optional[Tuple[pl.Expr, pl.Expr]]:
+    """
+    Polars expression for formatting dates with a Babel date pattern.
+
+    Only patterns made up of numeric fields (which don't depend on the locale) are supported, for
+    columns of dates or datetimes. Returns `None` otherwise.
+    """
+
+    import polars as pl
+
+    strftime_format = _DATE_PATTERN_STRFTIME.get(date_format_str)
+
+    if strftime_format is None or not (dtype == pl.Date or dtype == pl.Datetime):
+        return None
+
+    year = x.dt.year()
+    is_exact = (year >= 1000) & (year <= 9999)
+
+    return x.dt.strftime(strftime_format), is_exact
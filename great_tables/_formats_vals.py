@@ -1,6 +1,7 @@
 from __future__ import annotations
+from functools import lru_cache
 from ._gt_data import GTData
-from great_tables.gt import _get_column_of_values, GT
+from great_tables.gt import GT
 from great_tables import GT
 from typing import List, Any, Union, Optional, TYPE_CHECKING
 
@@ -8,25 +9,49 @@ if TYPE_CHECKING:
     from ._formats import DateStyle, TimeStyle
 
 
-def _make_one_col_table(vals: Union[Any, List[Any]]) -> GTData:
+@lru_cache(maxsize=None)
+def _make_one_col_table() -> GTData:
     """
-    Create a one-column table from a list of values.
+    Create an empty one-column table, for setting up the formats that are applied to values.
 
-    Args:
-        val_list (Union[Any, List[Any]]): The list of values to be converted into a table.
+    The `fmt_*()` methods only resolve their options (e.g., the locale) when called, so a single
+    table is shared by all of the `val_fmt_*()` functions. It's never built or rendered.
 
     Returns:
         GTData: The GTData object representing the one-column table.
     """
     from pandas import DataFrame
 
+    return GT(DataFrame({"x": []}), auto_align=False)
+
+
+def _format_vals(vals: Union[Any, List[Any]], gt: GTData, context: str) -> List[str]:
+    """
+    Format values with the last format added to a one-column table.
+
+    Rather than building the table, the format's function is applied to all of the values at once.
+    The values are converted just like a column of a Pandas DataFrame, and the results are the
+    strings that the body cells of the built table would have (with missing values as `"<NA>"`).
+
+    Args:
+        vals (Union[Any, List[Any]]): The values to be formatted.
+        gt (GTData): The one-column table with the format.
+        context (str): The rendering context.
+
+    Returns:
+        List[str]: The formatted values.
+    """
+    from pandas import Series, isna
+
     # Upgrade a single value to a list
     if type(vals) != list:
         vals = [vals]
 
-    # Convert the list to a Pandas DataFrame and then to a GTData object
-    gt_obj = GT(DataFrame({"x": vals}), auto_align=False)
-    return gt_obj
+    values = Series(vals).tolist()
+
+    batch_func = gt._formats[-1].func.get_batch(context)
+
+    return ["<NA>" if isna(x) else str(x) for x in batch_func(values)]
 
 
 def val_fmt_number(
@@ -124,7 +149,7 @@ def val_fmt_number(
         A list of formatted values is returned.
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
+    gt_obj: GTData = _make_one_col_table()
 
     gt_obj_fmt = gt_obj.fmt_number(
         columns="x",
@@ -142,7 +167,7 @@ def val_fmt_number(
         locale=locale,
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
+    vals_fmt = _format_vals(vals=x, gt=gt_obj_fmt, context="html")
 
     return vals_fmt
 
@@ -213,7 +238,7 @@ def val_fmt_integer(
         A list of formatted values is returned.
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
+    gt_obj: GTData = _make_one_col_table()
 
     gt_obj_fmt = gt_obj.fmt_integer(
         columns="x",
@@ -226,7 +251,7 @@ def val_fmt_integer(
         locale=locale,
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
+    vals_fmt = _format_vals(vals=x, gt=gt_obj_fmt, context="html")
 
     return vals_fmt
 
@@ -330,7 +355,7 @@ def val_fmt_scientific(
         A list of formatted values is returned.
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
+    gt_obj: GTData = _make_one_col_table()
 
     gt_obj_fmt = gt_obj.fmt_scientific(
         columns="x",
@@ -348,7 +373,7 @@ def val_fmt_scientific(
         locale=locale,
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
+    vals_fmt = _format_vals(vals=x, gt=gt_obj_fmt, context="html")
 
     return vals_fmt
 
@@ -447,7 +472,7 @@ def val_fmt_percent(
         A list of formatted values is returned.
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
+    gt_obj: GTData = _make_one_col_table()
 
     gt_obj_fmt = gt_obj.fmt_percent(
         columns="x",
@@ -465,7 +490,7 @@ def val_fmt_percent(
         locale=locale,
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
+    vals_fmt = _format_vals(vals=x, gt=gt_obj_fmt, context="html")
 
     return vals_fmt
 
@@ -568,7 +593,7 @@ def val_fmt_currency(
         A list of formatted values is returned.
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
+    gt_obj: GTData = _make_one_col_table()
 
     gt_obj_fmt = gt_obj.fmt_currency(
         columns="x",
@@ -587,7 +612,7 @@ def val_fmt_currency(
         locale=locale,
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
+    vals_fmt = _format_vals(vals=x, gt=gt_obj_fmt, context="html")
 
     return vals_fmt
 
@@ -620,7 +645,7 @@ def val_fmt_roman(
         A list of formatted values is returned.
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
+    gt_obj: GTData = _make_one_col_table()
 
     gt_obj_fmt = gt_obj.fmt_roman(
         columns="x",
@@ -628,7 +653,7 @@ def val_fmt_roman(
         pattern=pattern,
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
+    vals_fmt = _format_vals(vals=x, gt=gt_obj_fmt, context="html")
 
     return vals_fmt
 
@@ -723,7 +748,7 @@ def val_fmt_bytes(
         A list of formatted values is returned.
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
+    gt_obj: GTData = _make_one_col_table()
 
     gt_obj_fmt = gt_obj.fmt_bytes(
         columns="x",
@@ -741,7 +766,7 @@ def val_fmt_bytes(
         locale=locale,
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
+    vals_fmt = _format_vals(vals=x, gt=gt_obj_fmt, context="html")
 
     return vals_fmt
 
@@ -810,7 +835,7 @@ def val_fmt_date(
         A list of formatted values is returned.
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
+    gt_obj: GTData = _make_one_col_table()
 
     gt_obj_fmt = gt_obj.fmt_date(
         columns="x",
@@ -819,7 +844,7 @@ def val_fmt_date(
         locale=locale,
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
+    vals_fmt = _format_vals(vals=x, gt=gt_obj_fmt, context="html")
 
     return vals_fmt
 
@@ -876,7 +901,7 @@ def val_fmt_time(
         A list of formatted values is returned.
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
+    gt_obj: GTData = _make_one_col_table()
 
     gt_obj_fmt = gt_obj.fmt_time(
         columns="x",
@@ -885,7 +910,7 @@ def val_fmt_time(
         locale=locale,
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
+    vals_fmt = _format_vals(vals=x, gt=gt_obj_fmt, context="html")
 
     return vals_fmt
 
@@ -909,12 +934,12 @@ def val_fmt_markdown(
         A list of formatted values is returned.
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
+    gt_obj: GTData = _make_one_col_table()
 
     gt_obj_fmt = gt_obj.fmt_markdown(
         columns="x",
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
+    vals_fmt = _format_vals(vals=x, gt=gt_obj_fmt, context="html")
 
     return vals_fmt
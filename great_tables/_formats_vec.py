@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _as_numeric_array(values: Sequence[Any]) -> Optional[np.ndarray]:
+    """
+    Convert values to a NumPy array of integers or floats.
+
+    Returns `None` if the values aren't all numeric (e.g., there are missing values other than
+    `nan`, or there are strings), in which case they should be formatted one at a time.
+    """
+
+    import numpy as np
+
+    try:
+        arr = np.asarray(values)
+    except (TypeError, ValueError):
+        return None
+
+    if arr.ndim != 1 or arr.dtype.kind not in "iuf":
+        return None
+
+    return arr
+
+
+def _map_or_vectorize(
+    values: Sequence[Any],
+    scalar_fn: Callable[[Any], Any],
+    vector_fn: Callable[[np.ndarray], np.ndarray],
+    na_passthrough: bool = False,
+) -> List[Any]:
+    """
+    Format values with `vector_fn` if they can be represented as a numeric array, otherwise apply
+    the scalar function `scalar_fn` to each value.
+
+    With `na_passthrough=True`, `nan` values are returned as they are (like the scalar functions
+    that return missing values unchanged) rather than being given to `vector_fn`.
+    """
+
+    import numpy as np
+
+    arr = _as_numeric_array(values)
+
+    if arr is None:
+        return [scalar_fn(x) for x in values]
+
+    if arr.size == 0:
+        return []
+
+    if not na_passthrough or arr.dtype.kind != "f":
+        return vector_fn(arr).tolist()
+
+    is_na = np.isnan(arr)
+
+    if not is_na.any():
+        return vector_fn(arr).tolist()
+
+    result: List[Any] = list(arr.tolist())
+    not_na_idx = np.flatnonzero(~is_na)
+
+    for i, x_formatted in zip(not_na_idx.tolist(), vector_fn(arr[not_na_idx]).tolist()):
+        result[i] = x_formatted
+
+    return result
+
+
+def _scale_values(arr: np.ndarray, scale_by: float) -> np.ndarray:
+    import numpy as np
+
+    # Multiplying by an integer 1 leaves values (and their type) unchanged, just like `x * 1`
+    if isinstance(scale_by, int) and scale_by == 1:
+        return arr
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        return arr * scale_by
+
+
+def _apply_pattern(x_formatted: np.ndarray, pattern: str) -> np.ndarray:
+    """
+    Vectorized version of `pattern.replace("{x}", x_formatted)`.
+    """
+
+    import numpy as np
+
+    if pattern == "{x}":
+        return x_formatted
+
+    pattern_parts = pattern.split("{x}")
+
+    # A pattern without `{x}` replaces the values entirely
+    if len(pattern_parts) == 1:
+        return np.full(x_formatted.shape, pattern, dtype=f"<U{max(len(pattern), 1)}")
+
+    result = np.char.add(pattern_parts[0], x_formatted)
+
+    for part in pattern_parts[1:-1]:
+        result = np.char.add(np.char.add(result, part), x_formatted)
+
+    return np.char.add(result, pattern_parts[-1])
+
+
+def _replace_minus_vec(x_formatted: np.ndarray, is_negative: np.ndarray, minus_mark: str):
+    """
+    Vectorized version of `_replace_minus()`, applied only to negative values.
+    """
+
+    import numpy as np
+
+    if not is_negative.any():
+        return x_formatted
+
+    return np.where(is_negative, np.char.replace(x_formatted, "-", minus_mark), x_formatted)
+
+
+def _value_to_decimal_notation_vec(
+    values: np.ndarray,
+    decimals: int = 2,
+    drop_trailing_zeros: bool = False,
+    drop_trailing_dec_mark: bool = True,
+    use_seps: bool = True,
+    sep_mark: str = ",",
+    dec_mark: str = ".",
+    force_sign: bool = False,
+) -> np.ndarray:
+    """
+    Decimal notation for an array of values.
+
+    This is a vectorized version of `_value_to_decimal_notation()` (with `n_sigfig=None`), which
+    gives identical results.
+    """
+
+    import numpy as np
+
+    result = _format_fixed_decimals_vec(
+        values, decimals=decimals, use_seps=use_seps, sep_mark=sep_mark, dec_mark=dec_mark
+    )
+
+    # Drop any trailing zeros if option is taken
+    if drop_trailing_zeros is True:
+        result = np.char.rstrip(result, "0")
+
+    # Drop the trailing decimal mark if it is present
+    if drop_trailing_dec_mark is True:
+        result = np.char.rstrip(result, dec_mark)
+
+    # Add in a trailing decimal mark under specific circumstances
+    if drop_trailing_dec_mark is False:
+        no_dec_mark = np.char.find(result, dec_mark) == -1
+        result = np.where(no_dec_mark, np.char.add(result, dec_mark), result)
+
+    # Force the positive sign to be present if the `force_sign` option is taken
+    if force_sign:
+        result = np.where(values > 0, np.char.add("+", result), result)
+
+    return result
+
+
+# The most decimal places for which values are rounded with integer arithmetic (all integers
+# below 2**53, i.e., of up to 15 digits, are exactly representable as floats)
+_MAX_INTEGER_ROUNDING_DECIMALS = 15
+
+
+def _format_fixed_decimals_vec(
+    values: np.ndarray, decimals: int, use_seps: bool, sep_mark: str, dec_mark: str
+) -> np.ndarray:
+    """
+    Vectorized version of `_format_number_fixed_decimals()` (with `drop_trailing_zeros=False`).
+
+    Values are rounded with integer arithmetic and their digits are written out as character
+    codes, except where the result could differ from the correctly rounded one that `format()`
+    gives (values that are near a tie, very large, or not finite). Those values are formatted one
+    at a time, exactly as in `_format_number_fixed_decimals()`.
+    """
+
+    import numpy as np
+
+    is_negative = values < 0
+    abs_values = np.abs(values.astype(np.float64))
+
+    if decimals <= _MAX_INTEGER_ROUNDING_DECIMALS:
+        # Rounding `scaled` to an integer gives the correct result unless the exact product was
+        # on the other side of a tie (i.e., `scaled` is within one unit in the last place of a
+        # value ending in .5); only values below 2**53 have an exact integer representation
+        with np.errstate(over="ignore", invalid="ignore"):
+            scaled = abs_values * 10.0**decimals
+            is_exact = (scaled < 2.0**53) & (
+                np.abs(scaled - np.floor(scaled) - 0.5) > np.spacing(scaled)
+            )
+    else:
+        is_exact = np.zeros(values.shape, dtype=bool)
+
+    exact_idx = np.flatnonzero(is_exact)
+    inexact_idx = np.flatnonzero(~is_exact)
+
+    exact_str = _digits_to_str(
+        np.rint(scaled[exact_idx]).astype(np.int64) if len(exact_idx) else exact_idx,
+        decimals=decimals,
+        is_negative=is_negative[exact_idx],
+        sep_mark=sep_mark if use_seps else "",
+        dec_mark=dec_mark,
+    )
+
+    fmt_spec = f",.{decimals}f" if use_seps else f".{decimals}f"
+    inexact_str: List[str] = []
+
+    for i in inexact_idx.tolist():
+        integer_part, _, decimal_part = format(abs_values[i], fmt_spec).partition(".")
+
+        if use_seps:
+            integer_part = integer_part.replace(",", sep_mark)
+
+        if is_negative[i]:
+            integer_part = "-" + integer_part
+
+        inexact_str.append(integer_part + (dec_mark + decimal_part if decimal_part else ""))
+
+    if not inexact_str:
+        return exact_str
+
+    width = max([exact_str.dtype.itemsize // 4, *map(len, inexact_str)])
+
+    result = np.empty(values.shape, dtype=f"U{max(width, 1)}")
+    result[exact_idx] = exact_str
+    result[inexact_idx] = inexact_str
+
+    return result
+
+
+def _digits_to_str(
+    values: np.ndarray, decimals: int, is_negative: np.ndarray, sep_mark: str, dec_mark: str
+) -> np.ndarray:
+    """
+    Write out non-negative integers as numbers with `decimals` decimal places.
+
+    For example, with two decimal places, `123456` becomes `"1,234.56"`. The characters are
+    assembled as a matrix of Unicode code points (one row per value) which is then viewed as an
+    array of strings. The integer part is right-aligned (padded on the left with spaces, which are
+    stripped at the end) so that the groups of three digits line up across values.
+    """
+
+    import numpy as np
+
+    n = len(values)
+
+    if n == 0:
+        return np.empty(0, dtype="U1")
+
+    integer_values, decimal_values = np.divmod(values, 10**decimals)
+
+    # Get the number of digits in each integer part (there is always at least one)
+    pow10 = 10 ** np.arange(16, dtype=np.int64)
+    n_digits = 1 + (integer_values[:, None] >= pow10[None, 1:]).sum(axis=1)
+
+    # Positions in the integer part are counted from the right, and cycle through three digits
+    # followed by the separator (whose characters are written from its end)
+    sep_codes = [ord(char) for char in sep_mark]
+    sep_len = len(sep_codes)
+    max_digits = int(n_digits.max())
+    int_width = max_digits + ((max_digits - 1) // 3) * sep_len + 1
+
+    int_codes = np.full((n, int_width), ord(" "), dtype=np.uint32)
+
+    for pos in range(int_width):
+        group, offset = divmod(pos, 3 + sep_len)
+
+        if offset < 3:
+            power = 3 * group + offset
+            if power >= max_digits:
+                continue
+            digit = 48 + (integer_values // pow10[power]) % 10
+            int_codes[:, pos] = np.where(n_digits > power, digit, ord(" "))
+        else:
+            sep_char = sep_codes[sep_len - 1 - (offset - 3)]
+            int_codes[:, pos] = np.where(n_digits > 3 * (group + 1), sep_char, ord(" "))
+
+    # Place a minus sign before the first digit of negative values
+    neg_idx = np.flatnonzero(is_negative)
+    sign_pos = n_digits[neg_idx] + ((n_digits[neg_idx] - 1) // 3) * sep_len
+    int_codes[neg_idx, sign_pos] = ord("-")
+
+    code_blocks = [int_codes[:, ::-1]]
+
+    if decimals > 0:
+        dec_mark_codes = np.array([ord(char) for char in dec_mark], dtype=np.uint32)
+        code_blocks.append(np.broadcast_to(dec_mark_codes, (n, len(dec_mark_codes))))
+
+        dec_codes = np.empty((n, decimals), dtype=np.uint32)
+
+        for pos in range(decimals):
+            dec_codes[:, pos] = 48 + (decimal_values // pow10[decimals - 1 - pos]) % 10
+
+        code_blocks.append(dec_codes)
+
+    codes = np.ascontiguousarray(np.concatenate(code_blocks, axis=1))
+
+    result = codes.view(f"U{codes.shape[1]}").reshape(n)
+
+    return np.char.lstrip(result, " ")
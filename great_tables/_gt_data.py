@@ -3,11 +3,11 @@ from __future__ import annotations
 import copy
 import re
 
-from typing import overload, TypeVar, Dict, Optional
+from typing import overload, Iterator, TypeVar, Dict, Optional
 from typing_extensions import Self, TypeAlias
 from dataclasses import dataclass, field, replace
 from ._utils import _str_detect
-from ._tbl_data import create_empty_frame, to_list, validate_frame
+from ._tbl_data import create_empty_frame, hash_frame, to_list, validate_frame
 
 from ._styles import CellStyle
 
@@ -51,8 +51,30 @@ class GTData:
 
         new_obj.__dict__.update(kwargs)
 
+        # the built versions of this object (see `_get_built_cache()`) don't apply to the new one
+        new_obj.__dict__.pop("_built_cache", None)
+
         return new_obj
 
+    def _get_built_cache(self) -> Dict[str, Self]:
+        """Get the built versions of this object, keyed by rendering context
+
+        Since GTData is immutable (every change goes through `_replace()`, which gives a new object
+        with an empty cache), a built version can be reused for as long as this object exists. The
+        one exception is the input data, which can be modified in place after `GT()` is called
+        (e.g., by assigning to a cell of a pandas DataFrame). So the cache is tied to a digest of
+        the data, and starts over empty whenever the data has changed.
+        """
+        data_digest = hash_frame(self._tbl_data)
+
+        cache_digest, built_cache = self.__dict__.get("_built_cache", (None, {}))
+
+        if cache_digest != data_digest:
+            built_cache = {}
+            self.__dict__["_built_cache"] = (data_digest, built_cache)
+
+        return built_cache
+
     @classmethod
     def from_data(
         cls,
@@ -119,6 +141,11 @@ class _Sequence(Sequence[T]):
     def __len__(self):
         return len(self._d)
 
+    def __iter__(self) -> Iterator[T]:
+        # Iterating over the list directly is much faster than the default (which indexes the
+        # sequence one item at a time)
+        return iter(self._d)
+
     def __repr__(self):
         return f"{type(self).__name__}({self._d.__repr__()})"
 
@@ -129,9 +156,56 @@ class _Sequence(Sequence[T]):
 # Body ----
 __Body = None
 
-from typing import Union, List, Any
-import pandas as pd
-from ._tbl_data import DataFrameLike, TblData, _get_cell, _set_cell
+from concurrent.futures import Executor
+from typing import Union, List, Any, Set, Tuple, TYPE_CHECKING
+from ._tbl_data import (
+    DataFrameLike,
+    TblData,
+    _eval_format_expr,
+    _factorize_column,
+    _get_column_values,
+    _set_column_values,
+    copy_frame,
+    n_rows,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Values are only deduplicated before formatting if there are at least this many of them, and
+# if the proportion of them that are distinct is at most `_DEDUPE_MAX_DISTINCT_RATIO`
+_DEDUPE_MIN_VALUES = 100
+_DEDUPE_MAX_DISTINCT_RATIO = 0.5
+
+
+@dataclass
+class FormatStats:
+    """Counts of the values formatted when rendering formats to the table body.
+
+    Values in low-cardinality columns are deduplicated so that each distinct value is formatted
+    only once; `n_cache_hits` is the number of values that reused an earlier result.
+
+    Cells that a later format also applies to aren't formatted by the earlier one (since its
+    results would be overwritten). `n_cells` has the number of cells that each format produced
+    (in the order of the table's formats), and `n_shadowed` is the number of cells skipped.
+    """
+
+    n_values: int = 0
+    n_formatted: int = 0
+    n_deduped_columns: int = 0
+    n_cells: List[int] = field(default_factory=list)
+    n_shadowed: int = 0
+
+    @property
+    def n_cache_hits(self) -> int:
+        return self.n_values - self.n_formatted
+
+    def add(self, other: FormatStats):
+        """Add the counts of values formatted in `other` (e.g., for a single column)."""
+        self.n_values += other.n_values
+        self.n_formatted += other.n_formatted
+        self.n_deduped_columns += other.n_deduped_columns
 
 
 # TODO: it seems like this could just be a DataFrameLike object?
@@ -144,18 +218,81 @@ class Body:
 
     def __init__(self, body: Union[pd.DataFrame, TblData]):
         self.body = body
+        self.format_stats = FormatStats()
+
+    def copy(self) -> Self:
+        return self.__class__(copy_frame(self.body))
+
+    def render_formats(
+        self,
+        data_tbl: TblData,
+        formats: List[FormatInfo],
+        context: Any,
+        executor: Optional[Executor] = None,
+        rows: Optional[List[int]] = None,
+    ):
+        """Format the cells of the body, for each of the formats in order.
+
+        With `rows=`, only the cells in those rows (e.g., the rows that will be displayed) are
+        formatted; the others are left unformatted.
+        """
+
+        all_rows = list(range(n_rows(data_tbl)))
+        row_set = set(rows) if rows is not None else None
+
+        # Group the cells to format by column, keeping the formats for each column in order
+        col_fmt_rows: Dict[str, List[Tuple[int, List[int]]]] = {}
+
+        for ii, fmt in enumerate(formats):
+            for col, fmt_rows in fmt.cells.resolve_columns():
+                if row_set is not None:
+                    if fmt_rows == all_rows:
+                        fmt_rows = sorted(row_set)
+                    else:
+                        fmt_rows = [row for row in fmt_rows if row in row_set]
+
+                if fmt_rows:
+                    col_fmt_rows.setdefault(col, []).append((ii, fmt_rows))
+
+        # Only the last format for a cell determines its value, so leave out the cells that are
+        # formatted again later
+        n_cells = [0] * len(formats)
+        n_shadowed = 0
+        col_formats: Dict[str, List[Tuple[FormatInfo, List[int]]]] = {}
+
+        for col, fmt_rows_list in col_fmt_rows.items():
+            effective = _drop_shadowed_rows(fmt_rows_list, all_rows)
+
+            for ii, fmt_rows in effective:
+                n_cells[ii] += len(fmt_rows)
 
-    def render_formats(self, data_tbl: TblData, formats: List[FormatInfo], context: Any):
-        for fmt in formats:
-            eval_func = getattr(fmt.func, context, fmt.func.default)
-            if eval_func is None:
-                raise Exception("Internal Error")
-            for col, row in fmt.cells.resolve():
-                result = eval_func(_get_cell(data_tbl, row, col))
-                # TODO: I think that this is very inefficient with polars, so
-                # we could either accumulate results and set them per column, or
-                # could always use a pandas DataFrame inside Body?
-                _set_cell(self.body, row, col, result)
+            n_shadowed += sum(len(fmt_rows) for _, fmt_rows in fmt_rows_list)
+            n_shadowed -= sum(len(fmt_rows) for _, fmt_rows in effective)
+
+            col_formats[col] = [(formats[ii], fmt_rows) for ii, fmt_rows in effective]
+
+        self.format_stats.n_cells = n_cells
+        self.format_stats.n_shadowed = n_shadowed
+
+        # Columns are formatted independently of each other, so they can be formatted
+        # concurrently; the results are set in the body in the same order either way
+        if executor is None:
+            col_results = [
+                _format_column(data_tbl, col, fmt_rows, context)
+                for col, fmt_rows in col_formats.items()
+            ]
+        else:
+            futures = [
+                executor.submit(_format_column, data_tbl, col, fmt_rows, context)
+                for col, fmt_rows in col_formats.items()
+            ]
+            col_results = [future.result() for future in futures]
+
+        for col, (col_values, stats) in zip(col_formats, col_results):
+            for rows, result in col_values:
+                _set_column_values(self.body, col, result, rows=rows)
+
+            self.format_stats.add(stats)
 
         return self
 
@@ -166,12 +303,160 @@ class Body:
         return cls(empty_df)
 
 
+def _drop_shadowed_rows(
+    fmt_rows_list: List[Tuple[int, List[int]]], all_rows: List[int]
+) -> List[Tuple[int, List[int]]]:
+    """Leave out the rows of each format (for a column) that a later format also applies to.
+
+    Formats that have no rows left are dropped; the rest are kept in order.
+    """
+
+    effective: List[Tuple[int, List[int]]] = []
+    covered: Set[int] = set()
+
+    for pos, (ii, rows) in enumerate(reversed(fmt_rows_list)):
+        if covered:
+            rows = [row for row in rows if row not in covered]
+
+            if not rows:
+                continue
+
+        effective.append((ii, rows))
+
+        # Once all of the rows are covered, all of the formats before are shadowed
+        if rows == all_rows:
+            break
+
+        # The rows covered by the earliest format aren't needed
+        if pos < len(fmt_rows_list) - 1:
+            covered.update(rows)
+
+            if len(covered) == len(all_rows):
+                break
+
+    return effective[::-1]
+
+
+def _format_column(
+    data_tbl: TblData, col: str, fmt_rows: List[Tuple[FormatInfo, List[int]]], context: Any
+) -> Tuple[List[Tuple[Optional[List[int]], Any]], FormatStats]:
+    """Format the values of a column, for each of the formats (and rows) that apply to it.
+
+    Returns the formatted values to set in the body in order, each with their row positions
+    (`None` for the whole column), along with counts of the values formatted. This doesn't modify
+    anything, so columns can be formatted concurrently.
+    """
+
+    all_rows = list(range(n_rows(data_tbl)))
+    stats = FormatStats()
+    col_values: List[Tuple[Optional[List[int]], Any]] = []
+
+    # The values of the column and codes for its distinct values, computed when first needed
+    values: Optional[List[Any]] = None
+    codes: Optional[np.ndarray] = None
+    has_codes = False
+
+    for fmt, rows in fmt_rows:
+        batch_func = fmt.func.get_batch(context)
+        expr_func = fmt.func.get_expr(context)
+
+        # Format whole columns within the data frame library, if it's supported
+        if expr_func is not None and rows == all_rows:
+            expr_result = _eval_format_expr(data_tbl, col, expr_func)
+
+            if expr_result is not None:
+                result, inexact_rows = expr_result
+                col_values.append((None, result))
+
+                stats.n_values += len(result)
+                stats.n_formatted += len(result)
+
+                # Values that couldn't be formatted exactly are formatted in Python
+                if inexact_rows:
+                    if values is None:
+                        values = _get_column_values(data_tbl, col)
+
+                    inexact_result = batch_func([values[row] for row in inexact_rows])
+                    col_values.append((inexact_rows, inexact_result))
+
+                continue
+
+        if values is None:
+            values = _get_column_values(data_tbl, col)
+
+        if len(rows) >= _DEDUPE_MIN_VALUES and not has_codes:
+            codes = _factorize_column(data_tbl, col)
+            has_codes = True
+
+        if rows == all_rows:
+            result = _format_values(batch_func, values, codes, stats)
+            col_values.append((None, result))
+        else:
+            result = _format_values(
+                batch_func,
+                [values[row] for row in rows],
+                codes[rows] if codes is not None else None,
+                stats,
+            )
+            col_values.append((rows, result))
+
+    return col_values, stats
+
+
+def _format_values(
+    batch_func: BatchFormatFn,
+    values: List[Any],
+    codes: Optional[np.ndarray],
+    stats: FormatStats,
+) -> List[Any]:
+    """Format values, formatting each distinct value only once if there are few of them."""
+
+    stats.n_values += len(values)
+
+    if codes is not None and len(values) >= _DEDUPE_MIN_VALUES:
+        import numpy as np
+
+        distinct_codes, first_idx, inverse = np.unique(
+            codes, return_index=True, return_inverse=True
+        )
+
+        if len(distinct_codes) <= _DEDUPE_MAX_DISTINCT_RATIO * len(values):
+            # Missing values all share the same code (which sorts first) but could be
+            # formatted differently (e.g., `None` and `nan`), so they're formatted individually
+            has_missing = distinct_codes[0] < 0
+            present_idx = first_idx[1:] if has_missing else first_idx
+
+            distinct_result = list(batch_func([values[ii] for ii in present_idx.tolist()]))
+
+            if has_missing:
+                distinct_result.insert(0, None)
+
+            result = [distinct_result[ii] for ii in inverse.ravel().tolist()]
+
+            stats.n_formatted += len(present_idx)
+            stats.n_deduped_columns += 1
+
+            if has_missing:
+                missing_idx = np.flatnonzero(codes < 0).tolist()
+                missing_result = batch_func([values[ii] for ii in missing_idx])
+
+                for ii, x_formatted in zip(missing_idx, missing_result):
+                    result[ii] = x_formatted
+
+                stats.n_formatted += len(missing_idx)
+
+            return result
+
+    stats.n_formatted += len(values)
+
+    return batch_func(values)
+
+
 # Boxhead ----
 __Boxhead = None
 
 from typing import Optional, List
 from enum import Enum, auto
-import pandas as pd
 
 from ._tbl_data import TblData, get_column_names
 
@@ -666,7 +951,6 @@ class GroupRows(_Sequence[GroupRowInfo]):
 
 # Spanners ----
 __Spanners = None
-import pandas as pd
 
 
 @dataclass(frozen=True)
@@ -821,19 +1105,69 @@ from typing import Any, Callable, TypeVar, Union, List, Optional, Tuple
 from ._tbl_data import n_rows
 
 FormatFn = Callable[[Any], str]
+BatchFormatFn = Callable[[List[Any]], List[str]]
+ExprFormatFn = Callable[[Any, Any], Optional[Tuple[Any, Any]]]
 
 
 class FormatFns:
+    """Functions for formatting values in different output contexts.
+
+    The optional `batch` function formats a list of values at once, giving the same results as
+    applying the `default` function to each value (but faster, e.g., by using NumPy).
+
+    The optional `expr` function takes a polars expression for a column and the column's dtype,
+    and returns a polars expression giving the same results as the `default` function, along with
+    a boolean expression that is false for any values that it can't format exactly. It returns
+    `None` if the column can't be formatted with an expression at all.
+    """
+
     html: Optional[FormatFn]
     latex: Optional[FormatFn]
     rtf: Optional[FormatFn]
     default: Optional[FormatFn]
+    batch: Optional[BatchFormatFn]
+    expr: Optional[ExprFormatFn]
 
     def __init__(self, **kwargs: FormatFn):
-        for format in ["html", "latex", "rtf", "default"]:
+        for format in ["html", "latex", "rtf", "default", "batch", "expr"]:
             if kwargs.get(format):
                 setattr(self, format, kwargs[format])
 
+    def get_batch(self, context: str) -> BatchFormatFn:
+        """Get a function that formats a list of values for an output context.
+
+        A function for the context takes precedence over the `batch` function. Functions that
+        format a single value are adapted to format each value in the list.
+        """
+
+        eval_func = getattr(self, context, getattr(self, "default", None))
+        if eval_func is None:
+            raise Exception("Internal Error")
+
+        batch_func = getattr(self, "batch", None)
+
+        if batch_func is not None and eval_func is self.default:
+            return batch_func
+
+        return _scalar_to_batch(eval_func)
+
+    def get_expr(self, context: str) -> Optional[ExprFormatFn]:
+        """Get the `expr` function, if there is one and it applies to an output context."""
+
+        eval_func = getattr(self, context, getattr(self, "default", None))
+
+        if eval_func is self.default:
+            return getattr(self, "expr", None)
+
+        return None
+
+
+def _scalar_to_batch(fn: FormatFn) -> BatchFormatFn:
+    def batch_fn(values: List[Any]) -> List[str]:
+        return [fn(x) for x in values]
+
+    return batch_fn
+
 
 class CellSubset:
     def __init__(self):
@@ -842,6 +1176,15 @@ class CellSubset:
     def resolve(self) -> List[Tuple[str, int]]:
         raise NotImplementedError("Not implemented")
 
+    def resolve_columns(self) -> List[Tuple[str, List[int]]]:
+        """Resolve to the rows in each column (with columns in order of first appearance)."""
+        rows_by_col: Dict[str, List[int]] = {}
+
+        for col, row in self.resolve():
+            rows_by_col.setdefault(col, []).append(row)
+
+        return list(rows_by_col.items())
+
 
 class CellRectangle(CellSubset):
     cols: List[str]
@@ -854,11 +1197,15 @@ class CellRectangle(CellSubset):
     def resolve(self):
         return list((col, row) for col in self.cols for row in self.rows)
 
+    def resolve_columns(self):
+        return [(col, self.rows) for col in self.cols]
+
 
 class FormatInfo:
     """Contains functions for formatting in different contexts, and columns and rows to apply to.
 
-    Note that format functions apply to individual values.
+    Note that format functions apply to individual values (except for a `batch` function, which
+    applies to a list of values).
     """
 
     func: FormatFns
@@ -918,6 +1265,10 @@ class Options:
     table_margin_right: OptionsInfo = OptionsInfo(True, "table", "px", "auto")
     table_background_color: OptionsInfo = OptionsInfo(True, "table", "value", "#FFFFFF")
     table_additional_css: OptionsInfo = OptionsInfo(False, "table", "values", None)
+    table_shared_css: OptionsInfo = OptionsInfo(False, "table", "boolean", False)
+    table_id_from_content: OptionsInfo = OptionsInfo(False, "table", "boolean", False)
+    table_style_classes: OptionsInfo = OptionsInfo(False, "table", "boolean", False)
+    table_minify_html: OptionsInfo = OptionsInfo(False, "table", "boolean", False)
     table_font_names: OptionsInfo = OptionsInfo(False, "table", "values", default_fonts_list)
     table_font_size: OptionsInfo = OptionsInfo(True, "table", "px", "16px")
     table_font_weight: OptionsInfo = OptionsInfo(True, "table", "value", "normal")
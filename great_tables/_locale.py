@@ -1,7 +1,9 @@
 from __future__ import annotations
-from typing import Optional
-import pandas as pd
-import pkg_resources
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+from ._resources import _as_records, _get_resource_bundle
 
 
 class Locale:
@@ -13,83 +15,157 @@ class Locale:
         self._locale = locale
 
 
-def _get_locales_data() -> pd.DataFrame:
-    _x_locales_fname = pkg_resources.resource_filename("great_tables.data", "x_locales.csv")
-    _x_locales_dtype = {
-        "locale": "object",
-        "lang_name": "object",
-        "lang_desc": "object",
-        "script_name": "object",
-        "script_desc": "object",
-        "territory_name": "object",
-        "territory_desc": "object",
-        "variant_name": "object",
-        "variant_desc": "object",
-        "chr_index": "object",
-        "decimal": "object",
-        "group": "object",
-        "percent_sign": "object",
-        "plus_sign": "object",
-        "minus_sign": "object",
-        "approx_sign": "object",
-        "exp_sign": "object",
-        "sup_exp": "object",
-        "per_mille": "object",
-        "infinity": "object",
-        "nan": "object",
-        "approx_pattern": "object",
-        "at_least_pattern": "object",
-        "at_most_pattern": "object",
-        "range_pattern": "object",
-        "decimal_format": "object",
-        "sci_format": "object",
-        "percent_format": "object",
-        "currency_format": "object",
-        "accounting_format": "object",
-        "default_numbering_system": "object",
-        "minimum_grouping_digits": "Int64",
-        "currency_code": "object",
-        "no_table_data_text": "object",
-        "sort_label_text": "object",
-        "filter_label_text": "object",
-        "search_placeholder_text": "object",
-        "page_next_text": "object",
-        "page_previous_text": "object",
-        "page_numbers_text": "object",
-        "page_info_text": "object",
-        "page_size_options_text": "object",
-        "page_next_label_text": "object",
-        "page_previous_label_text": "object",
-        "page_number_label_text": "object",
-        "page_jump_label_text": "object",
-        "page_size_options_label_text": "object",
-    }
-    __x_locales: pd.DataFrame = pd.read_csv(_x_locales_fname, dtype=_x_locales_dtype)
-    return __x_locales
-
-
-def _get_default_locales_data() -> pd.DataFrame:
-    _x_default_locales_fname = pkg_resources.resource_filename(
-        "great_tables.data", "x_default_locales.csv"
-    )
-    _x_default_locales_dtype = {
-        "default_locale": "object",
-        "base_locale": "object",
-    }
-    __x_default_locales: pd.DataFrame = pd.read_csv(
-        _x_default_locales_fname, dtype=_x_default_locales_dtype
-    )
-    return __x_default_locales
-
-
-def _get_currencies_data() -> pd.DataFrame:
-    _x_currencies_fname = pkg_resources.resource_filename("great_tables.data", "x_currencies.csv")
-    _x_currencies_dtype = {
-        "curr_code": "object",
-        "curr_number": "object",
-        "exponent": "object",
-        "curr_name": "object",
-        "symbol": "object",
-    }
-    __x_currencies: pd.DataFrame = pd.read_csv(_x_currencies_fname, dtype=_x_currencies_dtype)
-    return __x_currencies
+def _get_locales_data() -> List[Dict[str, Any]]:
+    return _as_records(_get_resource_bundle()["locales"])
+
+
+def _get_default_locales_data() -> List[Dict[str, Any]]:
+    return _as_records(_get_resource_bundle()["default_locales"])
+
+
+def _get_currencies_data() -> List[Dict[str, Any]]:
+    return _as_records(_get_resource_bundle()["currencies"])
+
+
+@dataclass(frozen=True)
+class LocaleInfo:
+    """Number formatting symbols and defaults for a single locale."""
+
+    locale: str
+    decimal: str
+    group: str
+    percent_sign: str
+    plus_sign: str
+    minus_sign: str
+    currency_code: str
+
+
+def _str_or_empty(x: Any) -> str:
+    # Empty fields in the locales data are missing (`None`) values
+    return x if isinstance(x, str) else ""
+
+
+class LocaleRegistry:
+    """
+    Lookup of locale information by locale id.
+
+    The locales data is read in only once, the first time that it's needed, and is then indexed
+    by locale id. Default locales (e.g., `"en-US"`) map to their base locales (e.g., `"en"`).
+    """
+
+    def __init__(self):
+        self._locales: Optional[Mapping[str, LocaleInfo]] = None
+        self._default_locales: Optional[Mapping[str, str]] = None
+
+    @property
+    def locales(self) -> Mapping[str, LocaleInfo]:
+        if self._locales is None:
+            locales = {
+                row["locale"]: LocaleInfo(
+                    locale=row["locale"],
+                    decimal=_str_or_empty(row["decimal"]),
+                    group=_str_or_empty(row["group"]),
+                    percent_sign=_str_or_empty(row["percent_sign"]),
+                    plus_sign=_str_or_empty(row["plus_sign"]),
+                    minus_sign=_str_or_empty(row["minus_sign"]),
+                    currency_code=_str_or_empty(row["currency_code"]),
+                )
+                for row in _get_locales_data()
+            }
+            self._locales = MappingProxyType(locales)
+
+        return self._locales
+
+    @property
+    def default_locales(self) -> Mapping[str, str]:
+        if self._default_locales is None:
+            self._default_locales = MappingProxyType(
+                {row["default_locale"]: row["base_locale"] for row in _get_default_locales_data()}
+            )
+
+        return self._default_locales
+
+    def normalize(self, locale: str) -> str:
+        """Replace any underscores with hyphens and resolve a default locale to its base."""
+
+        locale = locale.replace("_", "-")
+
+        return self.default_locales.get(locale, locale)
+
+    def is_valid(self, locale: str) -> bool:
+        locale = locale.replace("_", "-")
+
+        return locale in self.locales or locale in self.default_locales
+
+    def get(self, locale: str) -> LocaleInfo:
+        """Get the information for a locale (which may be given as a default locale)."""
+
+        try:
+            return self.locales[self.normalize(locale)]
+        except KeyError:
+            raise ValueError(
+                "The supplied `locale` is not available in the list of supported locales."
+            ) from None
+
+    def list_locales(self) -> List[str]:
+        return list(self.locales)
+
+    def list_default_locales(self) -> List[str]:
+        return list(self.default_locales)
+
+
+_locale_registry = LocaleRegistry()
+
+
+@dataclass(frozen=True)
+class CurrencyInfo:
+    """Symbol and other metadata for a single currency."""
+
+    curr_code: str
+    curr_number: Optional[str]
+    exponent: Optional[int]
+    curr_name: str
+    symbol: str
+
+
+class CurrencyRegistry:
+    """
+    Lookup of currency information by currency code.
+
+    Like `LocaleRegistry`, the currencies data is read in only once, the first time that it's
+    needed.
+    """
+
+    def __init__(self):
+        self._currencies: Optional[Mapping[str, CurrencyInfo]] = None
+
+    @property
+    def currencies(self) -> Mapping[str, CurrencyInfo]:
+        if self._currencies is None:
+            currencies = {
+                row["curr_code"]: CurrencyInfo(
+                    curr_code=row["curr_code"],
+                    curr_number=row["curr_number"] if isinstance(row["curr_number"], str) else None,
+                    exponent=int(row["exponent"]) if isinstance(row["exponent"], str) else None,
+                    curr_name=_str_or_empty(row["curr_name"]),
+                    symbol=_str_or_empty(row["symbol"]),
+                )
+                for row in _get_currencies_data()
+            }
+            self._currencies = MappingProxyType(currencies)
+
+        return self._currencies
+
+    def is_valid(self, currency: str) -> bool:
+        return currency in self.currencies
+
+    def get(self, currency: str) -> CurrencyInfo:
+        try:
+            return self.currencies[currency]
+        except KeyError:
+            raise ValueError(
+                "The supplied `currency` is not available in the list of supported currencies."
+            ) from None
+
+
+_currency_registry = CurrencyRegistry()
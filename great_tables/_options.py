@@ -21,6 +21,10 @@ def tab_options(
     table_margin_right: Optional[str] = None,
     table_background_color: Optional[str] = None,
     table_additional_css: Optional[str] = None,
+    table_shared_css: Optional[bool] = None,
+    table_id_from_content: Optional[bool] = None,
+    table_style_classes: Optional[bool] = None,
+    table_minify_html: Optional[bool] = None,
     table_font_names: Optional[str] = None,
     table_font_size: Optional[str] = None,
     table_font_weight: Optional[str] = None,
@@ -209,6 +213,26 @@ def tab_options(
     table_additional_css
         This option can be used to supply an additional block of CSS rules to be applied after
         the automatically generated table CSS.
+    table_shared_css
+        An option to leave out the table's own `<style>` block and instead rely on a stylesheet
+        that is shared by all tables with the same styling options. The table's container is given
+        a class that identifies its styling options, and the shared stylesheet can be generated
+        (once per document) with [`shared_stylesheet()`](`great_tables.shared_stylesheet`). This
+        is `False` by default.
+    table_id_from_content
+        When no table ID has been set, an option to derive the ID from a fingerprint of the
+        table's data and specification (see [`GT.fingerprint()`](`great_tables.GT.fingerprint`))
+        instead of generating a random one. Rendering the same table then always gives the same
+        output, which makes it cacheable. This is `False` by default.
+    table_style_classes
+        An option to style body cells with CSS classes rather than inline `style` attributes. Each
+        distinct set of cell styles gets a class in the table's `<style>` block, which can make the
+        HTML for heavily styled tables (e.g., those made with `data_color()`) much smaller. This is
+        `False` by default.
+    table_minify_html
+        An option to leave out the newlines and indentation between the HTML elements of the
+        rendered table, which makes the output smaller without changing how it displays. This is
+        `False` by default.
     table_font_names
         The names of the fonts used for the table. This should be provided as a list of font
         names. If the first font isn't available, then the next font is tried (and so on).
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import pickle
+import zlib
+from functools import lru_cache
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+# The locales, currencies, and SCSS template that are needed to format and style tables are packed
+# into a single bundle (a compressed, pickled dict), so that they can be loaded without any CSV
+# parsing. The bundle is generated from the files in the package by running `make resources`, and
+# needs to be regenerated whenever those files change.
+RESOURCE_BUNDLE = "resources.pickle"
+
+# Pickle protocol 4 can be read by all supported versions of Python
+_PICKLE_PROTOCOL = 4
+
+# The tables in the bundle, with the CSV files (relative to the package directory) that they come
+# from and the columns that are kept; each table is stored as a dict of columns (lists of strings),
+# with missing values as `None`
+_BUNDLE_TABLES: Dict[str, Tuple[str, List[str]]] = {
+    "locales": (
+        "data/x_locales.csv",
+        ["locale", "decimal", "group", "percent_sign", "plus_sign", "minus_sign", "currency_code"],
+    ),
+    "default_locales": ("data/x_default_locales.csv", ["default_locale", "base_locale"]),
+    "currencies": (
+        "data/x_currencies.csv",
+        ["curr_code", "curr_number", "exponent", "curr_name", "symbol"],
+    ),
+}
+
+# The text files in the bundle (relative to the package directory), stored as strings
+_BUNDLE_TEXT_FILES: List[str] = ["css/gt_styles_default.scss"]
+
+
+def _open_resource(package: str, name: str) -> IO[bytes]:
+    """Open a file in one of the package's directories for reading (in binary mode)."""
+
+    import importlib.resources
+
+    # `importlib.resources.files()` is only available from Python 3.9 onward
+    if not hasattr(importlib.resources, "files"):
+        return importlib.resources.open_binary(package, name)
+
+    return importlib.resources.files(package).joinpath(name).open("rb")
+
+
+def _read_csv_columns(path: str, columns: List[str]) -> Dict[str, List[Optional[str]]]:
+    import pandas as pd
+
+    df = pd.read_csv(path, dtype=object, usecols=columns)
+
+    return {col: [None if pd.isna(x) else x for x in df[col].tolist()] for col in columns}
+
+
+def _as_records(table: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Convert a table in the resource bundle (a dict of columns) to a list of records."""
+
+    return [dict(zip(table, values)) for values in zip(*table.values())]
+
+
+def _build_resource_bundle() -> Dict[str, Any]:
+    """Read the files that go into the resource bundle (from the package's source directory)."""
+
+    import os
+
+    pkg_dir = os.path.dirname(__file__)
+
+    bundle: Dict[str, Any] = {
+        table: _read_csv_columns(os.path.join(pkg_dir, fname), columns)
+        for table, (fname, columns) in _BUNDLE_TABLES.items()
+    }
+
+    text_files: Dict[str, str] = {}
+
+    for fname in _BUNDLE_TEXT_FILES:
+        with open(os.path.join(pkg_dir, fname), encoding="utf-8") as f:
+            text_files[fname] = f.read()
+
+    bundle["text_files"] = text_files
+
+    return bundle
+
+
+def _write_resource_bundle(path: Optional[str] = None) -> str:
+    """Generate the resource bundle, and write it next to this module (by default)."""
+
+    import os
+
+    if path is None:
+        path = os.path.join(os.path.dirname(__file__), RESOURCE_BUNDLE)
+
+    with open(path, "wb") as f:
+        f.write(zlib.compress(pickle.dumps(_build_resource_bundle(), protocol=_PICKLE_PROTOCOL), 9))
+
+    return path
+
+
+@lru_cache(maxsize=None)
+def _get_resource_bundle() -> Dict[str, Any]:
+    """Load the resource bundle (only once)."""
+
+    with _open_resource("great_tables", RESOURCE_BUNDLE) as f:
+        return pickle.loads(zlib.decompress(f.read()))
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-import pkg_resources
+import hashlib
 import re
-import webcolors as wc
 
 from dataclasses import fields
-from functools import partial
-from typing import Optional
+from functools import lru_cache, partial
+from typing import Any, Optional, Tuple
 from string import Template
+from typing_extensions import TypeAlias
 
 from ._gt_data import GTData
+from ._resources import _get_resource_bundle
 from ._utils import _as_css_font_family_attr, _unique_set
 
 DEFAULTS_TABLE_BACKGROUND = (
@@ -40,6 +41,8 @@ FONT_COLOR_VARS = (
 
 
 def font_color(color: str, table_font_color: str, table_font_color_light: str):
+    import webcolors as wc
+
     if color.startswith("#"):
         rgb = wc.hex_to_rgb(color)
     elif color.startswith("rgb") and "%" in color:
@@ -66,14 +69,107 @@ def css_add(value: str | int, amount: int):
         raise NotImplementedError(f"Unable to add to CSS value: {value}")
 
 
-def compile_scss(data: GTData, id: Optional[str], compress: bool = True) -> str:
-    """Return CSS for styling a table, based on options set."""
+# SCSS-relevant options as a hashable tuple of (name, value) pairs
+ScssParams: TypeAlias = Tuple[Tuple[str, Any], ...]
+
+# The maximum number of compiled stylesheets to keep in the process-level cache
+SCSS_CACHE_MAXSIZE = 128
+
+
+def compile_scss(
+    data: GTData, id: Optional[str], compress: bool = True, shared: bool = False
+) -> str:
+    """Return CSS for styling a table, based on options set.
+
+    With `shared=True`, the CSS is scoped to a class derived from the table's styling options (see
+    `get_shared_css_class()`) instead of the table id, so it can be shared by all tables that have
+    the same options.
+    """
+
+    params, font_names = _get_scss_key(data)
+
+    if shared:
+        selector = "." + _shared_css_class(params=params, font_names=font_names)
+    elif id is not None:
+        selector = f"#{id}"
+    else:
+        selector = None
+
+    return _compile_scss(params=params, font_names=font_names, selector=selector, compress=compress)
+
+
+def get_shared_css_class(data: GTData) -> str:
+    """Return the class name that scopes the shared CSS for a table's styling options."""
+
+    params, font_names = _get_scss_key(data)
+
+    return _shared_css_class(params=params, font_names=font_names)
+
+
+def clear_scss_cache() -> None:
+    """Clear the process-level cache of compiled CSS."""
+
+    _compile_scss.cache_clear()
+
+
+def _get_scss_key(data: GTData) -> Tuple[ScssParams, Optional[Tuple[str, ...]]]:
+    """Return the options that the compiled CSS depends on, in a hashable form."""
 
     # Obtain the SCSS options dictionary
     options = {field.name: getattr(data._options, field.name) for field in fields(data._options)}
 
     # Get collection of parameters that pertain to SCSS ----
-    params = {k: opt.value for k, opt in options.items() if opt.scss and opt.value is not None}
+    # These (along with the table fonts and the CSS selector) are the only inputs to the compiled
+    # CSS, so they are used as the key for caching the result
+    params = tuple(
+        (k, _as_hashable(opt.value))
+        for k, opt in options.items()
+        if opt.scss and opt.value is not None
+    )
+
+    font_names = _as_hashable(data._options.table_font_names.value)
+
+    return params, font_names
+
+
+def _shared_css_class(params: ScssParams, font_names: Optional[Tuple[str, ...]]) -> str:
+    # Use a digest of the options (rather than `hash()`, which varies across processes) so that
+    # the class name is stable
+    fingerprint = hashlib.sha1(repr((params, font_names)).encode("utf-8")).hexdigest()[:10]
+
+    return f"gt_css_{fingerprint}"
+
+
+def _as_hashable(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(value)
+
+    return value
+
+
+@lru_cache(maxsize=None)
+def _get_scss_template(compress: bool) -> str:
+    """Return the contents of the default SCSS template (compressed, if requested)."""
+
+    gt_styles_default = _get_resource_bundle()["text_files"]["css/gt_styles_default.scss"]
+
+    if compress:
+        gt_styles_default = re.sub(r"\s+", " ", gt_styles_default, 0, re.MULTILINE)
+        gt_styles_default = re.sub(r"}", "}\n", gt_styles_default, 0, re.MULTILINE)
+
+    return gt_styles_default
+
+
+@lru_cache(maxsize=SCSS_CACHE_MAXSIZE)
+def _compile_scss(
+    params: ScssParams,
+    font_names: Optional[Tuple[str, ...]],
+    selector: Optional[str],
+    compress: bool,
+) -> str:
+    """Compile the SCSS template to CSS (results are cached on the hashable inputs)."""
+
+    params = dict(params)
     scss_defaults = {k: params.get("table_background_color") for k in DEFAULTS_TABLE_BACKGROUND}
     scss_params = {**scss_defaults, **params}
 
@@ -96,8 +192,8 @@ def compile_scss(data: GTData, id: Optional[str], compress: bool = True) -> str:
     }
 
     # Handle table id ----
-    # Determine whether the table has an ID
-    has_id = id is not None
+    # Determine whether the styles are scoped to a selector (the table's ID or a shared class)
+    has_selector = selector is not None
 
     # Obtain the `table_id` value (might be set, might be None)
     # table_id = data._options._get_option_value(option="table_id")
@@ -106,7 +202,7 @@ def compile_scss(data: GTData, id: Optional[str], compress: bool = True) -> str:
 
     # Handle fonts ----
     # Get the unique list of fonts from `gt_options_dict`
-    font_list = _unique_set(data._options.table_font_names.value)
+    font_list = _unique_set(font_names)
 
     # Generate a `font-family` string
     if font_list is not None:
@@ -115,7 +211,7 @@ def compile_scss(data: GTData, id: Optional[str], compress: bool = True) -> str:
         font_family_attr = ""
 
     # Generate styles ----
-    gt_table_open_str = f"#{id} table" if has_id else ".gt_table"
+    gt_table_open_str = f"{selector} table" if has_selector else ".gt_table"
 
     gt_table_class_str = f"""{gt_table_open_str} {{
           {font_family_attr}
@@ -123,22 +219,14 @@ def compile_scss(data: GTData, id: Optional[str], compress: bool = True) -> str:
           -moz-osx-font-smoothing: grayscale;
         }}"""
 
-    gt_styles_default_file = open(
-        pkg_resources.resource_filename("great_tables", "css/gt_styles_default.scss")
-    )
-
-    gt_styles_default = gt_styles_default_file.read()
-
-    if compress:
-        gt_styles_default = re.sub(r"\s+", " ", gt_styles_default, 0, re.MULTILINE)
-        gt_styles_default = re.sub(r"}", "}\n", gt_styles_default, 0, re.MULTILINE)
+    gt_styles_default = _get_scss_template(compress=compress)
 
     compiled_css = Template(gt_styles_default).substitute(final_params)
 
-    if has_id:
-        compiled_css = re.sub(r"\.gt_", f"#{id} .gt_", compiled_css, 0, re.MULTILINE)
-        compiled_css = re.sub(r"thead", f"#{id} thead", compiled_css, 0, re.MULTILINE)
-        compiled_css = re.sub(r"^( p|p) \{", f"#{id} p {{", compiled_css, 0, re.MULTILINE)
+    if has_selector:
+        compiled_css = re.sub(r"\.gt_", f"{selector} .gt_", compiled_css, 0, re.MULTILINE)
+        compiled_css = re.sub(r"thead", f"{selector} thead", compiled_css, 0, re.MULTILINE)
+        compiled_css = re.sub(r"^( p|p) \{", f"{selector} p {{", compiled_css, 0, re.MULTILINE)
 
     finalized_css = f"{gt_table_class_str}\n\n{compiled_css}"
 
@@ -1,5 +1,9 @@
-import pandas as pd
-from typing import Dict, Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class Cell:
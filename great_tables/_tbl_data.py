@@ -3,7 +3,7 @@ from __future__ import annotations
 import warnings
 
 from functools import singledispatch
-from typing import Any, Dict, List, Union, Callable, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple, TYPE_CHECKING
 from typing_extensions import TypeAlias
 
 from ._databackend import AbstractBackend
@@ -172,6 +172,160 @@ def _(data, row, col):
     return data.iloc[row, col_ii]
 
 
+# _get_column_values ----
+
+
+@singledispatch
+def _get_column_values(
+    data: DataFrameLike, column: str, start: int = 0, stop: int | None = None
+) -> List[Any]:
+    """Get a list of the values in a column, optionally for a range of row positions"""
+
+    _raise_not_implemented(data)
+
+
+@_get_column_values.register(PlDataFrame)
+def _(data, column: str, start: int = 0, stop: int | None = None) -> List[Any]:
+    return data[column][start:stop].to_list()
+
+
+@_get_column_values.register(PdDataFrame)
+def _(data, column: str, start: int = 0, stop: int | None = None) -> List[Any]:
+    return data[column].iloc[start:stop].tolist()
+
+
+# _factorize_column ----
+
+# types (as inferred by pandas) of the values in object columns that can be factorized
+_FACTORIZE_TYPES = ("string", "bytes", "integer", "boolean", "date")
+
+
+def _has_negative_zero(values: "np.ndarray") -> bool:
+    import numpy as np
+
+    # -0.0 is equal to 0.0 but a formatter could distinguish them (e.g., `str(-0.0)` is "-0.0")
+    return bool(np.any((values == 0) & np.signbit(values)))
+
+
+@singledispatch
+def _factorize_column(data: DataFrameLike, column: str) -> Optional["np.ndarray"]:
+    """Get integer codes for the distinct values in a column
+
+    Equal values get the same code and missing values get a code of -1. Returns None if the
+    values in the column can't be reliably compared for equality.
+    """
+
+    _raise_not_implemented(data)
+
+
+@_factorize_column.register(PdDataFrame)
+def _(data, column: str) -> Optional["np.ndarray"]:
+    import pandas as pd
+
+    col = data[column]
+
+    # object columns can hold values of mixed types that compare as equal but don't format
+    # the same way (e.g., `1` and `True`), so only factorize those with values of one type
+    if col.dtype == object and pd.api.types.infer_dtype(col, skipna=True) not in _FACTORIZE_TYPES:
+        return None
+
+    if pd.api.types.is_float_dtype(col.dtype):
+        if _has_negative_zero(col.to_numpy(dtype="float64", na_value=float("nan"))):
+            return None
+
+    codes, _ = pd.factorize(col, sort=False)
+
+    return codes
+
+
+@_factorize_column.register(PlDataFrame)
+def _(data, column: str) -> Optional["np.ndarray"]:
+    import polars as pl
+
+    col = data[column]
+
+    if col.dtype == pl.Object:
+        return None
+
+    if col.dtype.is_float() and _has_negative_zero(col.to_numpy()):
+        return None
+
+    # a dense ranking gives equal values the same rank (and missing values a null rank)
+    ranks = col.rank("dense")
+
+    return ranks.fill_null(0).to_numpy().astype("int64") - 1
+
+
+# _get_column_na_mask ----
+
+
+@singledispatch
+def _get_column_na_mask(data: DataFrameLike, column: str) -> "np.ndarray":
+    """Get a boolean array that is True for the missing values in a column
+
+    Values are considered missing in the same way as they are by `is_na()`.
+    """
+
+    _raise_not_implemented(data)
+
+
+@_get_column_na_mask.register(PdDataFrame)
+def _(data, column: str) -> "np.ndarray":
+    return data[column].isna().to_numpy(dtype=bool)
+
+
+@_get_column_na_mask.register(PlDataFrame)
+def _(data, column: str) -> "np.ndarray":
+    # polars NaN values are not nulls (and `is_na()` doesn't treat them as missing either)
+    return data[column].is_null().to_numpy()
+
+
+# _eval_format_expr ----
+
+
+@singledispatch
+def _eval_format_expr(
+    data: DataFrameLike, column: str, expr_fn: Callable[[Any, Any], Any]
+) -> Optional[Tuple[SeriesLike, List[int]]]:
+    """Format a column with an expression built by `expr_fn` (see `FormatFns`)
+
+    Returns the formatted values as a Series, along with the row positions of any values that
+    couldn't be formatted exactly with the expression (these still need to be formatted another
+    way). Returns None if the data frame library has no expressions, or if `expr_fn` can't build
+    one for the column.
+    """
+
+    return None
+
+
+@_eval_format_expr.register(PlDataFrame)
+def _(
+    data, column: str, expr_fn: Callable[[Any, Any], Any]
+) -> Optional[Tuple[PlSeries, List[int]]]:
+    import polars as pl
+
+    col = pl.col(column)
+    built = expr_fn(col, data[column].dtype)
+
+    if built is None:
+        return None
+
+    x_formatted, is_exact = built
+
+    # Missing values are left as they are; the expressions are evaluated lazily so that polars
+    # computes any subexpressions they have in common only once
+    res = (
+        data.lazy()
+        .select(
+            pl.when(col.is_null()).then(None).otherwise(x_formatted).alias("x"),
+            is_exact.fill_null(True).alias("is_exact"),
+        )
+        .collect()
+    )
+
+    return res["x"], res["is_exact"].not_().arg_true().to_list()
+
+
 # _set_cell ----
 
 
@@ -193,6 +347,45 @@ def _(data, row: int, column: str, value: Any):
     data[row, column] = value
 
 
+# _set_column_values ----
+
+
+@singledispatch
+def _set_column_values(
+    data: DataFrameLike, column: str, values: List[Any], rows: Optional[List[int]] = None
+):
+    """Set the values in a column (in place), optionally only at some row positions"""
+
+    _raise_not_implemented(data)
+
+
+@_set_column_values.register(PdDataFrame)
+def _(data, column: str, values: List[Any], rows: Optional[List[int]] = None):
+    # TODO: This assumes column names are unique
+    col_indx = data.columns.get_loc(column)
+
+    if rows is None:
+        data.iloc[:, col_indx] = values
+    else:
+        data.iloc[rows, col_indx] = values
+
+
+@_set_column_values.register(PlDataFrame)
+def _(data, column: str, values: List[Any], rows: Optional[List[int]] = None):
+    import polars as pl
+
+    col_indx = data.columns.index(column)
+    dtype = data[column].dtype
+
+    # Values are cast to the column's type, as when setting a single cell
+    new_values = pl.Series(column, values, dtype=dtype, strict=False)
+
+    if rows is not None:
+        new_values = data[column].clone().scatter(rows, new_values)
+
+    data.replace_column(col_indx, new_values)
+
+
 # _get_column_dtype ----
 
 
@@ -410,6 +603,85 @@ def _(df: PlDataFrame, replacement: PlDataFrame):
     return df.select(exprs)
 
 
+@singledispatch
+def _replace_null_body_rows(body: DataFrameLike, data: DataFrameLike, rows: range) -> DataFrameLike:
+    """Return the body rows at positions `rows`, with null values replaced with the data as strings
+
+    This gives the same rows as `replace_null_frame(body, cast_frame_to_string(data))`, but only
+    the rows of the data that are needed are cast to strings.
+    """
+    raise NotImplementedError(f"Unsupported type: {type(body)}")
+
+
+@_replace_null_body_rows.register
+def _(body: PdDataFrame, data: PdDataFrame, rows: range):
+    body_rows = body.iloc[rows.start : rows.stop]
+
+    # null values are replaced by index label, so only the data rows with the same labels are
+    # needed (if the labels are unique)
+    if data.index.is_unique:
+        data = data.loc[body_rows.index]
+
+    return replace_null_frame(body_rows, cast_frame_to_string(data))
+
+
+@_replace_null_body_rows.register
+def _(body: PlDataFrame, data: PlDataFrame, rows: range):
+    body_rows = body.slice(rows.start, len(rows))
+
+    return replace_null_frame(body_rows, cast_frame_to_string(data.slice(rows.start, len(rows))))
+
+
+# hash_frame ----
+
+
+@singledispatch
+def hash_frame(df: DataFrameLike) -> bytes:
+    """Return a digest of the column names, dtypes, and values of a DataFrame
+
+    The digest is the same for DataFrames with equal contents, and is computed from the hashes
+    that the DataFrame library produces for whole columns (rather than from each cell value).
+    """
+    raise NotImplementedError(f"Unsupported type: {type(df)}")
+
+
+@hash_frame.register
+def _(df: PdDataFrame) -> bytes:
+    import hashlib
+    from pandas.util import hash_pandas_object
+
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(repr((list(df.columns), [str(dtype) for dtype in df.dtypes])).encode())
+
+    for ii in range(df.shape[1]):
+        col = df.iloc[:, ii]
+
+        # object columns can hold unhashable values (e.g., lists), so hash their string forms
+        try:
+            col_hashes = hash_pandas_object(col, index=False)
+        except TypeError:
+            col_hashes = hash_pandas_object(col.astype(str), index=False)
+
+        hasher.update(col_hashes.to_numpy().tobytes())
+
+    return hasher.digest()
+
+
+@hash_frame.register
+def _(df: PlDataFrame) -> bytes:
+    import hashlib
+
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(repr((df.columns, [str(dtype) for dtype in df.dtypes], df.height)).encode())
+
+    if df.width:
+        # a fixed seed makes the row hashes reproducible (for a given version of polars)
+        row_hashes = df.hash_rows(seed=0)
+        hasher.update(row_hashes.to_numpy().tobytes())
+
+    return hasher.digest()
+
+
 @singledispatch
 def to_list(ser: SeriesLike) -> List[Any]:
     raise NotImplementedError(f"Unsupported type: {type(ser)}")
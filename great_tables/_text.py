@@ -1,7 +1,5 @@
 from typing import Union, List
 import html
-
-import commonmark
 import re
 
 
@@ -37,6 +35,8 @@ class StringBuilder:
 
 
 def _md_html(x: str) -> str:
+    import commonmark
+
     str = commonmark.commonmark(x)
     return re.sub(r"^<p>|</p>\n$", "", str)
 
@@ -1,7 +1,12 @@
-from typing import Optional, Union, List, Any
-import pandas as pd
+from typing import Optional, Union, List, Any, Dict
+from dataclasses import fields, is_dataclass
+from enum import Enum
+import functools
 import json
 import re
+import types
+
+from ._tbl_data import DataFrameLike, PdDataFrame, PdSeries, hash_frame
 
 
 def heading_has_title(title: Optional[str]) -> bool:
@@ -86,8 +91,12 @@ def _object_as_dict(v: Any) -> Any:
         return v.object_as_dict()
     except Exception:
         pass
-    if type(v) == pd.DataFrame:
-        return v.to_dict()
+    if isinstance(v, PdDataFrame):
+        # pandas has been imported if the object is a pandas DataFrame
+        import pandas as pd
+
+        if type(v) == pd.DataFrame:
+            return v.to_dict()
     if type(v) in [tuple, list]:
         return list(_object_as_dict(i) for i in v)
     if type(v) == dict:
@@ -109,6 +118,99 @@ def prettify_gt_object(v: Any) -> str:
     return json.dumps(_object_as_dict(v), indent=2)
 
 
+_HASH_SCALAR_TYPES = (bool, int, float, complex, str, bytes)
+
+
+def _is_scalar_dataclass(v: Any) -> bool:
+    if not is_dataclass(v) or isinstance(v, type):
+        return False
+
+    return all(
+        val is None or isinstance(val, (_HASH_SCALAR_TYPES, Enum))
+        for val in (getattr(v, field.name) for field in fields(v))
+    )
+
+
+def _update_hash(hasher: Any, v: Any, _seen: Optional[Dict[int, Any]] = None) -> None:
+    """Feed a stable representation of an object into a hashlib hasher
+
+    Unlike `repr()`, the representation doesn't include memory addresses, so that equal objects
+    give equal hashes across processes. Functions are represented by their names, code, default
+    arguments, and the values they close over (e.g., the options of a `fmt_*()` method).
+    """
+    if _seen is None:
+        _seen = {}
+
+    hasher.update(type(v).__qualname__.encode())
+
+    # scalars, enums, and dataclasses holding only those (e.g., the `RowInfo` of each row in the
+    # stub) have a repr that is stable and cheap to compute
+    if v is None or isinstance(v, _HASH_SCALAR_TYPES) or _is_scalar_dataclass(v):
+        hasher.update(repr(v).encode())
+        return
+
+    # guard against reference cycles (e.g., a recursive function in its own closure), and hash
+    # objects that are referenced more than once only once; the objects themselves are kept in
+    # `_seen` for the whole walk, since the ID of a temporary object that has been freed (e.g., one
+    # of the lists made below) could otherwise be reused by a different object
+    if id(v) in _seen:
+        hasher.update(b"<seen>")
+        return
+    _seen[id(v)] = v
+
+    if isinstance(v, DataFrameLike):
+        hasher.update(hash_frame(v))
+    elif isinstance(v, PdSeries):
+        hasher.update(hash_frame(v.to_frame()))
+    elif isinstance(v, (list, tuple)):
+        hasher.update(str(len(v)).encode())
+
+        # long lists of scalars (e.g., the row indices of a format) are hashed in one go
+        if all(type(el) in _HASH_SCALAR_TYPES for el in v):
+            hasher.update(repr(v).encode())
+            return
+
+        for el in v:
+            _update_hash(hasher, el, _seen)
+    elif isinstance(v, dict):
+        hasher.update(str(len(v)).encode())
+        for key, val in v.items():
+            _update_hash(hasher, key, _seen)
+            _update_hash(hasher, val, _seen)
+    elif isinstance(v, (set, frozenset)):
+        hasher.update(repr(sorted(repr(el) for el in v)).encode())
+    elif isinstance(v, functools.partial):
+        _update_hash(hasher, [v.func, v.args, v.keywords], _seen)
+    elif isinstance(v, types.FunctionType):
+        hasher.update(f"{v.__module__}.{v.__qualname__}".encode())
+        _update_hash(hasher, v.__code__, _seen)
+        closure = [_cell_contents(cell) for cell in v.__closure__ or ()]
+        _update_hash(hasher, [v.__defaults__, v.__kwdefaults__, closure], _seen)
+    elif isinstance(v, types.CodeType):
+        hasher.update(v.co_code)
+        _update_hash(hasher, [v.co_names, v.co_consts], _seen)
+    elif isinstance(v, types.MethodType):
+        _update_hash(hasher, [v.__func__, v.__self__], _seen)
+    elif isinstance(v, (types.BuiltinFunctionType, type)):
+        hasher.update(f"{getattr(v, '__module__', '')}.{v.__qualname__}".encode())
+    elif isinstance(v, types.ModuleType):
+        # modules (e.g., one imported inside of a function and captured in a closure) are
+        # represented by their names, rather than by everything they contain
+        hasher.update(v.__name__.encode())
+    elif hasattr(v, "__dict__"):
+        _update_hash(hasher, vars(v), _seen)
+    else:
+        hasher.update(repr(v).encode())
+
+
+def _cell_contents(cell: Any) -> Any:
+    # a closure cell is empty when its variable hasn't been assigned yet
+    try:
+        return cell.cell_contents
+    except ValueError:
+        return None
+
+
 def _collapse_list_elements(lst, separator=""):
     """
     Concatenates all elements of a list into a single string, separated by a given separator.
@@ -1,15 +1,24 @@
 from great_tables._spanners import spanners_print_matrix, seq_groups
-from ._gt_data import GTData
-from ._tbl_data import n_rows, _get_cell, cast_frame_to_string, replace_null_frame
-from typing import List, Any, cast
-from htmltools import tags, HTML, css, TagList
+from ._gt_data import GTData, StyleInfo, Styles
+from ._tbl_data import (
+    n_rows,
+    _get_column_values,
+    _replace_null_body_rows,
+    cast_frame_to_string,
+    replace_null_frame,
+)
+from typing import Dict, Iterator, List, Optional, Tuple, Any, cast
+from htmltools import tags, HTML, css, Tag, TagList
 from itertools import groupby, chain
 from ._text import StringBuilder, _process_text, _process_text_id
 
 
-def create_heading_component_h(data: GTData) -> StringBuilder:
+def create_heading_component_h(data: GTData, minify: bool = False) -> StringBuilder:
     result = StringBuilder()
 
+    # Newlines and indentation are left out of minified output
+    eol, ind = ("", "") if minify else ("\n", "  ")
+
     title = data._heading.title
     subtitle = data._heading.subtitle
 
@@ -29,22 +38,24 @@ def create_heading_component_h(data: GTData) -> StringBuilder:
         stub=data._stub, row_groups=data._row_groups, options=data._options
     )
 
-    result.append(
-        f"""  <tr>
-    <th colspan="{n_cols_total}" class="gt_heading gt_title gt_font_normal">{title}
-  </tr>"""
+    title_row = (
+        f'{ind}<tr>{eol}{ind * 2}<th colspan="{n_cols_total}" '
+        f'class="gt_heading gt_title gt_font_normal">{title}{eol}{ind}</tr>'
     )
+    result.append(title_row)
 
     if has_subtitle:
-        subtitle_row = f"""  <tr>
-    <th colspan="{n_cols_total}" class="gt_heading gt_subtitle gt_font_normal gt_bottom_border">{subtitle}
-  </tr>"""
-        result.append(f"\n{subtitle_row}")
+        subtitle_row = (
+            f'{ind}<tr>{eol}{ind * 2}<th colspan="{n_cols_total}" '
+            f'class="gt_heading gt_subtitle gt_font_normal gt_bottom_border">{subtitle}'
+            f"{eol}{ind}</tr>"
+        )
+        result.append(f"{eol}{subtitle_row}")
 
     return StringBuilder('<thead class="gt_header">', result, "</thead>")
 
 
-def create_columns_component_h(data: GTData) -> str:
+def create_columns_component_h(data: GTData, minify: bool = False) -> str:
     """
     Returns the HTML text fragment for the column/spanner labels.
     """
@@ -405,17 +416,65 @@ def create_columns_component_h(data: GTData) -> str:
             table_col_headings,
         )
 
+    if minify:
+        _remove_whitespace(table_col_headings)
+
     return str(table_col_headings)
 
 
-def create_body_component_h(data: GTData) -> str:
+def _remove_whitespace(x: Any) -> None:
+    """
+    Turns off the newlines and indentation that htmltools adds around the children of tags.
+    """
+
+    if isinstance(x, Tag):
+        x.add_ws = False
+        _remove_whitespace(x.children)
+    elif isinstance(x, TagList):
+        for child in x:
+            _remove_whitespace(child)
+
+
+def create_body_component_h(data: GTData, minify: bool = False) -> str:
+    eol = "" if minify else "\n"
+
+    all_body_rows = eol.join(iter_body_rows_h(data, minify=minify))
+
+    return f'<tbody class="gt_table_body">{eol}{all_body_rows}{eol}</tbody>'
+
+
+def iter_body_rows_h(
+    data: GTData,
+    chunk_size: Optional[int] = None,
+    style_classes: Optional[Dict[str, str]] = None,
+    minify: bool = False,
+    rows: Optional[range] = None,
+) -> Iterator[str]:
+    """
+    Yields the HTML text fragment for each row of the table body (one `<tr>` at a time).
+
+    Cell values are taken from the table `chunk_size` rows at a time (by default, all rows at once).
+    If `style_classes` (from `get_body_style_classes()`) is given, styled cells get the class for
+    their style rather than an inline `style` attribute. With `minify=True`, the rows contain no
+    newlines or indentation. With `rows=`, only the body rows in that range are yielded.
+    """
+
+    eol, ind = ("", "") if minify else ("\n", "  ")
+
     # for now, just coerce everything in the original data to a string
-    # so we can fill in the body data with it
-    _str_orig_data = cast_frame_to_string(data._tbl_data)
-    tbl_data = replace_null_frame(data._body.body, _str_orig_data)
+    # so we can fill in the body data with it (only for the rows that are yielded, if those are
+    # given, in which case the body rows are counted from the start of `rows`)
+    if rows is None:
+        _str_orig_data = cast_frame_to_string(data._tbl_data)
+        tbl_data = replace_null_frame(data._body.body, _str_orig_data)
+
+        rows = range(n_rows(tbl_data))
+    else:
+        tbl_data = _replace_null_body_rows(data._body.body, data._tbl_data, rows)
 
-    # Filter list of StyleInfo to only those that apply to the body (where locname="data")
-    styles_body = [x for x in data._styles if x.locname == "data"]
+    # Index the rendered styles of body cells by (row, column) so that each cell's styles can be
+    # fetched with a single lookup
+    styles_body = _get_body_styles_index(data._styles)
 
     grp_idx_to_label = data._group_rows.indices_map()
 
@@ -434,74 +493,135 @@ def create_body_component_h(data: GTData) -> str:
     if stub_var is not None:
         column_vars = [stub_var] + column_vars
 
-    body_rows: List[str] = []
+    # Determine whether each column is the stub column (this doesn't vary by row)
+    if has_stub_column:
+        is_stub_col = [colinfo.var == stub_var.var for colinfo in column_vars]
+    else:
+        is_stub_col = [False] * len(column_vars)
 
-    for i in range(n_rows(tbl_data)):
-        body_cells: List[str] = []
+    has_group_heading_rows = has_stub_column and has_groups and not has_two_col_stub
 
-        if has_stub_column and has_groups and not has_two_col_stub:
-            colspan_value = data._boxhead._get_effective_number_of_columns(
-                stub=data._stub, row_groups=data._row_groups, options=data._options
-            )
+    if has_group_heading_rows:
+        colspan_value = data._boxhead._get_effective_number_of_columns(
+            stub=data._stub, row_groups=data._row_groups, options=data._options
+        )
 
-            # Generate a row that contains the row group label (this spans the entire row) but
-            # only if `i` indicates there should be a row group label
-            if i in grp_idx_to_label:
-                group_label = grp_idx_to_label[i]
+    if chunk_size is None:
+        chunk_size = max(len(rows), 1)
 
-                group_class = (
-                    "gt_empty_group_heading" if group_label == "" else "gt_group_heading_row"
-                )
+    for start in range(rows.start, rows.stop, chunk_size):
+        stop = min(start + chunk_size, rows.stop)
 
-                body_cells.append(
-                    f"<tr class={group_class}>"
-                    f'  <th class="gt_group_heading" colspan="{colspan_value}">'
-                    + group_label
-                    + "</th></tr>"
-                )
+        # Pull each column's values for this chunk of rows out of the table as a list; rows are
+        # then generated by walking these lists in parallel (this avoids a per-cell lookup in the
+        # DataFrame)
+        column_values = [
+            _get_column_values(tbl_data, colinfo.var, start - rows.start, stop - rows.start)
+            for colinfo in column_vars
+        ]
 
-        for colinfo in column_vars:
-            cell_content: Any = _get_cell(tbl_data, i, colinfo.var)
-            cell_str: str = str(cell_content)
-
-            # Determine whether the current cell is the stub cell
-            if has_stub_column:
-                is_stub_cell = colinfo.var == stub_var.var
-            else:
-                is_stub_cell = False
-
-            # Get alignment for the current column from the `col_alignment` list
-            # by using the `name` value to obtain the index of the alignment value
-            cell_alignment = colinfo.defaulted_align
-
-            # Get the style attributes for the current cell by filtering the
-            # `styles_body` list for the current row and column
-            styles_i = [x for x in styles_body if x.rownum == i and x.colname == colinfo.var]
-
-            # Develop the `style` attribute for the current cell
-            if len(styles_i) > 0:
-                # flatten all StyleInfo.styles lists
-                style_entries = list(chain(*[x.styles for x in styles_i]))
-                rendered_styles = [el._to_html_style() for el in style_entries]
-                cell_styles = f'style="{" ".join(rendered_styles)}"' + " "
-            else:
-                cell_styles = ""
-
-            if is_stub_cell:
-                body_cells.append('  <th class="gt_row gt_left gt_stub">' + cell_str + "</th>")
-            else:
-                body_cells.append(
-                    f'  <td {cell_styles}class="gt_row gt_{cell_alignment}">' + cell_str + "</td>"
-                )
+        for i in range(start, stop):
+            body_cells: List[str] = []
+
+            if has_group_heading_rows:
+                # Generate a row that contains the row group label (this spans the entire row) but
+                # only if `i` indicates there should be a row group label
+                if i in grp_idx_to_label:
+                    group_label = grp_idx_to_label[i]
+
+                    group_class = (
+                        "gt_empty_group_heading" if group_label == "" else "gt_group_heading_row"
+                    )
+
+                    body_cells.append(
+                        f"<tr class={group_class}>"
+                        f'{ind}<th class="gt_group_heading" colspan="{colspan_value}">'
+                        + group_label
+                        + "</th></tr>"
+                    )
 
-        body_rows.append("<tr>\n" + "\n".join(body_cells) + "\n</tr>")
+            for colinfo, is_stub_cell, values in zip(column_vars, is_stub_col, column_values):
+                cell_content: Any = values[i - start]
+                cell_str: str = str(cell_content)
 
-    all_body_rows = "\n".join(body_rows)
+                # Get alignment for the current column from the `col_alignment` list
+                # by using the `name` value to obtain the index of the alignment value
+                cell_alignment = colinfo.defaulted_align
 
-    return f'<tbody class="gt_table_body">\n{all_body_rows}\n</tbody>'
+                # Get the styles for the current cell (if there are any)
+                cell_styles = styles_body.get((i, colinfo.var))
 
+                if cell_styles is None:
+                    cell_attrs = f'class="gt_row gt_{cell_alignment}"'
+                elif style_classes is not None:
+                    cell_attrs = f'class="gt_row gt_{cell_alignment} {style_classes[cell_styles]}"'
+                else:
+                    cell_attrs = f'style="{cell_styles}" class="gt_row gt_{cell_alignment}"'
 
-def create_source_notes_component_h(data: GTData) -> str:
+                if is_stub_cell:
+                    body_cells.append(
+                        ind + '<th class="gt_row gt_left gt_stub">' + cell_str + "</th>"
+                    )
+                else:
+                    body_cells.append(f"{ind}<td {cell_attrs}>" + cell_str + "</td>")
+
+            yield "<tr>" + eol + eol.join(body_cells) + eol + "</tr>"
+
+
+def _get_body_styles_index(styles: Styles) -> Dict[Tuple[int, str], str]:
+    """
+    Returns a dictionary of rendered styles (CSS declarations) for body cells, keyed by (row, column).
+    """
+
+    # Filter list of StyleInfo to only those that apply to the body (where locname="data") and
+    # group them by cell, preserving the order in which they were added
+    styles_by_cell: Dict[Tuple[int, str], List[StyleInfo]] = {}
+
+    for x in styles:
+        if x.locname == "data":
+            styles_by_cell.setdefault((x.rownum, x.colname), []).append(x)
+
+    styles_index: Dict[Tuple[int, str], str] = {}
+
+    for key, styles_i in styles_by_cell.items():
+        # flatten all StyleInfo.styles lists
+        style_entries = list(chain(*[x.styles for x in styles_i]))
+        rendered_styles = [el._to_html_style() for el in style_entries]
+        styles_index[key] = " ".join(rendered_styles)
+
+    return styles_index
+
+
+def get_body_style_classes(styles: Styles) -> Dict[str, str]:
+    """
+    Returns a CSS class name (e.g., `gt_s0`) for each distinct rendered style of body cells.
+
+    Classes are numbered in the order in which their styles first appear in `styles`.
+    """
+
+    style_classes: Dict[str, str] = {}
+
+    for cell_styles in _get_body_styles_index(styles).values():
+        if cell_styles not in style_classes:
+            style_classes[cell_styles] = f"gt_s{len(style_classes)}"
+
+    return style_classes
+
+
+def create_style_classes_css(style_classes: Dict[str, str], id: str) -> str:
+    """
+    Returns the CSS rules for the classes from `get_body_style_classes()`, scoped to the table `id`.
+    """
+
+    # Selecting on both `gt_row` and the style class makes these rules more specific than any
+    # of the table's own rules for body cells (as the inline `style` attribute would be)
+    return "\n".join(
+        f" #{id} .gt_row.{css_class} {{ {cell_styles} }}"
+        for cell_styles, css_class in style_classes.items()
+    )
+
+
+def create_source_notes_component_h(data: GTData, minify: bool = False) -> str:
     source_notes = data._source_notes
 
     # If there are no source notes, then return an empty string
@@ -528,6 +648,12 @@ def create_source_notes_component_h(data: GTData) -> str:
         for note in source_notes:
             note_str = _process_text(note)
 
+            if minify:
+                source_notes_tr.append(
+                    f'<tr><td class="gt_sourcenote" colspan="{n_cols_total}">{note_str}</td></tr>'
+                )
+                continue
+
             source_notes_tr.append(
                 f"""
   <tr>
@@ -536,6 +662,9 @@ def create_source_notes_component_h(data: GTData) -> str:
 """
             )
 
+        if minify:
+            return f'<tfoot class="gt_sourcenotes">{"".join(source_notes_tr)}</tfoot>'
+
         source_notes_joined = "\n".join(source_notes_tr)
 
         source_notes_component = f"""  <tfoot class="gt_sourcenotes">
@@ -557,6 +686,12 @@ def create_source_notes_component_h(data: GTData) -> str:
 
     source_notes_str_joined = separator.join(source_note_list)
 
+    if minify:
+        return (
+            f'<tfoot><tr class="gt_sourcenotes"><td class="gt_sourcenote" colspan="{n_cols_total}">'
+            f'<div style="padding-bottom:2px;">{source_notes_str_joined}</div></td></tr></tfoot>'
+        )
+
     source_notes_component = f"""<tfoot>
   <tr class="gt_sourcenotes">
     <td class="gt_sourcenote" colspan="{n_cols_total}">
@@ -569,7 +704,7 @@ def create_source_notes_component_h(data: GTData) -> str:
     return source_notes_component
 
 
-def create_footnotes_component_h(data: GTData):
+def create_footnotes_component_h(data: GTData, minify: bool = False):
     return ""
 
 
@@ -1,9 +1,26 @@
-import pandas as pd
-import pkg_resources
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    countrypops: pd.DataFrame
+    sza: pd.DataFrame
+    gtcars: pd.DataFrame
+    sp500: pd.DataFrame
+    pizzaplace: pd.DataFrame
+    exibble: pd.DataFrame
+    towny: pd.DataFrame
+    metro: pd.DataFrame
+    constants: pd.DataFrame
+    illness: pd.DataFrame
+    islands: pd.DataFrame
+    airquality: pd.DataFrame
 
 DATA_MOD = "great_tables.data"
 
-_countrypops_fname = pkg_resources.resource_filename(DATA_MOD, "01-countrypops.csv")
+_countrypops_fname = "01-countrypops.csv"
 _countrypops_dtype = {
     "country_name": "object",
     "country_code_2": "object",
@@ -12,7 +29,7 @@ _countrypops_dtype = {
     "population": "Int64",
 }
 
-_sza_fname = pkg_resources.resource_filename(DATA_MOD, "02-sza.csv")
+_sza_fname = "02-sza.csv"
 _sza_dtype = {
     "latitude": "object",
     "month": "object",
@@ -20,7 +37,7 @@ _sza_dtype = {
     "sza": "float64",
 }
 
-_gtcars_fname = pkg_resources.resource_filename(DATA_MOD, "03-gtcars.csv")
+_gtcars_fname = "03-gtcars.csv"
 _gtcars_dtype = {
     "mfr": "object",
     "model": "object",
@@ -39,7 +56,7 @@ _gtcars_dtype = {
     "msrp": "float64",
 }
 
-_sp500_fname = pkg_resources.resource_filename(DATA_MOD, "04-sp500.csv")
+_sp500_fname = "04-sp500.csv"
 _sp500_dtype = {
     "date": "object",
     "open": "float64",
@@ -50,7 +67,7 @@ _sp500_dtype = {
     "adj_close": "float64",
 }
 
-_pizzaplace_fname = pkg_resources.resource_filename(DATA_MOD, "05-pizzaplace.csv")
+_pizzaplace_fname = "05-pizzaplace.csv"
 _pizzaplace_dtype = {
     "id": "object",
     "date": "object",
@@ -61,7 +78,7 @@ _pizzaplace_dtype = {
     "price": "float64",
 }
 
-_exibble_fname = pkg_resources.resource_filename(DATA_MOD, "06-exibble.csv")
+_exibble_fname = "06-exibble.csv"
 _exibble_dtype = {
     "num": "float64",
     "char": "object",
@@ -74,7 +91,7 @@ _exibble_dtype = {
     "group": "object",
 }
 
-_towny_fname = pkg_resources.resource_filename(DATA_MOD, "07-towny.csv")
+_towny_fname = "07-towny.csv"
 _towny_dtype = {
     "name": "object",
     "website": "object",
@@ -103,7 +120,7 @@ _towny_dtype = {
     "pop_change_2016_2021_pct": "float64",
 }
 
-_metro_fname = pkg_resources.resource_filename(DATA_MOD, "08-metro.csv")
+_metro_fname = "08-metro.csv"
 _metro_dtype = {
     "name": "object",
     "caption": "object",
@@ -118,7 +135,7 @@ _metro_dtype = {
     "location": "object",
 }
 
-_constants_fname = pkg_resources.resource_filename(DATA_MOD, "09-constants.csv")
+_constants_fname = "09-constants.csv"
 _constants_dtype = {
     "name": "object",
     "value": "float64",
@@ -128,7 +145,7 @@ _constants_dtype = {
     "units": "object",
 }
 
-_illness_fname = pkg_resources.resource_filename(DATA_MOD, "10-illness.csv")
+_illness_fname = "10-illness.csv"
 _illness_dtype = {
     "test": "object",
     "units": "object",
@@ -143,11 +160,10 @@ _illness_dtype = {
     "norm_u": "float64",
 }
 
-_islands_fname = pkg_resources.resource_filename(DATA_MOD, "11-islands.csv")
-_airquality_fname = pkg_resources.resource_filename(DATA_MOD, "x-airquality.csv")
+_islands_fname = "11-islands.csv"
+_airquality_fname = "x-airquality.csv"
 
-countrypops: pd.DataFrame = pd.read_csv(_countrypops_fname, dtype=_countrypops_dtype)  # type: ignore
-countrypops.__doc__ = """
+_countrypops_doc = """
 Yearly populations of countries from 1960 to 2022.
 
 A dataset that presents yearly, total populations of countries. Total population is based on counts
@@ -171,8 +187,7 @@ Source
 """
 
 
-sza: pd.DataFrame = pd.read_csv(_sza_fname, dtype=_sza_dtype)  # type: ignore
-sza.__doc__ = """
+_sza_doc = """
 Twice hourly solar zenith angles by month & latitude.
 
 This dataset contains solar zenith angles (in degrees, with the range of 0-90) every half hour from
@@ -208,8 +223,7 @@ Calculated Actinic Fluxes (290 - 700 nm) for Air Pollution Photochemistry Applic
 """
 
 
-gtcars: pd.DataFrame = pd.read_csv(_gtcars_fname, dtype=_gtcars_dtype)  # type: ignore
-gtcars.__doc__ = """
+_gtcars_doc = """
 Deluxe automobiles from the 2014-2017 period.
 
 Expensive and fast cars. Each row describes a car of a certain make, model, year, and trim. Basic
@@ -245,8 +259,7 @@ between both types (`"am"`), or, direct drive (`"dd"`)
 """
 
 
-sp500: pd.DataFrame = pd.read_csv(_sp500_fname, dtype=_sp500_dtype)  # type: ignore
-sp500.__doc__ = """
+_sp500_doc = """
 Daily S&P 500 Index data from 1950 to 2015.
 
 This dataset provides daily price indicators for the S&P 500 index from the beginning of 1950 to the
@@ -265,8 +278,7 @@ price is adjusted for splits.
 """
 
 
-pizzaplace: pd.DataFrame = pd.read_csv(_pizzaplace_fname, dtype=_pizzaplace_dtype)  # type: ignore
-pizzaplace.__doc__ = """
+_pizzaplace_doc = """
 A year of pizza sales from a pizza place.
 
 A synthetic dataset that describes pizza sales for a pizza place somewhere in the US. While the
@@ -368,8 +380,7 @@ or `"veggie"`.
 """
 
 
-exibble: pd.DataFrame = pd.read_csv(_exibble_fname, dtype=_exibble_dtype)  # type: ignore
-exibble.__doc__ = """
+_exibble_doc = """
 A toy example table for testing with great_tables: exibble.
 
 This table contains data of a few different classes, which makes it well-suited for quick
@@ -395,8 +406,7 @@ for testing tables that contain row groups.
 """
 
 
-towny: pd.DataFrame = pd.read_csv(_towny_fname, dtype=_towny_dtype)  # type: ignore
-towny.__doc__ = """
+_towny_doc = """
 Populations of all municipalities in Ontario from 1996 to 2021.
 
 A dataset containing census population data from six census years (1996 to 2021)
@@ -441,8 +451,7 @@ of census years, from 1996 to 2021.
 """
 
 
-metro: pd.DataFrame = pd.read_csv(_metro_fname, dtype=_metro_dtype)  # type: ignore
-metro.__doc__ = """
+_metro_doc = """
 The stations of the Paris Metro.
 
 A dataset with information on all 308 Paris Metro stations as of February 2023. Each record
@@ -489,8 +498,7 @@ series.
 in the Metro system do not have this data, thus they show as missing values.
 """
 
-constants: pd.DataFrame = pd.read_csv(_constants_fname, dtype=_constants_dtype)  # type: ignore
-constants.__doc__ = """
+_constants_doc = """
 The fundamental physical constants.
 
 This dataset contains values for over 300 basic fundamental constants in nature. The values
@@ -515,8 +523,7 @@ uncertainty value.
 """
 
 
-illness: pd.DataFrame = pd.read_csv(_illness_fname, dtype=_illness_dtype)  # type: ignore
-illness.__doc__ = """
+_illness_doc = """
 Lab tests for one suffering from an illness.
 
 A dataset with artificial daily lab data for a patient with Yellow Fever (YF). The table comprises
@@ -581,11 +588,7 @@ performed that day.
 - `norm_l`, `norm_u`: Lower and upper bounds for the normal range associated with the test.
 """
 
-islands: pd.DataFrame = pd.read_csv(_islands_fname)  # type: ignore
-airquality: pd.DataFrame = pd.read_csv(_airquality_fname)  # type: ignore
-
-
-_x_locales_fname = pkg_resources.resource_filename(DATA_MOD, "x_locales.csv")
+_x_locales_fname = "x_locales.csv"
 _x_locales_dtype = {
     "country_name": "object",
     "country_code_2": "object",
@@ -641,4 +644,53 @@ _x_locales_dtype = {
     "page_size_options_label_text": "object",
 }
 
-__x_locales: pd.DataFrame = pd.read_csv(_x_locales_fname, dtype=_x_locales_dtype)  # type: ignore
+
+# Datasets are read in when they are first accessed (rather than when this module is imported),
+# since reading all of them takes a while; each one is then stored as a module attribute, so that
+# it's only read once. The entries give the file name, the column types, and the docstring.
+_datasets: Dict[str, Tuple[str, Optional[Dict[str, str]], Optional[str]]] = {
+    "countrypops": (_countrypops_fname, _countrypops_dtype, _countrypops_doc),
+    "sza": (_sza_fname, _sza_dtype, _sza_doc),
+    "gtcars": (_gtcars_fname, _gtcars_dtype, _gtcars_doc),
+    "sp500": (_sp500_fname, _sp500_dtype, _sp500_doc),
+    "pizzaplace": (_pizzaplace_fname, _pizzaplace_dtype, _pizzaplace_doc),
+    "exibble": (_exibble_fname, _exibble_dtype, _exibble_doc),
+    "towny": (_towny_fname, _towny_dtype, _towny_doc),
+    "metro": (_metro_fname, _metro_dtype, _metro_doc),
+    "constants": (_constants_fname, _constants_dtype, _constants_doc),
+    "illness": (_illness_fname, _illness_dtype, _illness_doc),
+    "islands": (_islands_fname, None, None),
+    "airquality": (_airquality_fname, None, None),
+    "__x_locales": (_x_locales_fname, _x_locales_dtype, None),
+}
+
+__all__ = [name for name in _datasets if not name.startswith("_")]
+
+
+def _read_dataset(name: str) -> pd.DataFrame:
+    import pandas as pd
+
+    from .._resources import _open_resource
+
+    fname, dtype, doc = _datasets[name]
+
+    with _open_resource(DATA_MOD, fname) as f:
+        data: pd.DataFrame = pd.read_csv(f, dtype=dtype)  # type: ignore
+
+    if doc is not None:
+        data.__doc__ = doc
+
+    return data
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _datasets:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    data = globals()[name] = _read_dataset(name)
+
+    return data
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_datasets})
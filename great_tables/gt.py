@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, List
+from dataclasses import fields, replace
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+from itertools import islice
 from typing_extensions import Self
 
-import copy
+import io
+import os
 
-from great_tables._gt_data import GTData
+from great_tables._gt_data import FormatStats, GTData
 
 # Main gt imports ----
 from great_tables._body import body_reassemble
@@ -43,19 +47,22 @@ from great_tables._spanners import (
     cols_hide,
 )
 from great_tables._stub import reorder_stub_df
+from great_tables.utils_render_common import get_row_reorder_df
 from great_tables._stubhead import tab_stubhead
 from great_tables._tbl_data import n_rows, _get_cell
 from great_tables._utils_render_html import (
     create_heading_component_h,
     create_columns_component_h,
-    create_body_component_h,
+    iter_body_rows_h,
+    get_body_style_classes,
+    create_style_classes_css,
     create_source_notes_component_h,
     create_footnotes_component_h,
 )
 from great_tables._tab_create_modify import tab_style
 
 
-__all__ = ["GT"]
+__all__ = ["GT", "shared_stylesheet"]
 
 
 # =============================================================================
@@ -233,17 +240,68 @@ class GT(
     def _get_has_built(self: GT) -> bool:
         return self._has_built
 
-    def _render_formats(self, context: str) -> Self:
-        rendered = copy.copy(self)
+    def _render_formats(
+        self, context: str, executor: Optional[Executor] = None, rows: Optional[List[int]] = None
+    ) -> Self:
+        # The body method performs a mutation, so work on a copy of the body (the body object is
+        # shared with the tables that this one was derived from)
+        rendered = self._replace(_body=self._body.copy())
 
-        # TODO: this body method performs a mutation. Should we make a copy of body?
-        rendered._body.render_formats(rendered._tbl_data, rendered._formats, context)
+        rendered._body.render_formats(
+            rendered._tbl_data, rendered._formats, context, executor=executor, rows=rows
+        )
         return rendered
 
-    def _build_data(self, context: str) -> Self:
+    def _build_data(self, context: str, executor: Optional[Executor] = None) -> Self:
+        # Reuse the result of an earlier build of this (immutable) object in the same context
+        # (the executor used for formatting doesn't affect the result)
+        built_cache = self._get_built_cache()
+
+        if context not in built_cache:
+            built_cache[context] = self._build_data_uncached(context=context, executor=executor)
+
+        return built_cache[context]
+
+    def _build_data_rows(
+        self,
+        context: str,
+        row_offset: int,
+        row_limit: Optional[int],
+        executor: Optional[Executor] = None,
+    ) -> Tuple[Self, range]:
+        """Build the table for displaying only some of the body rows.
+
+        Returns the built table and the positions of the body rows to display. Only the cells in
+        those rows are formatted, unless the whole table has already been built.
+        """
+
+        n_body_rows = n_rows(self._tbl_data)
+        row_start = min(row_offset, n_body_rows)
+        row_stop = n_body_rows if row_limit is None else min(row_start + row_limit, n_body_rows)
+        body_rows = range(row_start, row_stop)
+
+        # Reuse a build of the whole table, if there is one
+        built_cache = self._get_built_cache()
+
+        if context in built_cache:
+            return built_cache[context], body_rows
+
+        # Body rows are reordered by row group when the table is built, so get the rows of the
+        # data that will be displayed in these positions
+        data_rows = [final for _, final in get_row_reorder_df(self._row_groups, self._stub)]
+
+        built = self._build_data_uncached(
+            context=context, executor=executor, rows=[data_rows[i] for i in body_rows]
+        )
+
+        return built, body_rows
+
+    def _build_data_uncached(
+        self, context: str, executor: Optional[Executor] = None, rows: Optional[List[int]] = None
+    ) -> Self:
         # Build the body of the table by generating a dictionary
         # of lists with cells initially set to nan values
-        built = self._render_formats(context)
+        built = self._render_formats(context, executor=executor, rows=rows)
         # built._body = _migrate_unformatted_to_output(body)
 
         # built._perform_col_merge()
@@ -252,6 +310,12 @@ class GT(
         # Reordering of the metadata elements of the table
 
         final_stub = reorder_stub_df(built._stub, built._row_groups)
+
+        # Fix the table ID from the (unbuilt) table's fingerprint, if requested
+        if self._options.table_id_from_content.value and self._options.table_id.value is None:
+            table_id = replace(self._options.table_id, value=_content_table_id(self))
+            built = built._replace(_options=replace(built._options, table_id=table_id))
+
         # self = self.reorder_footnotes()
         # self = self.reorder_styles()
 
@@ -263,19 +327,258 @@ class GT(
 
         return built._replace(_body=final_body, _stub=final_stub)
 
-    def render(self, context: str) -> str:
-        html_table = self._build_data(context=context)._render_as_html()
+    def fingerprint(self) -> str:
+        """
+        Compute a fingerprint of the table.
+
+        The fingerprint is a hash of the table's data and of everything that has been specified for
+        the table (formats, styles, options, etc.). Tables that would render the same way have the
+        same fingerprint, so it can be used as a cache key (or an HTTP ETag) to skip rendering a
+        table that hasn't changed. The data is hashed column-wise by the DataFrame library, so this
+        is much cheaper than rendering, even for large tables.
+
+        Returns
+        -------
+        str
+            A hexadecimal string.
+
+        Examples
+        --------
+        Tables created in the same way have the same fingerprint, but any change to the data or to
+        the table's specification gives a different one.
+
+        ```{python}
+        from great_tables import GT, exibble
+
+        gt_1 = GT(exibble).fmt_number(columns="num")
+        gt_2 = GT(exibble).fmt_number(columns="num")
+
+        gt_1.fingerprint() == gt_2.fingerprint()
+        ```
+
+        ```{python}
+        gt_1.fingerprint() == gt_2.fmt_number(columns="num", decimals=3).fingerprint()
+        ```
+        """
+        import hashlib
+        from great_tables._utils import _update_hash
+
+        hasher = hashlib.blake2b(digest_size=16)
+
+        for field in fields(self):
+            # the body and build flag are derived from the other fields when rendering
+            if field.name in ("_body", "_has_built"):
+                continue
+
+            _update_hash(hasher, field.name)
+            _update_hash(hasher, getattr(self, field.name))
+
+        return hasher.hexdigest()
+
+    def format_stats(self, context: str = "html") -> FormatStats:
+        """
+        Get statistics about how the table's cells were formatted.
+
+        This is a debugging aid for seeing how much formatting work building the table takes. The
+        table is built for the given context (or a previous build of it is reused), and the counts
+        of the cells and values that were formatted along the way are returned.
+
+        Parameters
+        ----------
+        context
+            The output context to build the table for (e.g., `"html"`).
+
+        Returns
+        -------
+        FormatStats
+            An object with these counts:
+
+            - `n_cells`: the number of cells that each of the table's formats produced (in the
+            order that the formats were added); cells that a later format also applies to aren't
+            formatted by, or counted for, the earlier format
+            - `n_shadowed`: the number of cells that were skipped in that way
+            - `n_values`: the number of values that were formatted
+            - `n_formatted`: the number of times that a formatting function was applied to a value;
+            this is lower than `n_values` when values in low-cardinality columns are deduplicated
+            - `n_cache_hits`: the number of values that reused the result for an equal value
+            - `n_deduped_columns`: the number of columns with values that were deduplicated
+
+        Examples
+        --------
+        Here, the `fmt_currency()` call overrides the `fmt_number()` call for the `currency`
+        column, so `fmt_number()` only produces the cells of the `num` column.
+
+        ```{python}
+        from great_tables import GT, exibble
+
+        gt = (
+            GT(exibble)
+            .fmt_number(columns=["num", "currency"])
+            .fmt_currency(columns="currency")
+        )
+
+        stats = gt.format_stats()
+        stats.n_cells, stats.n_shadowed
+        ```
+        """
+
+        return self._build_data(context=context)._body.format_stats
+
+    def render(
+        self,
+        context: str,
+        minify: Optional[bool] = None,
+        executor: Optional[Executor] = None,
+        row_limit: Optional[int] = None,
+        row_offset: int = 0,
+    ) -> str:
+        """
+        Render the table.
+
+        Parameters
+        ----------
+        context : str
+            The output context. Currently, only `"html"` is supported.
+        minify : bool | None
+            Whether to leave out the newlines and indentation between HTML elements, giving a
+            smaller output. By default, the `table_minify_html=` option of
+            [`tab_options()`](`great_tables.GT.tab_options`) is used (which is `False` unless set).
+        executor : Executor | None
+            A `concurrent.futures` executor for formatting the table's columns concurrently, such
+            as a `ThreadPoolExecutor`. This can speed up rendering wide tables with many formatted
+            columns, particularly when formatting is done by libraries that release the GIL (e.g.,
+            formatting polars columns). The rendered table is the same as without an executor.
+            Formatting functions can't be sent to other processes, so a `ProcessPoolExecutor`
+            can't be used.
+        row_limit : int | None
+            The maximum number of body rows to display (e.g., for a preview of a large table). By
+            default, all rows are displayed.
+        row_offset : int
+            The number of body rows to skip before the displayed rows (e.g., for a page of a
+            paginated view). Together with `row_limit=`, this gives a window of body rows. Only
+            the cells in the displayed rows are formatted, so rendering a window of rows takes
+            time in proportion to the size of the window rather than that of the table.
+
+        Returns
+        -------
+        str
+            The rendered table.
+        """
+
+        _validate_executor(executor)
+        _validate_row_window(row_limit=row_limit, row_offset=row_offset)
+
+        if row_limit is None and row_offset == 0:
+            built = self._build_data(context=context, executor=executor)
+            body_rows = None
+        else:
+            built, body_rows = self._build_data_rows(
+                context=context, row_offset=row_offset, row_limit=row_limit, executor=executor
+            )
+
+        html_table = built._render_as_html(minify=minify, body_rows=body_rows)
         return html_table
 
+    def render_iter(
+        self, context: str, batch_size: int = 1000, minify: Optional[bool] = None
+    ) -> Iterator[str]:
+        """
+        Render the table as a sequence of HTML chunks.
+
+        Rather than building the complete HTML string in memory, this yields the rendered table in
+        pieces: the container and its `<style>` block, the table header, batches of body rows, and
+        finally the footer. This is useful for writing large tables to a file or socket, or for
+        serving them with chunked transfer encoding. Joining all of the chunks gives exactly the
+        same output as [`render()`](`great_tables.GT.render`).
+
+        Parameters
+        ----------
+        context : str
+            The output context. Currently, only `"html"` is supported.
+        batch_size : int
+            The maximum number of body rows to include in a single chunk.
+        minify : bool | None
+            Whether to leave out the newlines and indentation between HTML elements (see
+            [`render()`](`great_tables.GT.render`)).
+
+        Returns
+        -------
+        Iterator[str]
+            An iterator of HTML strings.
+        """
+
+        if batch_size < 1:
+            raise ValueError("The `batch_size=` value must be a positive integer.")
+
+        built = self._build_data(context=context)
+
+        yield from built._render_as_html_iter(batch_size=batch_size, minify=minify)
+
+    def write_html(
+        self, file: str | os.PathLike[str] | IO[str] | IO[bytes], batch_size: int = 1000
+    ) -> None:
+        """
+        Write the table as HTML to a file.
+
+        The table is rendered in chunks (see [`render_iter()`](`great_tables.GT.render_iter`)) and
+        each chunk is written as soon as it is generated. Because the complete HTML string is never
+        held in memory, the memory used for writing the output doesn't grow with the number of rows
+        in the table.
+
+        Parameters
+        ----------
+        file : str | os.PathLike | IO
+            A path to the file that will be written (using UTF-8 encoding), or an open file object.
+            File objects opened in binary mode will receive UTF-8 encoded bytes.
+        batch_size : int
+            The maximum number of body rows to render before writing them out.
+
+        Returns
+        -------
+        None
+        """
+
+        chunks = self.render_iter(context="html", batch_size=batch_size)
+
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "w", encoding="utf-8") as f:
+                f.writelines(chunks)
+            return
+
+        # Determine whether the file object expects bytes rather than text
+        is_binary = isinstance(file, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(
+            file, "mode", ""
+        )
+
+        if is_binary:
+            file.writelines(chunk.encode("utf-8") for chunk in chunks)
+        else:
+            file.writelines(chunks)
+
     # =============================================================================
     # HTML Rendering
     # =============================================================================
-    def _render_as_html(self) -> str:
-        heading_component = create_heading_component_h(data=self)
-        column_labels_component = create_columns_component_h(data=self)
-        body_component = create_body_component_h(data=self)
-        source_notes_component = create_source_notes_component_h(data=self)
-        footnotes_component = create_footnotes_component_h(data=self)
+    def _render_as_html(
+        self, minify: Optional[bool] = None, body_rows: Optional[range] = None
+    ) -> str:
+        return "".join(self._render_as_html_iter(minify=minify, body_rows=body_rows))
+
+    def _render_as_html_iter(
+        self,
+        batch_size: int = 1000,
+        minify: Optional[bool] = None,
+        body_rows: Optional[range] = None,
+    ) -> Iterator[str]:
+        # Determine whether to leave out the newlines and indentation between elements
+        if minify is None:
+            minify = self._options.table_minify_html.value
+
+        eol = "" if minify else "\n"
+
+        heading_component = create_heading_component_h(data=self, minify=minify)
+        column_labels_component = create_columns_component_h(data=self, minify=minify)
+        source_notes_component = create_source_notes_component_h(data=self, minify=minify)
+        footnotes_component = create_footnotes_component_h(data=self, minify=minify)
 
         # Determine whether Quarto processing of the table is enabled
         quarto_disable_processing = self._options.quarto_disable_processing.value
@@ -283,15 +586,6 @@ class GT(
         quarto_disable_processing = str(quarto_disable_processing).lower()
         quarto_use_bootstrap = str(quarto_use_bootstrap).lower()
 
-        html_table = f"""<table class=\"gt_table\" data-quarto-disable-processing="{quarto_disable_processing}" data-quarto-bootstrap="{quarto_use_bootstrap}">
-{heading_component.make_string()}
-{column_labels_component}
-{body_component}
-{source_notes_component}
-{footnotes_component}
-</table>
-"""
-
         # Obtain the `table_id` value (might be set, might be None)
         table_id = self._options.table_id.value
 
@@ -300,10 +594,35 @@ class GT(
         else:
             id = table_id
 
-        # Compile the SCSS as CSS
-        from ._scss import compile_scss
+        # With a shared stylesheet, the table's container only gets the class that scopes those
+        # styles; otherwise, compile the SCSS as CSS for this table's id
+        from ._scss import compile_scss, get_shared_css_class
 
-        css = compile_scss(data=self, id=id)
+        shared_css = self._options.table_shared_css.value
+
+        if shared_css:
+            container_class = f' class="{get_shared_css_class(data=self)}"'
+            css = ""
+        else:
+            css = compile_scss(data=self, id=id)
+            container_class = ""
+
+        # Styles of body cells can be given as classes (with rules added to the table's CSS) rather
+        # than as inline `style` attributes
+        if self._options.table_style_classes.value:
+            style_classes = get_body_style_classes(self._styles)
+            style_classes_css = create_style_classes_css(style_classes, id=id)
+
+            if style_classes_css:
+                css = f"{css}\n{style_classes_css}" if css else style_classes_css
+        else:
+            style_classes = None
+
+        if minify:
+            # Lines of the CSS are separate rules, so they can be run together
+            css = " ".join(line.strip() for line in css.splitlines())
+
+        style_block = f"<style>{eol}{css}{eol}</style>{eol}" if css else ""
 
         # Obtain options set for overflow and container dimensions
 
@@ -314,16 +633,43 @@ class GT(
         container_width = self._options.container_width.value
         container_height = self._options.container_height.value
 
-        finalized_table = f"""<div id="{id}" style="padding-left:{container_padding_x};padding-right:{container_padding_x};padding-top:{container_padding_y};padding-bottom:{container_padding_y};overflow-x:{container_overflow_x};overflow-y:{container_overflow_y};width:{container_width};height:{container_height};">
-<style>
-{css}
-</style>
-{html_table}
+        yield f"""<div id="{id}"{container_class} style="padding-left:{container_padding_x};padding-right:{container_padding_x};padding-top:{container_padding_y};padding-bottom:{container_padding_y};overflow-x:{container_overflow_x};overflow-y:{container_overflow_y};width:{container_width};height:{container_height};">{eol}{style_block}"""
+
+        yield f"""<table class=\"gt_table\" data-quarto-disable-processing="{quarto_disable_processing}" data-quarto-bootstrap="{quarto_use_bootstrap}">{eol}{heading_component.make_string()}{eol}{column_labels_component}{eol}<tbody class="gt_table_body">{eol}"""
+
+        # Yield the body rows in batches; every batch after the first is prefixed with
+        # the newline that separates it from the previous one
+        body_rows_h = iter_body_rows_h(
+            data=self,
+            chunk_size=batch_size,
+            style_classes=style_classes,
+            minify=minify,
+            rows=body_rows,
+        )
+        sep = ""
+
+        while True:
+            batch = list(islice(body_rows_h, batch_size))
+
+            if not batch:
+                break
+
+            yield sep + eol.join(batch)
+            sep = eol
+
+        if minify:
+            yield f"</tbody>{source_notes_component}{footnotes_component}</table></div>"
+            return
+
+        yield f"""
+</tbody>
+{source_notes_component}
+{footnotes_component}
+</table>
+
 </div>
         """
 
-        return finalized_table
-
 
 # =============================================================================
 # End of GT class
@@ -335,6 +681,29 @@ class GT(
 # =============================================================================
 
 
+def _content_table_id(gt: GT) -> str:
+    return "gt_" + gt.fingerprint()[:10]
+
+
+def _validate_row_window(row_limit: Optional[int], row_offset: int) -> None:
+    if row_limit is not None and row_limit < 0:
+        raise ValueError("The `row_limit=` value must be a non-negative integer.")
+
+    if row_offset < 0:
+        raise ValueError("The `row_offset=` value must be a non-negative integer.")
+
+
+def _validate_executor(executor: Optional[Executor]) -> None:
+    # Formatting functions are usually closures, which can't be pickled to send them to other
+    # processes
+    if isinstance(executor, ProcessPoolExecutor):
+        raise ValueError(
+            "The `executor=` value can't be a `ProcessPoolExecutor`, since formatting functions "
+            "can't be sent to other processes. Use an executor that runs tasks in this process "
+            "instead (e.g., a `ThreadPoolExecutor`)."
+        )
+
+
 def _get_column_labels(gt: GT, context: str) -> List[str]:
     gt_built = gt._build_data(context=context)
     column_labels = [x.column_label for x in gt_built._boxhead]
@@ -354,6 +723,57 @@ def _get_column_of_values(gt: GT, column_name: str, context: str) -> List[str]:
     return cell_values
 
 
+def shared_stylesheet(*gts: GT) -> str:
+    """
+    Generate a stylesheet that can be shared by several tables.
+
+    Tables rendered with `tab_options(table_shared_css=True)` don't contain their own `<style>`
+    block; instead, they rely on a stylesheet that is included once in the document. This function
+    generates that stylesheet for any number of tables. Tables that have the same styling options
+    share the same CSS, so the CSS for each distinct set of options is only included once.
+
+    Parameters
+    ----------
+    *gts : GT
+        The tables that the stylesheet should cover.
+
+    Returns
+    -------
+    str
+        An HTML `<style>` block.
+
+    Examples
+    --------
+    Let's create two tables from the `exibble` dataset that have the same styling options, and a
+    third that uses a larger font size. The stylesheet only needs to contain two sets of styles.
+
+    ```{python}
+    from great_tables import GT, exibble, shared_stylesheet
+
+    gt_1 = GT(exibble[["num", "char"]]).tab_options(table_shared_css=True)
+    gt_2 = GT(exibble[["fctr", "date"]]).tab_options(table_shared_css=True)
+    gt_3 = gt_1.tab_options(table_font_size="20px")
+
+    html_doc = shared_stylesheet(gt_1, gt_2, gt_3) + "".join(
+        gt.render(context="html") for gt in [gt_1, gt_2, gt_3]
+    )
+    ```
+    """
+    from ._scss import compile_scss, get_shared_css_class
+
+    css_blocks: Dict[str, str] = {}
+
+    for gt in gts:
+        css_class = get_shared_css_class(data=gt)
+
+        if css_class not in css_blocks:
+            css_blocks[css_class] = compile_scss(data=gt, id=None, shared=True)
+
+    css = "\n".join(css_blocks.values())
+
+    return f"<style>\n{css}\n</style>"
+
+
 def _as_raw_html(gt: GT) -> str:
     """
     Returns the GTData object as raw HTML.
@@ -0,0 +1,41 @@
+import subprocess
+import sys
+from typing import Callable, Dict, Tuple
+
+import pytest
+
+
+def _run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def _import_times(code: str) -> Dict[str, Tuple[float, float]]:
+    res = _run_python(code, "-X", "importtime")
+
+    # Lines of the report look like "import time: <self us> | <cumulative us> | <module>", with a
+    # header line first
+    times: Dict[str, Tuple[float, float]] = {}
+
+    for line in res.stderr.splitlines():
+        if line.startswith("import time:") and "self" not in line:
+            self_us, cumulative_us, module = line[len("import time:") :].split("|")
+            times[module.strip()] = (int(self_us) / 1e6, int(cumulative_us) / 1e6)
+
+    return times
+
+
+@pytest.fixture
+def run_python() -> Callable[..., subprocess.CompletedProcess]:
+    """A function that runs Python code in a new interpreter (with any extra arguments)."""
+
+    return _run_python
+
+
+@pytest.fixture
+def import_times() -> Callable[[str], Dict[str, Tuple[float, float]]]:
+    """A function that gets the self and cumulative import times (in seconds) of each module
+    imported by running some Python code in a new interpreter."""
+
+    return _import_times
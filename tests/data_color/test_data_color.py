@@ -1,4 +1,4 @@
-from great_tables import GT
+from great_tables import GT, loc, style
 from great_tables.data import exibble
 from great_tables._utils_render_html import create_body_component_h
 import pandas as pd
@@ -102,3 +102,37 @@ def test_data_color_autocolor_text_false(snapshot, df: DataFrameLike):
     )
 
     assert_rendered_body(snapshot, gt)
+
+
+@pytest.mark.parametrize("autocolor_text", [True, False])
+def test_data_color_same_styles_as_tab_style(df: DataFrameLike, autocolor_text: bool):
+    """`data_color` sets the same styles as styling each cell with `tab_style`."""
+    from great_tables._data_color.base import _ideal_fgnd_color
+
+    gt = GT(df).data_color(palette=["red", "green"], autocolor_text=autocolor_text)
+
+    expected = GT(df)
+    for info in gt._styles:
+        color = info.styles[-1].color
+        cell_style = [style.fill(color=color)]
+
+        if autocolor_text:
+            cell_style.insert(0, style.text(color=_ideal_fgnd_color(bgnd_color=color)))
+
+        expected = expected.tab_style(
+            style=cell_style, locations=loc.body(columns=info.colname, rows=[info.rownum])
+        )
+
+    assert [(x.colname, x.rownum) for x in gt._styles] == [
+        (col, row) for col in ["num", "char", "currency"] for row in range(4)
+    ]
+    assert gt._styles == expected._styles
+
+
+def test_data_color_constant_column(df: DataFrameLike):
+    """A column holding a single value gets the color at the middle of the palette."""
+    df = df.__class__({"x": [2.5, None, 2.5]})
+
+    gt = GT(df).data_color(palette=["#000000", "#FFFFFF"], na_color="#FF0000")
+
+    assert [info.styles[-1].color for info in gt._styles] == ["#808080", "#FF0000", "#808080"]
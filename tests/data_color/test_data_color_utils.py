@@ -1,4 +1,3 @@
-import pandas as pd
 import numpy as np
 from great_tables._data_color.base import (
     _ideal_fgnd_color,
@@ -15,9 +14,11 @@ from great_tables._data_color.base import (
     _is_hex_col,
     _is_standard_hex_col,
     _expand_short_hex,
-    _rescale_numeric,
-    _get_domain_numeric,
-    _get_domain_factor,
+    _rescale_numeric_values,
+    _rescale_factor_values,
+    _get_palette_lut,
+    _get_palette_lut_index,
+    PALETTE_LUT_SIZE,
 )
 
 
@@ -449,76 +450,40 @@ def test_expand_short_hex_valid_short_hex():
     assert expanded == "#112233"
 
 
-def test_rescale_numeric():
-    # Test case 1: Rescale values within the domain range
-    df = pd.DataFrame({"col": [1, 2, 3, 4, 5]})
-    vals = [2, 3, 4]
-    domain = [1, 5]
-    expected_result = [0.25, 0.5, 0.75]
-    result = _rescale_numeric(df, vals, domain)
-    assert result == expected_result
-
-    # Test case 2: Rescale values outside the domain range
-    df = pd.DataFrame({"col": [1, 2, 3, 4, 5]})
-    vals = [0, 6]
-    domain = [1, 5]
-    expected_result = [np.nan, np.nan]
-    result = _rescale_numeric(df, vals, domain)
-    assert result == expected_result
-
-    # Test case 3: Rescale values with NA values
-    df = pd.DataFrame({"col": [1, 2, np.nan, 4, 5]})
-    vals = [2, np.nan, 4]
-    domain = [1, 5]
-    expected_result = [0.25, np.nan, 0.75]
-    result = _rescale_numeric(df, vals, domain)
-    assert result == expected_result
-
-
-def test_get_domain_numeric():
-    df = pd.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": [6, 7, 8, 9, 10]})
-    vals = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-    domain = _get_domain_numeric(df, vals)
-    assert domain == [1, 10]
-
-    df = pd.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": [6, 7, 8, 9, 10]})
-    vals = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, np.nan]
-    domain = _get_domain_numeric(df, vals)
-    assert domain == [1, 10]
-
-    df = pd.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": [6, 7, 8, 9, 10]})
-    vals = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, np.nan, np.nan]
-    domain = _get_domain_numeric(df, vals)
-    assert domain == [1, 10]
-
-
-def test_get_domain_factor():
-    # Test case 1: Empty DataFrame
-    df = pd.DataFrame()
-    vals = []
-    result = _get_domain_factor(df, vals)
-    assert result == []
+def test_rescale_numeric_values():
+    result = _rescale_numeric_values(vals=[2, 3, 4, 0, 6], domain=[1, 5])
+    np.testing.assert_array_equal(result, [0.25, 0.5, 0.75, np.nan, np.nan])
+
+    # infinite values don't fit in the domain, even when it's infinite itself
+    result = _rescale_numeric_values(vals=[1.0, float("inf"), 3.0], domain=[1.0, float("inf")])
+    np.testing.assert_array_equal(result, [0.0, np.nan, 0.0])
+
+    # values in a domain without a range are put at the middle of it
+    result = _rescale_numeric_values(vals=[3, 3, 4], domain=[3, 3])
+    np.testing.assert_array_equal(result, [0.5, 0.5, np.nan])
+
+    result = _rescale_numeric_values(vals=[], domain=[1, 1])
+    assert result.tolist() == []
+
+
+def test_rescale_factor_values():
+    result = _rescale_factor_values(vals=["b", "a", "d", "b"], domain=["a", "b", "c", "a"])
+    np.testing.assert_array_equal(result, [0.25, 0.0, np.nan, 0.25])
+
+    result = _rescale_factor_values(vals=["a"], domain=[])
+    np.testing.assert_array_equal(result, [np.nan])
+
+
+def test_get_palette_lut_matches_mizani():
+    from mizani.palettes import gradient_n_pal
+
+    palette = ["#FF0000", "#00FF0080", "#0000FF"]
+    vals = np.array([0, 0.1, 1 / 3, 0.5, 0.999, 1, np.nan])
+
+    lut = _get_palette_lut(palette=palette) + ["#808080"]
+    lut_index = _get_palette_lut_index(scaled_vals=vals, na_index=PALETTE_LUT_SIZE)
+
+    expected = [x if x is not None else "#808080" for x in gradient_n_pal(colors=palette)(vals)]
 
-    # Test case 2: DataFrame with factor values
-    df = pd.DataFrame({"col1": ["A", "B", "A", "C", "B"]})
-    vals = ["A", "B", "C"]
-    result = _get_domain_factor(df, vals)
-    assert result == ["A", "B", "C"]
-
-    # Test case 3: DataFrame with factor values and NA values
-    df = pd.DataFrame({"col1": ["A", "B", np.nan, "C", "B"]})
-    vals = ["A", "B", "C"]
-    result = _get_domain_factor(df, vals)
-    assert result == ["A", "B", "C"]
-
-    # Test case 4: DataFrame with factor values and NA values in `vals`
-    df = pd.DataFrame({"col1": ["A", "B", "C"]})
-    vals = ["A", "B", np.nan, "C"]
-    result = _get_domain_factor(df, vals)
-    assert result == ["A", "B", "C"]
-
-    # Test case 5: DataFrame with factor values and duplicate values in `vals`
-    df = pd.DataFrame({"col1": ["A", "B", "C"]})
-    vals = ["A", "B", "B", "C"]
-    result = _get_domain_factor(df, vals)
-    assert result == ["A", "B", "C"]
+    assert len(lut) == PALETTE_LUT_SIZE + 1
+    assert [lut[i] for i in lut_index] == expected
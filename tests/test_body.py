@@ -1,4 +1,4 @@
-from great_tables._gt_data import Body, Stub, Boxhead
+from great_tables._gt_data import Body, Stub, Boxhead, FormatFns, FormatInfo
 from great_tables._body import body_reassemble
 import pandas as pd
 from pandas.testing import assert_frame_equal
@@ -21,3 +21,105 @@ def test_body_reassemble():
     compare_df = df.iloc[[0, 2, 1, 3],]
 
     assert_frame_equal(body_reassembled.body, compare_df)
+
+
+def test_body_render_formats_columnwise():
+    calls = []
+
+    def fmt_batch(values):
+        calls.append(values)
+        return [f"[{x}]" for x in values]
+
+    formats = [
+        FormatInfo(FormatFns(default=lambda x: f"<{x}>"), ["col1"], [1, 3]),
+        FormatInfo(FormatFns(default=lambda x: f"({x})", batch=fmt_batch), ["col3"], [0, 1, 2, 3]),
+        FormatInfo(FormatFns(default=str, html=lambda x: f"html {x}"), ["col2"], [0]),
+    ]
+
+    body = Body.from_empty(df).render_formats(df, formats, context="html")
+
+    # The batch function is given all of the values in the column at once
+    assert calls == [[4.0, 5.0, 6.0, 7.0]]
+
+    assert body.body["col1"].tolist() == [pd.NA, "<2>", pd.NA, "<4>"]
+    assert body.body["col2"].tolist() == ["html b", pd.NA, pd.NA, pd.NA]
+    assert body.body["col3"].tolist() == ["[4.0]", "[5.0]", "[6.0]", "[7.0]"]
+
+
+def test_body_render_formats_dedupes_values():
+    df_rep = pd.DataFrame({"x": pd.Series(["a", "b", None, float("nan")] * 50, dtype=object)})
+    calls = []
+
+    def fmt_x(x):
+        calls.append(x)
+        return f"<{x}>"
+
+    formats = [FormatInfo(FormatFns(default=fmt_x), ["x"], list(range(200)))]
+    body = Body.from_empty(df_rep).render_formats(df_rep, formats, context="html")
+
+    assert body.body["x"].tolist() == ["<a>", "<b>", "<None>", "<nan>"] * 50
+
+    # Each distinct value is formatted once (missing values are formatted individually)
+    assert len(calls) == 2 + 100
+    assert body.format_stats.n_values == 200
+    assert body.format_stats.n_formatted == 102
+    assert body.format_stats.n_cache_hits == 98
+    assert body.format_stats.n_deduped_columns == 1
+
+
+def test_body_render_formats_executor():
+    from concurrent.futures import ThreadPoolExecutor
+
+    formats = [
+        FormatInfo(FormatFns(default=lambda x: f"<{x}>"), ["col1", "col3"], [0, 1, 2, 3]),
+        FormatInfo(FormatFns(default=lambda x: f"({x})"), ["col1"], [1]),
+        FormatInfo(FormatFns(default=str.upper), ["col2"], [2, 3]),
+    ]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        body = Body.from_empty(df).render_formats(df, formats, context="html", executor=executor)
+
+    # Later formats for a column take precedence, as when formatting without an executor
+    assert body.body["col1"].tolist() == ["<1>", "(2)", "<3>", "<4>"]
+    assert body.body["col2"].tolist() == [pd.NA, pd.NA, "B", "A"]
+    assert body.body["col3"].tolist() == ["<4.0>", "<5.0>", "<6.0>", "<7.0>"]
+    assert body.format_stats.n_values == 10
+
+
+def test_body_render_formats_rows():
+    formats = [
+        FormatInfo(FormatFns(default=lambda x: f"<{x}>"), ["col1", "col3"], [0, 1, 2, 3]),
+        FormatInfo(FormatFns(default=lambda x: f"({x})"), ["col2"], [0, 1]),
+    ]
+
+    body = Body.from_empty(df).render_formats(df, formats, context="html", rows=[1, 3])
+
+    # Only cells in the given rows are formatted
+    assert body.body["col1"].tolist() == [pd.NA, "<2>", pd.NA, "<4>"]
+    assert body.body["col2"].tolist() == [pd.NA, "(a)", pd.NA, pd.NA]
+    assert body.body["col3"].tolist() == [pd.NA, "<5.0>", pd.NA, "<7.0>"]
+
+
+def test_body_render_formats_skips_shadowed_cells():
+    calls = []
+
+    def fmt_first(x):
+        calls.append(x)
+        return f"<{x}>"
+
+    formats = [
+        FormatInfo(FormatFns(default=fmt_first), ["col1", "col2"], [0, 1, 2, 3]),
+        FormatInfo(FormatFns(default=lambda x: f"({x})"), ["col1"], [0, 1]),
+        FormatInfo(FormatFns(default=lambda x: f"[{x}]"), ["col1"], [2, 3]),
+        FormatInfo(FormatFns(default=lambda x: f"{{{x}}}"), ["col2"], [1]),
+    ]
+
+    body = Body.from_empty(df).render_formats(df, formats, context="html")
+
+    assert body.body["col1"].tolist() == ["(1)", "(2)", "[3]", "[4]"]
+    assert body.body["col2"].tolist() == ["<b>", "{a}", "<b>", "<a>"]
+
+    # The first format is only applied to the cells that aren't formatted again later
+    assert calls == ["b", "b", "a"]
+    assert body.format_stats.n_cells == [3, 2, 2, 1]
+    assert body.format_stats.n_shadowed == 5
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import great_tables
+from great_tables import data
+
+# The most time that importing `great_tables.data` itself may take (in seconds); it's a small
+# fraction of that when no datasets are read in at import time
+IMPORT_TIME_BUDGET = 0.05
+
+
+def test_data_import_reads_no_datasets(run_python):
+    res = run_python(
+        "import great_tables, great_tables.data as d; "
+        "print(sorted(set(d._datasets) & set(vars(d))))"
+    )
+
+    assert res.stdout.strip() == "[]"
+
+
+@pytest.mark.timing
+def test_data_import_time_budget(import_times):
+    self_time, _ = import_times("import great_tables")["great_tables.data"]
+
+    assert self_time < IMPORT_TIME_BUDGET
+
+
+def test_data_dataset_docstring():
+    assert data.exibble.__doc__ == data._datasets["exibble"][2]
+
+
+@pytest.mark.parametrize("name", ["countrypops", "exibble", "islands"])
+def test_data_lazy_dataset(name: str):
+    fname, dtype, _ = data._datasets[name]
+
+    df = getattr(data, name)
+
+    assert getattr(data, name) is df
+    assert vars(data)[name] is df
+    pd.testing.assert_frame_equal(df, pd.read_csv(Path(data.__file__).parent / fname, dtype=dtype))
+
+
+def test_data_dir_lists_datasets():
+    assert {"countrypops", "exibble", "airquality"} <= set(dir(data))
+
+
+def test_data_missing_attribute_raises():
+    with pytest.raises(AttributeError):
+        data.not_a_dataset
+
+
+def test_top_level_exibble():
+    assert great_tables.exibble is data.exibble
+
+    with pytest.raises(ImportError):
+        great_tables.countrypops
@@ -3,12 +3,14 @@ import pandas as pd
 import polars as pl
 import pytest
 import re
+from datetime import date, datetime, time
 
 from great_tables import GT
 from great_tables.data import exibble
 from great_tables.gt import _get_column_of_values
 from great_tables._data_color.base import _html_color
 from great_tables._utils_render_html import create_body_component_h
+from great_tables._formats_dates import _parse_iso_strs
 from great_tables._formats import (
     _format_number_fixed_decimals,
     _expand_exponential_to_full_string,
@@ -1029,6 +1031,190 @@ def test_format_number_with_sep_dec_marks():
     assert x == ["12.345.678,12346", "1,00000", "0,00000", "\u2212" + "12.345.678,12346"]
 
 
+@pytest.mark.parametrize(
+    "fmt_method, fmt_kwargs",
+    [
+        ("fmt_number", dict()),
+        ("fmt_number", dict(decimals=0, use_seps=False, force_sign=True)),
+        ("fmt_number", dict(decimals=3, drop_trailing_zeros=True, drop_trailing_dec_mark=False)),
+        ("fmt_number", dict(decimals=4, sep_mark=" ", dec_mark=",", pattern="[{x}]")),
+        ("fmt_number", dict(decimals=20, scale_by=1 / 3)),
+        ("fmt_integer", dict()),
+        ("fmt_integer", dict(sep_mark=".", force_sign=True, scale_by=10)),
+        ("fmt_percent", dict()),
+        ("fmt_percent", dict(decimals=1, placement="left", force_sign=True, incl_space=True)),
+    ],
+)
+def test_format_vectorized_matches_scalar(fmt_method: str, fmt_kwargs: dict):
+    values = [0.0, -0.0, 0.5, 1.5, 2.675, -2.5, 0.125, 1e-7, -1e-7, 123456.785, -999.9995]
+    values += [1e15, -123456789012.5, 1.7e308, float("inf"), float("-inf"), float("nan")]
+
+    gt = getattr(GT(pd.DataFrame({"x": values})), fmt_method)(columns="x", **fmt_kwargs)
+    fns = gt._formats[0].func
+
+    assert fns.batch is not None
+
+    res = fns.batch(values)
+    dst = [fns.default(x) for x in values]
+
+    assert [str(x) for x in res] == [str(x) for x in dst]
+    assert fns.batch([1, -2, 30000]) == [fns.default(x) for x in [1, -2, 30000]]
+
+
+def test_format_vectorized_used_for_full_columns():
+    df = pd.DataFrame({"x": [1.5, -2.25, 1000.0], "y": ["a", "b", "c"]})
+    gt = GT(df).fmt_number(columns="x", decimals=1)
+
+    assert gt._formats[0].func.batch is not None
+    assert _get_column_of_values(gt, column_name="x", context="html") == [
+        "1.5",
+        "\u22122.2",
+        "1,000.0",
+    ]
+
+    # Selecting a subset of rows uses the scalar formatting function
+    gt_rows = GT(df).fmt_number(columns="x", decimals=1, rows=[1, 2])
+    assert _get_column_of_values(gt_rows, column_name="x", context="html")[1:] == [
+        "\u22122.2",
+        "1,000.0",
+    ]
+
+
+@pytest.mark.parametrize(
+    "fmt_method, fmt_kwargs, values",
+    [
+        (
+            "fmt_date",
+            dict(date_style="wd_m_day_year", locale="de"),
+            ["2020-01-05", "2020-1-5", None, date(2021, 3, 4), datetime(2021, 3, 4, 5, 6)],
+        ),
+        (
+            "fmt_time",
+            dict(time_style="h_m_s_p", locale="fr-CA"),
+            ["10:05", "23:59:59", None, time(1, 2, 3)],
+        ),
+        (
+            "fmt_datetime",
+            dict(date_style="iso", time_style="h_m_p", sep=" at "),
+            ["2020-01-05 10:05", "2020-01-05 00:00:01", None, datetime(2021, 3, 4, 5, 6)],
+        ),
+    ],
+)
+def test_format_dates_batch_matches_scalar(fmt_method: str, fmt_kwargs: dict, values: list):
+    gt = getattr(GT(pd.DataFrame({"x": [1]})), fmt_method)(columns="x", **fmt_kwargs)
+    fns = gt._formats[0].func
+
+    assert fns.batch(values * 3) == [fns.default(x) for x in values * 3]
+
+
+def test_format_date_batch_invalid_str():
+    gt = GT(pd.DataFrame({"x": [1]})).fmt_date(columns="x")
+
+    with pytest.raises(ValueError) as exc_info:
+        gt._formats[0].func.batch(["2020-01-05", "2020-13-01"])
+
+    assert "Invalid ISO date string: '2020-13-01'" in exc_info.value.args[0]
+
+
+def test_parse_iso_strs():
+    values = ["2020-01-05", "2020-13-01", None, "2020-1-5", 5]
+    res = _parse_iso_strs(values, kind="date")
+
+    assert res == [date(2020, 1, 5), "2020-13-01", None, "2020-1-5", 5]
+
+    res = _parse_iso_strs(["10:05", "10:05:07", "1:05"], kind="time")
+
+    assert res == [time(10, 5), time(10, 5, 7), "1:05"]
+
+
+@pytest.mark.parametrize(
+    "fmt_method, fmt_kwargs",
+    [
+        ("fmt_number", dict()),
+        ("fmt_number", dict(decimals=0, use_seps=False, force_sign=True, pattern="[{x}]")),
+        ("fmt_number", dict(decimals=3, drop_trailing_zeros=True, drop_trailing_dec_mark=False)),
+        ("fmt_number", dict(decimals=1, sep_mark="$1", dec_mark="\\", scale_by=0.01)),
+        ("fmt_integer", dict(locale="de-CH", force_sign=True)),
+        ("fmt_percent", dict(decimals=1, placement="left", force_sign=True, incl_space=True)),
+        ("fmt_currency", dict()),
+        ("fmt_currency", dict(currency="EUR", placement="right", incl_space=True)),
+    ],
+)
+def test_format_expr_matches_scalar(fmt_method: str, fmt_kwargs: dict):
+    # Values that are near a rounding tie or too large can't be formatted exactly by polars, so
+    # those are formatted with the scalar function instead
+    values = [0.0, -0.0, 1.5, 2.675, -2.5, 0.125, 1e-7, -1e-7, 123456.785, -999.9995, 1e15]
+    values += [-1234567890.123, 1.7e308, float("inf"), float("-inf"), 0.001, -98765.4321]
+
+    df = pl.DataFrame({"x": values, "i": [1, -2, 30000, 4, -5000000, 0] * 2 + [7] * 5})
+    gt = getattr(GT(df), fmt_method)(columns=["x", "i"], **fmt_kwargs)
+    fns = gt._formats[0].func
+
+    assert fns.expr is not None
+
+    for col in ["x", "i"]:
+        res = _get_column_of_values(gt, column_name=col, context="html")
+        dst = [fns.default(x) for x in df[col].to_list()]
+
+        assert res == dst
+
+
+def test_format_expr_missing_values():
+    df = pl.DataFrame({"x": [1.5, None, -2.25], "d": [date(2020, 1, 5), None, date(999, 1, 1)]})
+    gt = GT(df).fmt_percent(columns="x").fmt_date(columns="d", date_style="iso", pattern="<{x}>")
+
+    assert gt._formats[0].func.expr is not None
+    assert gt._formats[1].func.expr is not None
+
+    body = gt._build_data("html")._body.body
+
+    # Dates with years below 1000 are formatted by Babel
+    assert body["x"].to_list() == ["150.00%", None, "−225.00%"]
+    assert body["d"].to_list() == ["<2020-01-05>", None, "<999-01-01>"]
+
+
+def test_format_expr_unsupported():
+    df = pl.DataFrame({"x": [1.5], "s": ["2020-01-05"], "d": [date(2020, 1, 5)]})
+
+    fns = GT(df).fmt_number(columns="x", compact=True)._formats[0].func
+    assert getattr(fns, "expr", None) is None
+
+    fns = GT(df).fmt_number(columns="s")._formats[0].func
+    assert fns.expr(pl.col("s"), df["s"].dtype) is None
+
+    fns = GT(df).fmt_date(columns="d", date_style="month_day_year")._formats[0].func
+    assert fns.expr(pl.col("d"), df["d"].dtype) is None
+
+
+@pytest.mark.parametrize(
+    "fmt_name,vals_list",
+    [
+        ("number", [1.5, 2.25, -1234.5]),
+        ("number", [1, None]),
+        ("integer", [1.5, float("nan"), 3]),
+        ("percent", [0.5, None]),
+        ("currency", [1234.5, -2]),
+        ("roman", [1, 4, 1999]),
+        ("date", ["2020-01-02", date(1999, 12, 31), None]),
+    ],
+)
+def test_vals_fmt_matches_table(fmt_name: str, vals_list: list):
+    from great_tables import vals
+
+    gt = getattr(GT(pd.DataFrame({"x": vals_list})), "fmt_" + fmt_name)(columns="x")
+
+    res = getattr(vals, "fmt_" + fmt_name)(vals_list)
+
+    assert res == _get_column_of_values(gt, column_name="x", context="html")
+
+
+def test_vals_fmt_single_value():
+    from great_tables import vals
+
+    assert vals.fmt_number(1234.5, decimals=1) == ["1,234.5"]
+    assert vals.fmt_currency(1, currency="EUR") == ["&#8364;1.00"]
+
+
 # ------------------------------------------------------------------------------
 # Test `data_color()` and util functions
 # ------------------------------------------------------------------------------
@@ -1,7 +1,12 @@
 import pytest
 
-from great_tables import GT
+from dataclasses import replace
+from html.parser import HTMLParser
+
+from great_tables import GT, loc, shared_stylesheet, style
+from great_tables.gt import _get_column_of_values
 from great_tables._gt_data import RowGroups
+from great_tables._scss import compile_scss, get_shared_css_class
 import pandas as pd
 
 # Generate a gt Table object for assertion testing
@@ -60,3 +65,327 @@ def test_gt_table_render(gt_tbl: GT):
         ).__name__
         == "str"
     )
+
+
+def _set_table_id(gt: GT, table_id: str) -> GT:
+    # a fixed id keeps the rendered output stable across renders
+    table_id_info = replace(gt._options.table_id, value=table_id)
+    return gt._replace(_options=replace(gt._options, table_id=table_id_info))
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_gt_render_iter_matches_render(batch_size: int):
+    gt_tbl = GT(pd.DataFrame({"a": range(5), "b": list("abcde")})).tab_source_note("Note")
+    gt_tbl = _set_table_id(gt_tbl, "abc")
+
+    chunks = list(gt_tbl.render_iter(context="html", batch_size=batch_size))
+
+    assert "".join(chunks) == gt_tbl.render(context="html")
+
+    # container, table header, one chunk per batch of rows, and the footer
+    assert len(chunks) == 3 + -(-5 // batch_size)
+
+
+def test_gt_render_iter_no_rows():
+    gt_tbl = _set_table_id(GT(pd.DataFrame({"a": []})), "abc")
+
+    assert "".join(gt_tbl.render_iter(context="html")) == gt_tbl.render(context="html")
+
+
+def test_gt_render_iter_batch_size_raises(gt_tbl: GT):
+    with pytest.raises(ValueError):
+        next(gt_tbl.render_iter(context="html", batch_size=0))
+
+
+def test_gt_render_executor_matches_render():
+    from concurrent.futures import ThreadPoolExecutor
+
+    df = pd.DataFrame({"a": [1.5, 2.25, -3.0], "b": list("abc"), "c": [1000, 2000, 3000]})
+    gt_tbl = (
+        GT(df)
+        .fmt_number(columns=["a", "c"], decimals=1)
+        .fmt_integer(columns="c", rows=[1])
+        .fmt(lambda x: f"<{x}>", columns="b")
+    )
+    gt_tbl = _set_table_id(gt_tbl, "abc")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        res = gt_tbl._replace().render(context="html", executor=executor)
+
+    assert res == gt_tbl.render(context="html")
+
+
+def test_gt_render_executor_process_pool_raises(gt_tbl: GT):
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ValueError) as exc_info:
+            gt_tbl.render(context="html", executor=executor)
+
+    assert "can't be a `ProcessPoolExecutor`" in exc_info.value.args[0]
+
+
+@pytest.mark.parametrize("row_offset, row_limit", [(0, 2), (1, 3), (3, None), (4, 10), (9, 1)])
+@pytest.mark.parametrize("frame_type", ["pandas", "polars"])
+def test_gt_render_row_window(frame_type: str, row_offset: int, row_limit: int):
+    import re
+    import polars as pl
+
+    df = pd.DataFrame({"a": [1.5, 2.25, -3.0, 4.0, 5.5], "b": list("abcde")})
+
+    if frame_type == "polars":
+        df = pl.from_pandas(df)
+
+    gt_tbl = GT(df, rowname_col="b").fmt_number(columns="a", decimals=1).fmt_integer("a", rows=[3])
+    gt_tbl = _set_table_id(gt_tbl, "abc")
+
+    res = gt_tbl.render(context="html", row_offset=row_offset, row_limit=row_limit)
+    full = gt_tbl._replace().render(context="html")
+
+    body_rows = re.findall(r"<tr>.*?</tr>", res, flags=re.S)
+    full_body_rows = re.findall(r"<tr>.*?</tr>", full, flags=re.S)
+
+    stop = None if row_limit is None else row_offset + row_limit
+    assert body_rows == full_body_rows[row_offset:stop]
+
+
+def test_gt_render_row_window_formats_displayed_rows():
+    calls = []
+
+    def fmt_fn(x):
+        calls.append(x)
+        return f"<{x}>"
+
+    gt_tbl = GT(pd.DataFrame({"a": range(100)})).fmt(fmt_fn, columns="a", rows=[1, 5, 50])
+    html = gt_tbl.render(context="html", row_offset=2, row_limit=10)
+
+    assert calls == [5]
+    assert "<5>" in html
+    assert "<50>" not in html
+
+
+def test_gt_render_row_window_raises(gt_tbl: GT):
+    with pytest.raises(ValueError):
+        gt_tbl.render(context="html", row_limit=-1)
+
+    with pytest.raises(ValueError):
+        gt_tbl.render(context="html", row_offset=-1)
+
+
+def test_gt_format_stats():
+    df = pd.DataFrame({"a": [1.5, 2.0, 3.0], "b": [4.0, 5.0, 6.25]})
+    gt_tbl = GT(df).fmt_number(columns=["a", "b"]).fmt_currency(columns="b")
+    gt_tbl = gt_tbl.fmt_integer(columns="a", rows=[0])
+
+    stats = gt_tbl.format_stats()
+
+    assert stats.n_cells == [2, 3, 1]
+    assert stats.n_shadowed == 4
+    assert _get_column_of_values(gt_tbl, column_name="b", context="html") == [
+        "$4.00",
+        "$5.00",
+        "$6.25",
+    ]
+
+
+def test_gt_format_stats_cache_hits():
+    df = pd.DataFrame({"a": [1.5, 2.5] * 100})
+
+    stats = GT(df).fmt_number(columns="a").format_stats(context="html")
+
+    assert stats.n_values == 200
+    assert stats.n_formatted == 2
+    assert stats.n_cache_hits == 198
+    assert stats.n_deduped_columns == 1
+
+
+def test_gt_write_html(tmp_path):
+    import io
+
+    gt_tbl = _set_table_id(GT(pd.DataFrame({"a": range(5), "b": list("abcde")})), "abc")
+    expected = gt_tbl.render(context="html")
+
+    fname = tmp_path / "table.html"
+    gt_tbl.write_html(fname, batch_size=2)
+    assert fname.read_text(encoding="utf-8") == expected
+
+    text_buf = io.StringIO()
+    gt_tbl.write_html(text_buf, batch_size=2)
+    assert text_buf.getvalue() == expected
+
+    bytes_buf = io.BytesIO()
+    gt_tbl.write_html(bytes_buf, batch_size=2)
+    assert bytes_buf.getvalue() == expected.encode("utf-8")
+
+
+def test_gt_shared_css_render():
+    gt = GT(pd.DataFrame({"x": [1, 2]})).tab_options(table_shared_css=True)
+
+    html = gt.render(context="html")
+
+    assert "<style>" not in html
+    assert f'class="{get_shared_css_class(gt)}"' in html
+
+
+def test_shared_stylesheet_dedups_css():
+    gt_1 = GT(pd.DataFrame({"x": [1, 2]})).tab_options(table_shared_css=True)
+    gt_2 = GT(pd.DataFrame({"y": ["a"]})).tab_options(table_shared_css=True)
+    gt_3 = gt_1.tab_options(table_font_size="20px")
+
+    css_1 = compile_scss(gt_1, id=None, shared=True)
+    css_3 = compile_scss(gt_3, id=None, shared=True)
+
+    assert shared_stylesheet(gt_1, gt_2) == f"<style>\n{css_1}\n</style>"
+    assert shared_stylesheet(gt_1, gt_2, gt_3) == f"<style>\n{css_1}\n{css_3}\n</style>"
+
+
+def test_gt_fingerprint():
+    df = pd.DataFrame({"x": [1.5, 2.5], "y": ["a", "b"]})
+
+    fingerprint = GT(df).fmt_number(columns="x").fingerprint()
+
+    assert GT(df.copy()).fmt_number(columns="x").fingerprint() == fingerprint
+
+    # changes to the data, the formats, or the options all change the fingerprint
+    assert GT(df.assign(x=[1.5, 3.5])).fmt_number(columns="x").fingerprint() != fingerprint
+    assert GT(df).fmt_number(columns="x", decimals=3).fingerprint() != fingerprint
+    assert GT(df).fmt_number(columns="x").tab_header("a").fingerprint() != fingerprint
+    assert GT(df).fmt_number(columns="x").opt_all_caps().fingerprint() != fingerprint
+
+    # options that are only held in the closures of the formatting functions count too
+    assert GT(df).fmt_number(columns="x", pattern="a{x}").fingerprint() != fingerprint
+    assert GT(df).fmt_number(columns="x", sep_mark=".").fingerprint() != fingerprint
+    assert (
+        GT(df).fmt_number(columns="x", pattern="a{x}").fingerprint()
+        != GT(df).fmt_number(columns="x", pattern="b{x}").fingerprint()
+    )
+
+    def make_fmt_gt(suffix: str) -> GT:
+        return GT(df).fmt(lambda x: f"{x}{suffix}", columns="x")
+
+    assert make_fmt_gt("a").fingerprint() == make_fmt_gt("a").fingerprint()
+    assert make_fmt_gt("a").fingerprint() != make_fmt_gt("b").fingerprint()
+
+    # rendering doesn't change the fingerprint
+    assert GT(df).fmt_number(columns="x")._build_data("html").fingerprint() == fingerprint
+
+
+def test_gt_table_id_from_content():
+    def make_gt():
+        return GT(pd.DataFrame({"x": [1, 2]})).tab_options(table_id_from_content=True)
+
+    html = make_gt().render(context="html")
+
+    assert html == make_gt().render(context="html")
+    assert f'<div id="gt_{make_gt().fingerprint()[:10]}"' in html
+
+    # an explicitly set table ID takes precedence
+    assert '<div id="abc"' in _set_table_id(make_gt(), "abc").render(context="html")
+
+
+def test_gt_build_data_cached():
+    gt = GT(pd.DataFrame({"x": [1.5, 2.5]}))
+
+    built = gt._build_data(context="html")
+
+    assert gt._build_data(context="html") is built
+    assert gt._build_data(context="latex") is not built
+
+    # a modified table doesn't reuse the built result of the table it came from
+    gt_fmt = gt.fmt_number(columns="x", decimals=3)
+
+    assert gt_fmt._build_data(context="html") is not built
+    assert "_built_cache" not in built.__dict__
+
+
+def test_gt_build_data_cache_data_modified_in_place():
+    df = pd.DataFrame({"x": [1.5, 2.5]})
+    gt = GT(df).fmt_number(columns="x")
+
+    built = gt._build_data(context="html")
+    assert "1.50" in gt.render(context="html")
+
+    # the input data is modified after the table was built, so the table is built again
+    df.loc[0, "x"] = 999.0
+
+    assert gt._build_data(context="html") is not built
+    assert "999.00" in gt.render(context="html")
+
+
+def test_gt_build_data_body_not_shared():
+    gt = GT(pd.DataFrame({"x": [1.5, 2.5]}))
+    gt_fmt = gt.fmt_number(columns="x", decimals=3)
+
+    assert _get_column_of_values(gt_fmt, "x", context="html") == ["1.500", "2.500"]
+
+    # formatting the derived table leaves the body of the original untouched
+    assert "1.500" not in _get_column_of_values(gt, "x", context="html")
+
+
+def test_gt_style_classes_render():
+    gt = _set_table_id(GT(pd.DataFrame({"x": [1, 2, 1]})), "abc").data_color(
+        columns="x", palette=["red", "blue"]
+    )
+
+    html = gt.tab_options(table_style_classes=True).render(context="html")
+
+    assert "#abc .gt_row.gt_s0 { color: #000000; background-color: #ff0000; }" in html
+    assert html.count('class="gt_row gt_right gt_s0"') == 2
+    assert "<td style=" not in html
+
+    # with a shared stylesheet, the table only gets a `<style>` block for its style classes
+    shared_html = gt.tab_options(table_style_classes=True, table_shared_css=True).render("html")
+
+    assert "<style>\n #abc .gt_row.gt_s0" in shared_html
+    assert shared_html.count("<style>") == 1
+
+
+class _DomEvents(HTMLParser):
+    # Records the parsed elements and text of an HTML document, ignoring the whitespace
+    # between elements (which isn't part of the rendered table)
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def handle_starttag(self, tag, attrs):
+        self.events.append(("start", tag, attrs))
+
+    def handle_endtag(self, tag):
+        self.events.append(("end", tag))
+
+    def handle_data(self, data):
+        if data.strip():
+            self.events.append(("data", " ".join(data.split())))
+
+
+def _dom_events(html: str):
+    parser = _DomEvents()
+    parser.feed(html)
+    parser.close()
+
+    return parser.events
+
+
+@pytest.mark.parametrize("source_notes_multiline", [True, False])
+def test_gt_render_minify_dom_equivalent(source_notes_multiline: bool):
+    gt = _set_table_id(
+        GT(pd.DataFrame({"x": [1.5, 2.5], "y": ["a b", "c"], "z": [1, 2]}), rowname_col="z")
+        .tab_header("Title", "Subtitle")
+        .tab_spanner("Spanner", columns=["x", "y"])
+        .tab_style(style.fill(color="red"), loc.body(columns="x", rows=[0]))
+        .tab_source_note("Note 1")
+        .tab_source_note("Note 2")
+        .tab_options(source_notes_multiline=source_notes_multiline),
+        "abc",
+    )
+
+    pretty = gt.render(context="html")
+    minified = gt.render(context="html", minify=True)
+
+    assert "\n" not in minified
+    assert len(minified) < len(pretty)
+    assert _dom_events(minified) == _dom_events(pretty)
+
+    # the option gives the same output, and applies to streamed output
+    assert gt.tab_options(table_minify_html=True).render(context="html") == minified
+    assert "".join(gt.render_iter(context="html", batch_size=1, minify=True)) == minified
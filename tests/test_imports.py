@@ -0,0 +1,48 @@
+import pytest
+
+# The most time that `from great_tables import GT` may take (in seconds), as reported by
+# `python -X importtime` (the best of a few runs)
+IMPORT_TIME_TARGET = 0.75
+
+# Dependencies that are only imported when they're first used (e.g., when formatting dates or
+# coloring cells), rather than when great_tables is imported
+LAZY_DEPENDENCIES = [
+    "babel",
+    "commonmark",
+    "importlib_metadata",
+    "mizani",
+    "numpy",
+    "pandas",
+    "pkg_resources",
+    "webcolors",
+]
+
+
+def test_import_does_not_import_lazy_dependencies(run_python):
+    res = run_python(
+        "import sys; from great_tables import GT; "
+        f"print([name for name in {LAZY_DEPENDENCIES!r} if name in sys.modules])"
+    )
+
+    assert res.stdout.strip() == "[]"
+
+
+@pytest.mark.timing
+def test_import_time_target(import_times):
+    import_time = min(
+        import_times("from great_tables import GT")["great_tables"][1] for _ in range(3)
+    )
+
+    assert import_time < IMPORT_TIME_TARGET
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import great_tables; great_tables.__version__",
+        "from great_tables import exibble, GT; GT(exibble).fmt_date('date').render('html')",
+        "from great_tables import exibble, GT; GT(exibble).data_color('num').render('html')",
+    ],
+)
+def test_import_lazy_dependencies_on_use(code: str, run_python):
+    run_python(code)
@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+
+import great_tables._formats
+import great_tables._locale
+from great_tables import GT
+from great_tables._locale import CurrencyRegistry, CurrencyInfo, LocaleRegistry, LocaleInfo
+
+
+def test_locale_registry_get():
+    registry = LocaleRegistry()
+
+    assert registry._locales is None
+
+    info = registry.get("de")
+
+    assert isinstance(info, LocaleInfo)
+    assert (info.locale, info.decimal, info.group, info.currency_code) == ("de", ",", ".", "EUR")
+
+    # Default locales and underscores resolve to the base locale
+    assert registry.get("en_US") is registry.get("en")
+    assert registry.normalize("en_US") == "en"
+
+
+def test_locale_registry_is_valid():
+    registry = LocaleRegistry()
+
+    assert registry.is_valid("fr-CA")
+    assert registry.is_valid("en_US")
+    assert not registry.is_valid("xx")
+
+
+def test_locale_registry_get_raises():
+    with pytest.raises(ValueError) as exc_info:
+        LocaleRegistry().get("xx")
+
+    assert "The supplied `locale` is not available" in exc_info.value.args[0]
+
+
+def test_currency_registry_get():
+    registry = CurrencyRegistry()
+    info = registry.get("EUR")
+
+    assert isinstance(info, CurrencyInfo)
+    assert (info.curr_code, info.exponent, info.symbol) == ("EUR", 2, "&#8364;")
+    assert registry.get("XAU").exponent is None
+
+    assert registry.is_valid("JPY")
+    assert not registry.is_valid("XYZ")
+
+    with pytest.raises(TypeError):
+        registry.currencies["XYZ"] = info
+
+
+def test_currency_registry_loads_data_once(monkeypatch):
+    n_reads = 0
+    get_currencies_data = great_tables._locale._get_currencies_data
+
+    def counting_get_currencies_data():
+        nonlocal n_reads
+        n_reads += 1
+        return get_currencies_data()
+
+    monkeypatch.setattr(great_tables._locale, "_get_currencies_data", counting_get_currencies_data)
+    monkeypatch.setattr(great_tables._formats, "_currency_registry", CurrencyRegistry())
+
+    df = pd.DataFrame({"x": [1.0, 2.5, -3.0]})
+    GT(df).fmt_currency("x", currency="EUR").fmt_currency("x", currency="JPY")._build_data("html")
+
+    assert n_reads == 1
@@ -0,0 +1,46 @@
+from great_tables._resources import (
+    _as_records,
+    _build_resource_bundle,
+    _get_resource_bundle,
+    _open_resource,
+)
+
+
+def test_resource_bundle_is_up_to_date():
+    # If this fails, the bundle needs to be regenerated with `make resources`
+    assert _get_resource_bundle() == _build_resource_bundle()
+
+
+def test_resource_bundle_contents():
+    bundle = _get_resource_bundle()
+
+    locales = {row["locale"]: row for row in _as_records(bundle["locales"])}
+    assert locales["de"]["decimal"] == ","
+
+    currencies = {row["curr_code"]: row for row in _as_records(bundle["currencies"])}
+    assert currencies["XAU"]["exponent"] is None
+
+    assert ".gt_table {" in bundle["text_files"]["css/gt_styles_default.scss"]
+
+
+def test_as_records():
+    table = {"a": ["x", None], "b": ["1", "2"]}
+
+    assert _as_records(table) == [{"a": "x", "b": "1"}, {"a": None, "b": "2"}]
+    assert _as_records({"a": [], "b": []}) == []
+
+
+def test_open_resource():
+    with _open_resource("great_tables.data", "06-exibble.csv") as f:
+        assert f.readline().startswith(b"num,char")
+
+
+def test_resources_loaded_without_csv_parsing(run_python):
+    code = (
+        "import sys, polars as pl; from great_tables import GT; "
+        "GT(pl.DataFrame({'x': [1.5]})).fmt_number('x', locale='de').render('html'); "
+        "print([name for name in ['pandas', 'pkg_resources'] if name in sys.modules])"
+    )
+    res = run_python(code)
+
+    assert res.stdout.strip() == "[]"
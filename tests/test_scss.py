@@ -2,7 +2,14 @@ import pytest
 import pandas as pd
 
 from great_tables import GT
-from great_tables._scss import font_color, css_add, compile_scss
+from great_tables._scss import (
+    font_color,
+    css_add,
+    compile_scss,
+    clear_scss_cache,
+    get_shared_css_class,
+    _compile_scss,
+)
 
 
 @pytest.mark.parametrize(
@@ -36,3 +43,44 @@ def test_scss_default_generated(snapshot):
     gt = GT(pd.DataFrame({"x": [1, 2, 3]}))
 
     assert snapshot == compile_scss(gt, id="abc", compress=False)
+
+
+def test_compile_scss_cached():
+    clear_scss_cache()
+
+    gt = GT(pd.DataFrame({"x": [1, 2, 3]}))
+
+    css_1 = compile_scss(gt, id="abc")
+    css_2 = compile_scss(gt, id="abc")
+
+    assert css_1 is css_2
+    assert _compile_scss.cache_info().hits == 1
+
+    # changing an SCSS option or the id produces a different stylesheet
+    assert compile_scss(gt.tab_options(table_font_size="20px"), id="abc") != css_1
+    assert compile_scss(gt, id="xyz") != css_1
+
+    clear_scss_cache()
+
+    assert _compile_scss.cache_info().currsize == 0
+    assert compile_scss(gt, id="abc") == css_1
+
+
+def test_get_shared_css_class():
+    gt = GT(pd.DataFrame({"x": [1, 2, 3]}))
+
+    css_class = get_shared_css_class(gt)
+
+    assert css_class.startswith("gt_css_")
+
+    # the class only depends on the styling options, not on the data
+    assert get_shared_css_class(GT(pd.DataFrame({"y": ["a"]}))) == css_class
+    assert get_shared_css_class(gt.tab_options(table_font_size="20px")) != css_class
+
+
+def test_compile_scss_shared():
+    gt = GT(pd.DataFrame({"x": [1, 2, 3]}))
+
+    css = compile_scss(gt, id=None, shared=True)
+
+    assert f".{get_shared_css_class(gt)} .gt_table" in css
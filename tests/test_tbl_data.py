@@ -4,14 +4,19 @@ import polars.testing
 import pytest
 
 from great_tables._tbl_data import (
+    _factorize_column,
     _get_cell,
+    _get_column_na_mask,
+    _get_column_values,
     _get_column_dtype,
     _set_cell,
+    _set_column_values,
     get_column_names,
     DataFrameLike,
     reorder,
     eval_select,
     create_empty_frame,
+    hash_frame,
     validate_frame,
 )
 
@@ -52,6 +57,48 @@ def test_set_cell(df: DataFrameLike):
     assert_frame_equal(df, expected)
 
 
+def test_set_column_values(df: DataFrameLike):
+    expected = df.__class__({"col1": [1, 2, 3], "col2": ["x", "y", "z"], "col3": [4.0, 5.0, 6.0]})
+    _set_column_values(df, "col2", ["x", "y", "z"])
+    assert_frame_equal(df, expected)
+
+
+def test_set_column_values_rows(df: DataFrameLike):
+    expected = df.__class__({"col1": [1, 2, 3], "col2": ["z", "b", "x"], "col3": [4.0, 5.0, 6.0]})
+    _set_column_values(df, "col2", ["x", "z"], rows=[2, 0])
+    assert_frame_equal(df, expected)
+
+
+def test_factorize_column(df: DataFrameLike):
+    df = df.__class__({"x": ["b", "a", None, "b"], "y": [1.5, 0.0, -0.0, 1.5]})
+
+    assert list(_factorize_column(df, "x")) in ([0, 1, -1, 0], [1, 0, -1, 1])
+
+    # -0.0 equals 0.0 but could be formatted differently
+    assert _factorize_column(df, "y") is None
+
+
+def test_factorize_column_pandas_mixed_types():
+    df = pd.DataFrame({"x": [1, True, "a"], "y": [1, 2, 1]})
+
+    assert _factorize_column(df, "x") is None
+    assert list(_factorize_column(df, "y")) == [0, 1, 0]
+
+
+def test_get_column_na_mask(df: DataFrameLike):
+    df = df.__class__({"x": ["a", None, "b"], "y": [1.5, None, 2.5]})
+
+    assert _get_column_na_mask(df, "x").tolist() == [False, True, False]
+    assert _get_column_na_mask(df, "y").tolist() == [False, True, False]
+
+
+def test_get_column_na_mask_polars_nan():
+    # NaN is not a missing value in polars
+    df = pl.DataFrame({"x": [1.5, float("nan"), None]})
+
+    assert _get_column_na_mask(df, "x").tolist() == [False, False, True]
+
+
 def test_reorder(df: DataFrameLike):
     res = reorder(df, [0, 2], ["col2"])
     dst = df.__class__({"col2": ["a", "c"]})
@@ -116,3 +163,21 @@ def test_validate_frame_non_str_cols_result():
         res = validate_frame(df)
 
     assert list(res.columns) == ["x", "55", "y", "99"]
+
+
+def test_get_column_values(df: DataFrameLike):
+    assert _get_column_values(df, "col2") == ["a", "b", "c"]
+    assert _get_column_values(df, "col2", 1, 3) == ["b", "c"]
+    assert _get_column_values(df, "col1", 0, 1) == [1]
+
+
+def test_hash_frame(df: DataFrameLike):
+    res = hash_frame(df)
+
+    assert res == hash_frame(df.__class__(df))
+    assert res != hash_frame(df[["col1", "col3"]])
+    assert res != hash_frame(df[:2])
+
+    _set_cell(df, 1, "col2", "x")
+
+    assert res != hash_frame(df)
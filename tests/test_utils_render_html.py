@@ -1,5 +1,12 @@
 from great_tables import GT, exibble, md, html, style, loc
-from great_tables._utils_render_html import create_source_notes_component_h, create_body_component_h
+from great_tables._utils_render_html import (
+    create_source_notes_component_h,
+    create_body_component_h,
+    create_style_classes_css,
+    get_body_style_classes,
+    iter_body_rows_h,
+    _get_body_styles_index,
+)
 
 small_exibble = exibble[["num", "char"]].head(3)
 
@@ -139,3 +146,58 @@ def test_styling_data_10(snapshot):
     )
 
     assert_rendered_body(snapshot, new_gt)
+
+
+def test_body_pandas_polars_equal():
+    import polars as pl
+
+    pd_gt = GT(small_exibble, rowname_col="char").fmt_number(columns="num")
+    pl_gt = GT(pl.from_pandas(small_exibble), rowname_col="char").fmt_number(columns="num")
+
+    pd_body = create_body_component_h(pd_gt._build_data("html"))
+    pl_body = create_body_component_h(pl_gt._build_data("html"))
+
+    assert pd_body == pl_body
+
+
+def test_body_styles_index():
+    new_gt = (
+        GT(small_exibble)
+        .tab_style(style=style.fill(color="red"), locations=loc.body(columns="num", rows=[0]))
+        .tab_style(style=style.text(color="blue"), locations=loc.body(columns="num", rows=[0]))
+        .tab_style(style=style.fill(color="green"), locations=loc.body(columns="char", rows=[1]))
+    )
+
+    styles_index = _get_body_styles_index(new_gt._styles)
+
+    assert styles_index == {
+        (0, "num"): "background-color: red; color: blue;",
+        (1, "char"): "background-color: green;",
+    }
+
+
+def test_body_style_classes():
+    new_gt = (
+        GT(small_exibble)
+        .tab_style(style=style.fill(color="red"), locations=loc.body(columns="num", rows=[0, 2]))
+        .tab_style(style=style.fill(color="green"), locations=loc.body(columns="char", rows=[1]))
+    )
+
+    style_classes = get_body_style_classes(new_gt._styles)
+
+    assert style_classes == {
+        "background-color: red;": "gt_s0",
+        "background-color: green;": "gt_s1",
+    }
+
+    assert create_style_classes_css(style_classes, id="abc") == (
+        " #abc .gt_row.gt_s0 { background-color: red; }\n"
+        " #abc .gt_row.gt_s1 { background-color: green; }"
+    )
+
+    rows = list(iter_body_rows_h(new_gt._build_data("html"), style_classes=style_classes))
+
+    assert '<td class="gt_row gt_right gt_s0">' in rows[0]
+    assert '<td class="gt_row gt_left gt_s1">' in rows[1]
+    assert '<td class="gt_row gt_right gt_s0">' in rows[2]
+    assert "style=" not in "".join(rows)